@@ -0,0 +1,129 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 04:11:06.728640
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_steps',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('step_name', sa.String(), nullable=False),
+    sa.Column('display_name', sa.String(), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('estimated_duration_seconds', sa.Integer(), nullable=True),
+    sa.Column('is_required', sa.Boolean(), nullable=True),
+    sa.Column('order_index', sa.Integer(), nullable=False),
+    sa.Column('retry_allowed', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('step_name')
+    )
+    op.create_table('jobs',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('video_id', sa.String(), nullable=False),
+    sa.Column('video_url', sa.String(), nullable=False),
+    sa.Column('video_title', sa.String(), nullable=True),
+    sa.Column('video_duration', sa.Integer(), nullable=True),
+    sa.Column('video_thumbnail', sa.String(), nullable=True),
+    sa.Column('language_code', sa.String(), nullable=False),
+    sa.Column('language_name', sa.String(), nullable=True),
+    sa.Column('llm_provider', sa.String(), nullable=False),
+    sa.Column('llm_model', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('error_code', sa.String(), nullable=True),
+    sa.Column('retry_count', sa.Integer(), nullable=True),
+    sa.Column('max_retries', sa.Integer(), nullable=True),
+    sa.Column('job_metadata', sa.JSON(), nullable=True),
+    sa.Column('transcript_file_path', sa.String(), nullable=True),
+    sa.Column('output_file_path', sa.String(), nullable=True),
+    sa.Column('processing_time_seconds', sa.Integer(), nullable=True),
+    sa.Column('transcript_length', sa.Integer(), nullable=True),
+    sa.Column('output_length', sa.Integer(), nullable=True),
+    sa.Column('tokens_used', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('provider_status',
+    sa.Column('provider_name', sa.String(), nullable=False),
+    sa.Column('is_available', sa.Boolean(), nullable=True),
+    sa.Column('last_check', sa.DateTime(), nullable=True),
+    sa.Column('response_time_ms', sa.Integer(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('quota_remaining', sa.Integer(), nullable=True),
+    sa.Column('quota_reset_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('provider_name')
+    )
+    op.create_table('system_config',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('value', sa.String(), nullable=False),
+    sa.Column('value_type', sa.String(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('is_secret', sa.Boolean(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('key')
+    )
+    op.create_table('audit_log',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.String(), nullable=True),
+    sa.Column('action', sa.String(), nullable=False),
+    sa.Column('details', sa.JSON(), nullable=True),
+    sa.Column('client_ip', sa.String(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('job_progress',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('job_id', sa.String(), nullable=False),
+    sa.Column('step', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('progress_percentage', sa.Integer(), nullable=True),
+    sa.Column('details', sa.JSON(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_details', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('websocket_connections',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('job_id', sa.String(), nullable=True),
+    sa.Column('client_ip', sa.String(), nullable=True),
+    sa.Column('user_agent', sa.String(), nullable=True),
+    sa.Column('connected_at', sa.DateTime(), nullable=True),
+    sa.Column('last_ping', sa.DateTime(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('websocket_connections')
+    op.drop_table('job_progress')
+    op.drop_table('audit_log')
+    op.drop_table('system_config')
+    op.drop_table('provider_status')
+    op.drop_table('jobs')
+    op.drop_table('job_steps')
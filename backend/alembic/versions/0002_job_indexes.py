@@ -0,0 +1,38 @@
+"""Job indexes
+
+Composite indexes behind the status, provider and history queries.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 04:11:13.406269
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_online('ix_jobs_status_priority_created_at', 'jobs',
+                        ['status', 'priority', 'created_at'])
+    create_index_online('ix_jobs_llm_provider_created_at', 'jobs',
+                        ['llm_provider', 'created_at'])
+    create_index_online('ix_jobs_video_id', 'jobs', ['video_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_online('ix_jobs_video_id', 'jobs')
+    drop_index_online('ix_jobs_llm_provider_created_at', 'jobs')
+    drop_index_online('ix_jobs_status_priority_created_at', 'jobs')
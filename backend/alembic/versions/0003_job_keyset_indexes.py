@@ -0,0 +1,42 @@
+"""Job keyset indexes
+
+Indexes ending in (created_at, id) for cursor-paginated job history. The
+provider index gains the id tie-breaker.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 04:13:08.403626
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_online('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'])
+    create_index_online('ix_jobs_status_created_at_id', 'jobs',
+                        ['status', 'created_at', 'id'])
+    create_index_online('ix_jobs_llm_provider_created_at_id', 'jobs',
+                        ['llm_provider', 'created_at', 'id'])
+    drop_index_online('ix_jobs_llm_provider_created_at', 'jobs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    create_index_online('ix_jobs_llm_provider_created_at', 'jobs',
+                        ['llm_provider', 'created_at'])
+    drop_index_online('ix_jobs_llm_provider_created_at_id', 'jobs')
+    drop_index_online('ix_jobs_status_created_at_id', 'jobs')
+    drop_index_online('ix_jobs_created_at_id', 'jobs')
@@ -0,0 +1,34 @@
+"""Job progress timeline index
+
+Index on job_progress (job_id, started_at) so a job's step timeline is one
+index range scan, already in order.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 05:02:41.118264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migrations import create_index_online, drop_index_online
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_online('ix_job_progress_job_id_started_at', 'job_progress',
+                        ['job_id', 'started_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_online('ix_job_progress_job_id_started_at', 'job_progress')
@@ -0,0 +1,50 @@
+"""Job stats rollups
+
+Per-day, per-provider job counters and processing time histogram, kept
+current as jobs are created and finish. Existing history can be loaded with
+StatsService.rebuild().
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 05:41:17.502913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_daily_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('llm_provider', sa.String(), nullable=False),
+    sa.Column('created_count', sa.Integer(), nullable=False),
+    sa.Column('completed_count', sa.Integer(), nullable=False),
+    sa.Column('failed_count', sa.Integer(), nullable=False),
+    sa.Column('cancelled_count', sa.Integer(), nullable=False),
+    sa.Column('timed_count', sa.Integer(), nullable=False),
+    sa.Column('processing_seconds_total', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'llm_provider')
+    )
+    op.create_table('job_duration_histogram',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('llm_provider', sa.String(), nullable=False),
+    sa.Column('bucket_seconds', sa.Integer(), nullable=False),
+    sa.Column('job_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'llm_provider', 'bucket_seconds')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_duration_histogram')
+    op.drop_table('job_daily_stats')
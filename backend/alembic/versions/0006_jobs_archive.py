@@ -0,0 +1,71 @@
+"""Jobs archive table
+
+Terminal jobs past the retention period are moved here from jobs, keeping
+the hot table small. Same columns as jobs plus archived_at, with the keyset
+history indexes.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 06:12:53.774102
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('jobs_archive',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('video_id', sa.String(), nullable=False),
+    sa.Column('video_url', sa.String(), nullable=False),
+    sa.Column('video_title', sa.String(), nullable=True),
+    sa.Column('video_duration', sa.Integer(), nullable=True),
+    sa.Column('video_thumbnail', sa.String(), nullable=True),
+    sa.Column('language_code', sa.String(), nullable=False),
+    sa.Column('language_name', sa.String(), nullable=True),
+    sa.Column('llm_provider', sa.String(), nullable=False),
+    sa.Column('llm_model', sa.String(), nullable=True),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('error_code', sa.String(), nullable=True),
+    sa.Column('retry_count', sa.Integer(), nullable=True),
+    sa.Column('max_retries', sa.Integer(), nullable=True),
+    sa.Column('job_metadata', sa.JSON(), nullable=True),
+    sa.Column('transcript_file_path', sa.String(), nullable=True),
+    sa.Column('output_file_path', sa.String(), nullable=True),
+    sa.Column('processing_time_seconds', sa.Integer(), nullable=True),
+    sa.Column('transcript_length', sa.Integer(), nullable=True),
+    sa.Column('output_length', sa.Integer(), nullable=True),
+    sa.Column('tokens_used', sa.Integer(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_archive_created_at_id', 'jobs_archive',
+                    ['created_at', 'id'], unique=False)
+    op.create_index('ix_jobs_archive_status_created_at_id', 'jobs_archive',
+                    ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_jobs_archive_llm_provider_created_at_id', 'jobs_archive',
+                    ['llm_provider', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_archive_llm_provider_created_at_id', table_name='jobs_archive')
+    op.drop_index('ix_jobs_archive_status_created_at_id', table_name='jobs_archive')
+    op.drop_index('ix_jobs_archive_created_at_id', table_name='jobs_archive')
+    op.drop_table('jobs_archive')
@@ -0,0 +1,158 @@
+"""Backfill job stats rollups
+
+Fills job_daily_stats and job_duration_histogram from the job history that
+existed before the rollups were maintained, 30 days per batch.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 06:58:04.215530
+
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.database.migrations import run_in_batches
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_DAYS = 30
+
+# The schema and rules as of this revision, so later model changes do not
+# change what this migration does
+DURATION_BUCKETS = [1, 2, 5, 10, 15, 30, 45, 60, 90, 120, 180, 300, 600, 900, 1800, 3600, 86400]
+FINISHED_COUNTERS = {
+    "completed": "completed_count",
+    "failed": "failed_count",
+    "cancelled": "cancelled_count",
+}
+COUNTERS = ["created_count", *FINISHED_COUNTERS.values(), "timed_count", "processing_seconds_total"]
+
+
+def job_history_table(name: str) -> sa.TableClause:
+    """The columns of jobs (or jobs_archive) the backfill reads"""
+    return sa.table(
+        name,
+        sa.column("llm_provider", sa.String),
+        sa.column("status", sa.String),
+        sa.column("created_at", sa.DateTime),
+        sa.column("completed_at", sa.DateTime),
+        sa.column("updated_at", sa.DateTime),
+        sa.column("processing_time_seconds", sa.Integer),
+    )
+
+
+jobs_table = job_history_table("jobs")
+jobs_archive_table = job_history_table("jobs_archive")
+job_daily_stats = sa.table(
+    "job_daily_stats",
+    sa.column("day", sa.Date),
+    sa.column("llm_provider", sa.String),
+    *(sa.column(name, sa.Integer) for name in COUNTERS),
+)
+job_duration_histogram = sa.table(
+    "job_duration_histogram",
+    sa.column("day", sa.Date),
+    sa.column("llm_provider", sa.String),
+    sa.column("bucket_seconds", sa.Integer),
+    sa.column("job_count", sa.Integer),
+)
+
+
+def backfill_statements(start: date, end: date) -> List[sa.sql.Executable]:
+    """Statements replacing the rollups for days in [start, end) from job history
+
+    Each job counts as created on its creation day and as finished on its
+    completion day.
+    """
+    start_at = datetime.combine(start, datetime.min.time())
+    end_at = datetime.combine(end, datetime.min.time())
+
+    jobs = sa.union_all(*(
+        sa.select(*table.c) for table in (jobs_table, jobs_archive_table)
+    )).subquery("job_history")
+
+    finished_at = sa.func.coalesce(jobs.c.completed_at, jobs.c.updated_at)
+    timed = sa.and_(jobs.c.status == "completed", jobs.c.processing_time_seconds.is_not(None))
+    zero = sa.literal_column("0")
+
+    created = (
+        sa.select(sa.func.date(jobs.c.created_at).label("day"), jobs.c.llm_provider,
+                  sa.literal_column("1").label("created_count"),
+                  *(zero.label(counter) for counter in FINISHED_COUNTERS.values()),
+                  zero.label("timed_count"), zero.label("processing_seconds_total"))
+        .where(jobs.c.created_at >= start_at, jobs.c.created_at < end_at)
+    )
+    finished = (
+        sa.select(sa.func.date(finished_at), jobs.c.llm_provider, zero,
+                  *(sa.case((jobs.c.status == status, 1), else_=0) for status in FINISHED_COUNTERS),
+                  sa.case((timed, 1), else_=0),
+                  sa.case((timed, jobs.c.processing_time_seconds), else_=0))
+        .where(jobs.c.status.in_(list(FINISHED_COUNTERS)),
+               finished_at >= start_at, finished_at < end_at)
+    )
+    events = sa.union_all(created, finished).subquery("events")
+    daily = (
+        sa.select(events.c.day, events.c.llm_provider,
+                  *(sa.func.sum(events.c[name]) for name in COUNTERS))
+        .group_by(events.c.day, events.c.llm_provider)
+    )
+
+    bucket = sa.case(
+        *((jobs.c.processing_time_seconds <= bound, bound) for bound in DURATION_BUCKETS),
+        else_=DURATION_BUCKETS[-1]
+    )
+    histogram = (
+        sa.select(sa.func.date(jobs.c.completed_at), jobs.c.llm_provider, bucket, sa.func.count())
+        .where(timed, jobs.c.completed_at >= start_at, jobs.c.completed_at < end_at)
+        .group_by(sa.func.date(jobs.c.completed_at), jobs.c.llm_provider, bucket)
+    )
+
+    return [
+        job_daily_stats.delete().where(job_daily_stats.c.day >= start,
+                                       job_daily_stats.c.day < end),
+        job_duration_histogram.delete().where(job_duration_histogram.c.day >= start,
+                                              job_duration_histogram.c.day < end),
+        job_daily_stats.insert().from_select(["day", "llm_provider", *COUNTERS], daily),
+        job_duration_histogram.insert().from_select(
+            ["day", "llm_provider", "bucket_seconds", "job_count"], histogram
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    first = bind.execute(sa.text(
+        "SELECT MIN(created_at) FROM (SELECT created_at FROM jobs "
+        "UNION ALL SELECT created_at FROM jobs_archive) AS job_history"
+    )).scalar()
+    if first is None:
+        return
+
+    start = date.fromisoformat(str(first)[:10])
+    end = date.today() + timedelta(days=1)
+    windows = [
+        (day, min(day + timedelta(days=BATCH_DAYS), end))
+        for day in (start + timedelta(days=offset)
+                    for offset in range(0, (end - start).days, BATCH_DAYS))
+    ]
+
+    def apply(window):
+        for statement in backfill_statements(*window):
+            op.get_bind().execute(statement)
+
+    run_in_batches(windows, apply)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The rollups stay valid; 0005's downgrade drops them
+    pass
@@ -2,6 +2,7 @@
 
 import uvicorn
 from src.web.app import create_app
+from src.web.config import get_settings
 
 app = create_app()
 
@@ -11,5 +12,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=get_settings().websocket_per_message_deflate
     )
\ No newline at end of file
@@ -18,6 +18,7 @@ os.environ.setdefault("PYTHONPATH", f"{backend_dir}:{src_dir}:{project_root}")
 
 if __name__ == "__main__":
     import uvicorn
+    from src.web.config import get_settings
     
     # Run the development server
     uvicorn.run(
@@ -26,5 +27,6 @@ if __name__ == "__main__":
         port=8000,
         reload=True,
         reload_dirs=[str(src_dir)],
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=get_settings().websocket_per_message_deflate
     )
\ No newline at end of file
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+WebSocket broadcast benchmark for BlogTubeAI Backend
+
+Broadcasts progress messages from one job to many in-process subscribers
+and compares encoding per subscriber with encoding once per broadcast, and
+JSON frames with MessagePack frames.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+
+class NullWebSocket:
+    """Accepts frames and discards them"""
+
+    client = ("127.0.0.1", 0)
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        pass
+
+    async def send_bytes(self, data):
+        pass
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="WebSocket broadcast benchmark")
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=200)
+    return parser.parse_args()
+
+
+MESSAGE = {
+        "type": "job_update",
+        "job_id": "job",
+        "data": {"status": "generating_blog", "message": "Generating blog content...",
+                 "details": {"tokens": list(range(20))}},
+        "timestamp": "2024-01-01T00:00:00",
+    }
+
+
+async def run(manager_module, encoder, per_subscriber: bool, subscribers: int,
+              messages: int, encoding: str = "json") -> float:
+    """Return seconds spent broadcasting and draining `messages` progress updates"""
+    manager_module.encode_message = encoder
+    manager = manager_module.WebSocketManager(queue_size=messages + 2)
+    for _ in range(subscribers):
+        await manager.connect(NullWebSocket(), "job", encoding=encoding)
+
+    message = MESSAGE
+    start = time.perf_counter()
+    for _ in range(messages):
+        if per_subscriber:
+            # Previous behaviour: every subscriber serializes the message itself
+            for connection_id in list(manager.topic_subscriptions["job:job"]):
+                manager.enqueue(connection_id, message)
+        else:
+            await manager.broadcast_to_job("job", message)
+    while any(queue.depth() for queue in manager.send_queues.values()):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    for connection_id in list(manager.active_connections):
+        await manager.disconnect(connection_id)
+    return elapsed
+
+
+def main():
+    """Run broadcast benchmark"""
+    args = parse_args()
+
+    backend_dir = Path(__file__).parent.parent
+    os.chdir(backend_dir)
+    if str(backend_dir) not in sys.path:
+        sys.path.insert(0, str(backend_dir))
+
+    from src.api.websocket import manager as manager_module
+
+    encode_message = manager_module.encode_message
+    encoders = {"json": lambda message, encoding="json": json.dumps(message, default=str)}
+    if manager_module.orjson is not None:
+        encoders["orjson"] = encode_message
+
+    print(f"📡 1 job × {args.subscribers} subscribers × {args.messages} messages")
+    print(f"{'encoder':>8} {'strategy':>16} {'seconds':>9} {'msgs/s':>12}")
+
+    for name, encoder in encoders.items():
+        for per_subscriber in (True, False):
+            elapsed = asyncio.run(run(
+                manager_module, encoder, per_subscriber, args.subscribers, args.messages
+            ))
+            strategy = "per-subscriber" if per_subscriber else "encode-once"
+            delivered = args.subscribers * args.messages
+            print(f"{name:>8} {strategy:>16} {elapsed:>9.3f} {delivered / elapsed:>12,.0f}")
+
+    sizes = {"json": len(encode_message(MESSAGE).encode('utf-8'))}
+    if manager_module.msgpack is not None:
+        elapsed = asyncio.run(run(
+            manager_module, encode_message, False, args.subscribers, args.messages, "msgpack"
+        ))
+        delivered = args.subscribers * args.messages
+        print(f"{'msgpack':>8} {'encode-once':>16} {elapsed:>9.3f} {delivered / elapsed:>12,.0f}")
+        sizes["msgpack"] = len(encode_message(MESSAGE, "msgpack"))
+
+    print("frame bytes: " + ", ".join(f"{name} {size}" for name, size in sizes.items()))
+
+
+if __name__ == "__main__":
+    main()
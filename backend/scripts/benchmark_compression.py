@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Transcript compression benchmark for BlogTubeAI Backend
+
+Reports size and keyword recall at several target ratios for each fixture
+transcript, so compression settings can be tuned for quality vs. cost.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+DEFAULT_RATIOS = [1.0, 0.8, 0.6, 0.5, 0.4, 0.3]
+
+
+def main():
+    """Run compression benchmark over fixture transcripts"""
+
+    # Ensure we're in the backend directory
+    backend_dir = Path(__file__).parent.parent
+    os.chdir(backend_dir)
+
+    if str(backend_dir) not in sys.path:
+        sys.path.insert(0, str(backend_dir))
+
+    from src.core.transcript_compressor import compress_transcript, keyword_recall
+
+    fixtures = sys.argv[1:] or [
+        "tests/test_core/data/auto_captions_transcript.txt",
+        "tests/test_core/data/long_text_500word.md",
+    ]
+
+    print("📉 Transcript compression benchmark")
+
+    for fixture in fixtures:
+        with open(fixture, 'r', encoding='utf-8') as f:
+            # fetch_transcript joins caption segments with spaces
+            transcript = ' '.join(f.read().split())
+
+        print(f"\n{fixture}")
+        print(f"{'target':>8} {'tokens':>8} {'actual':>8} {'recall':>8} {'ms':>8}")
+
+        for ratio in DEFAULT_RATIOS:
+            start = time.perf_counter()
+            result = compress_transcript(transcript, ratio)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            actual = result["compressed_tokens"] / max(result["original_tokens"], 1)
+            recall = keyword_recall(transcript, result["transcript"])
+            print(
+                f"{ratio:>8.2f} {result['compressed_tokens']:>8} "
+                f"{actual:>8.2f} {recall:>8.2f} {elapsed_ms:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
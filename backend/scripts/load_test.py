@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end load test for BlogTubeAI Backend
+
+Runs jobs through the full processing pipeline with the fake LLM provider
+and recorded YouTube responses, then reports throughput and latency.
+
+Usage:
+    python scripts/load_test.py --jobs 200 --concurrency 20 --synthesize
+    python scripts/load_test.py --cassettes cassettes --video-ids abc123def45 ...
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline pipeline load test")
+    parser.add_argument("--jobs", type=int, default=50, help="Number of jobs to run")
+    parser.add_argument("--concurrency", type=int, default=10, help="Jobs processed at once")
+    parser.add_argument("--cassettes", default=None, help="Cassette directory (default: temp dir)")
+    parser.add_argument("--synthesize", action="store_true",
+                        help="Write synthetic cassettes from the fixture transcript")
+    parser.add_argument("--video-ids", nargs="*", default=None,
+                        help="Recorded video IDs to cycle through")
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--latency-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--latency-distribution", default="lognormal")
+    parser.add_argument("--chunk-rate", type=float, default=0, help="Streaming chunks per second")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def synthesize_cassettes(cassette_dir: str, count: int, transcript: str) -> list:
+    """Record fake oEmbed, language and transcript responses for `count` videos"""
+    from src.core.replay import ReplayStore
+
+    store = ReplayStore(cassette_dir, mode="record")
+    video_ids = []
+    for index in range(count):
+        video_id = f"load{index:07d}"
+        store.save("oembed_info", {"video_id": video_id}, result={
+            "title": f"Load Test Video {index}",
+            "author_name": "Load Test",
+            "thumbnail_url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+        })
+        store.save("transcript_languages", {"video_id": video_id}, result=[{
+            "language_code": "en",
+            "language": "English",
+            "is_generated": True,
+            "is_translatable": True,
+        }])
+        store.save("transcript", {"video_id": video_id, "language_code": "en"},
+                   result=f"{transcript} (video {index})")
+        video_ids.append(video_id)
+    return video_ids
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_jobs(args, video_ids: list) -> tuple:
+    from src.core.background_tasks import BackgroundTaskProcessor
+    from src.core.job_manager import JobManager
+    from src.models.schemas import JobCreateRequest
+
+    job_manager = JobManager()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    failures = []
+
+    job_ids = []
+    for index in range(args.jobs):
+        video_id = video_ids[index % len(video_ids)]
+        job_ids.append(await job_manager.create_job(JobCreateRequest(
+            video_url=f"https://www.youtube.com/watch?v={video_id}",
+            language_code="en",
+            llm_provider="fake",
+        )))
+
+    async def run_one(job_id: str):
+        async with semaphore:
+            processor = BackgroundTaskProcessor(job_manager)
+            start = time.perf_counter()
+            try:
+                await processor.process_job(job_id)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                failures.append(str(e))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(job_id) for job_id in job_ids))
+    return time.perf_counter() - start, latencies, failures
+
+
+def main():
+    """Run the offline load test"""
+    args = parse_args()
+
+    backend_dir = Path(__file__).parent.parent.resolve()
+    if str(backend_dir) not in sys.path:
+        sys.path.insert(0, str(backend_dir))
+
+    work_dir = tempfile.mkdtemp(prefix="blogtube-load-")
+    cassette_dir = os.path.abspath(args.cassettes or os.path.join(work_dir, "cassettes"))
+
+    # Everything below reads configuration from the environment
+    os.environ.update({
+        "DATABASE_URL": f"sqlite+aiosqlite:///{work_dir}/load_test.db",
+        "GENERATION_CACHE_ENABLED": "false",
+        "YOUTUBE_REPLAY_MODE": "replay",
+        "YOUTUBE_REPLAY_DIR": cassette_dir,
+        "FAKE_LLM_LATENCY_MS": str(args.latency_ms),
+        "FAKE_LLM_LATENCY_JITTER_MS": str(args.latency_jitter_ms),
+        "FAKE_LLM_LATENCY_DISTRIBUTION": args.latency_distribution,
+        "FAKE_LLM_CHUNK_RATE": str(args.chunk_rate),
+        "FAKE_LLM_FAILURE_RATE": str(args.failure_rate),
+        "FAKE_LLM_SEED": str(args.seed),
+    })
+
+    video_ids = args.video_ids
+    if args.synthesize or not video_ids:
+        fixture = backend_dir / "tests/test_core/data/auto_captions_transcript.txt"
+        transcript = ' '.join(fixture.read_text(encoding='utf-8').split())
+        video_ids = synthesize_cassettes(cassette_dir, min(args.jobs, 100), transcript)
+
+    # File outputs land in the scratch directory
+    os.chdir(work_dir)
+
+    import src.services  # noqa: F401  (resolves import order for core modules)
+
+    print(f"🚀 Running {args.jobs} jobs, concurrency {args.concurrency}")
+    print(f"   Work directory: {work_dir}")
+
+    elapsed, latencies, failures = asyncio.run(run_jobs(args, video_ids))
+
+    print(f"\n✅ Completed: {len(latencies)}   ❌ Failed: {len(failures)}")
+    print(f"⏱️  Wall time: {elapsed:.2f}s   Throughput: {args.jobs / elapsed:.2f} jobs/s")
+    if latencies:
+        print(
+            f"📊 Latency p50 {percentile(latencies, 50):.3f}s  "
+            f"p95 {percentile(latencies, 95):.3f}s  "
+            f"p99 {percentile(latencies, 99):.3f}s  "
+            f"mean {statistics.mean(latencies):.3f}s"
+        )
+    for message in sorted({failure.splitlines()[0] for failure in failures})[:5]:
+        print(f"   {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """
 Database migration script for BlogTubeAI Backend
+
+Usage: python scripts/migrate.py [revision]   (default: head)
 """
 
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -14,39 +17,40 @@ def main():
     backend_dir = Path(__file__).parent.parent
     os.chdir(backend_dir)
     
-    # Add src to Python path
-    src_path = backend_dir / "src"
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
+    # Make the src package importable
+    if str(backend_dir) not in sys.path:
+        sys.path.insert(0, str(backend_dir))
     
     # Create data directory if it doesn't exist
     data_dir = backend_dir / "data"
     data_dir.mkdir(exist_ok=True)
     
-    print("🗄️  Setting up database...")
+    revision = sys.argv[1] if len(sys.argv) > 1 else "head"
+    print(f"🗄️  Migrating database to {revision}...")
     
     try:
-        # Import database setup
-        from src.database.connection import init_database
-        from src.database.base import Base
-        from sqlalchemy import create_engine
+        from src.database.connection import create_db_engine
+        from src.database.migrations import upgrade_database
+        from src.web.config import get_settings
         
-        # Create database engine
-        database_url = os.getenv("DATABASE_URL", "sqlite:///data/app.db")
-        engine = create_engine(database_url)
+        async def run():
+            engine = create_db_engine()
+            try:
+                await upgrade_database(engine, revision)
+            finally:
+                await engine.dispose()
         
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        asyncio.run(run())
         
-        print("✅ Database setup complete!")
-        print(f"📁 Database location: {data_dir / 'app.db'}")
+        print("✅ Database migrations complete!")
+        print(f"📁 Database: {get_settings().database_url}")
         
     except ImportError as e:
         print(f"❌ Failed to import database modules: {e}")
         print("💡 Make sure dependencies are installed: pip install -r requirements/dev.txt")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Database setup failed: {e}")
+        print(f"❌ Database migration failed: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
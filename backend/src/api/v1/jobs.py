@@ -1,11 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from ...database.connection import get_db
-from ...models.schemas import JobCreateRequest, JobResponse
+from ...models.schemas import JobCreateRequest, JobProgress, JobResponse, JobSummary
 from ...models.enums import JobStatus
-from ...services.job_service import JobService
+from ...services.job_service import JobService, list_columns
+from ..websocket.event_stream import TERMINAL_STATUSES, EventStream
+from ..websocket.manager import websocket_manager
 
 router = APIRouter()
 job_service = JobService()
@@ -32,19 +35,39 @@ async def get_job(job_id: str):
     return job
 
 
-@router.get("/", response_model=List[JobResponse])
+@router.get("/", response_model=List[JobSummary])
 async def list_jobs(
+    response: Response,
     status: Optional[JobStatus] = None,
     provider: Optional[str] = None,
-    limit: int = 100,
-    offset: int = 0
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    include_archived: bool = False,
+    fields: Optional[str] = None
 ):
-    """List jobs with optional filtering"""
+    """List jobs newest first with optional filtering
+    
+    When more jobs follow, the X-Next-Cursor header holds the value to pass
+    as ?cursor= for the next page; it stays fast at any depth, unlike offset.
+    ?include_archived=true also lists jobs moved out by the retention job.
+    Jobs are summaries; ?fields=error_message,job_metadata,... adds columns,
+    and GET /jobs/{job_id} has everything.
+    """
     try:
-        jobs = await job_service.get_jobs(status, provider, limit, offset)
-        return jobs
+        jobs, next_cursor = await job_service.get_jobs(
+            status, provider, limit, offset, cursor, include_archived=include_archived,
+            columns=list_columns(fields)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch jobs: {str(e)}")
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    # Plain dicts are validated once, against JobSummary, and keep extra fields
+    return [job._asdict() for job in jobs]
 
 
 @router.delete("/{job_id}")
@@ -63,3 +86,54 @@ async def get_job_result(job_id: str):
     if not result:
         raise HTTPException(status_code=404, detail="Job result not found")
     return {"content": result}
+
+
+@router.get("/{job_id}/progress", response_model=List[JobProgress])
+async def get_job_progress(job_id: str):
+    """Get a job's step timeline with per-step durations"""
+    timeline = await job_service.get_job_progress(job_id)
+    if not timeline and not await job_service.get_job(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    return timeline
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    since: Optional[int] = None,
+    last_event_id: Optional[str] = Header(None)
+):
+    """Stream job events as Server-Sent Events
+    
+    Reconnecting clients resume after the Last-Event-ID header (or ?since=)
+    from the same replay buffer WebSocket clients use.
+    """
+    job = await job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    
+    stream = EventStream(client=request.client)
+    connection_id = await websocket_manager.connect(stream, job_id, since=since)
+    
+    status = getattr(job.status, "value", job.status)
+    if status in TERMINAL_STATUSES:
+        # Nothing more will be published; end the stream after any replay
+        websocket_manager.enqueue(connection_id, {
+            "type": "job_update",
+            "job_id": job_id,
+            "data": {"status": status}
+        })
+    
+    return StreamingResponse(
+        stream.events(websocket_manager, connection_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx and similar proxies from buffering the stream
+            "X-Accel-Buffering": "no"
+        }
+    )
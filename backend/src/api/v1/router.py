@@ -4,6 +4,7 @@ from .videos import router as videos_router
 from .jobs import router as jobs_router
 from .providers import router as providers_router
 from .health import router as health_router
+from .stats import router as stats_router
 
 api_router = APIRouter()
 
@@ -12,3 +13,4 @@ api_router.include_router(health_router, prefix="/health", tags=["health"])
 api_router.include_router(videos_router, prefix="/videos", tags=["videos"])
 api_router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
 api_router.include_router(providers_router, prefix="/providers", tags=["providers"])
+api_router.include_router(stats_router, prefix="/stats", tags=["stats"])
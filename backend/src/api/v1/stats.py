@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Query
+
+from ...models.schemas import SystemStats
+from ...services.stats_service import StatsService
+from .jobs import job_service
+
+router = APIRouter()
+stats_service = StatsService()
+
+
+@router.get("/", response_model=SystemStats)
+async def get_system_stats(days: int = Query(1, ge=1, le=90)):
+    """Job counts, processing time percentiles and per-provider throughput
+    
+    Read from rollup tables, so the cost does not grow with job history.
+    """
+    return await stats_service.get_system_stats(
+        active_jobs=job_service.job_manager.get_active_job_count(), days=days
+    )
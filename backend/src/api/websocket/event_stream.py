@@ -0,0 +1,84 @@
+"""Server-Sent Events transport for job subscriptions"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+
+from ...models.enums import JobStatus
+from .manager import WebSocketManager
+
+TERMINAL_STATUSES = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+
+
+def is_terminal_event(message: dict) -> bool:
+    """Whether a job event is the last one the job will produce"""
+    if message.get("type") == "job_completed":
+        return True
+    return (message.get("type") == "job_update"
+            and (message.get("data") or {}).get("status") in TERMINAL_STATUSES)
+
+
+def format_event(frame: str, message: dict) -> str:
+    """Render an encoded message as an SSE event
+
+    Job events carry their sequence number as the event id, so a
+    reconnecting client's Last-Event-ID resumes from the replay buffer.
+    """
+    lines = []
+    if message.get("sequence") is not None and message.get("type") != "connected":
+        lines.append(f"id: {message['sequence']}")
+    lines.append(f"event: {message.get('type', 'message')}")
+    lines.append(f"data: {frame}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStream:
+    """Job subscription delivered as an SSE response body
+
+    Stands in for the WebSocket in WebSocketManager.connect(), so the stream
+    shares the manager's event bus subscription, send queue, heartbeat pings
+    and replay buffer. Frames the writer sends are turned into SSE events
+    and handed to the response one at a time; a slow HTTP client backs up
+    into the bounded send queue like a slow WebSocket would. The stream
+    ends after the job's terminal event.
+    """
+
+    def __init__(self, client=None, retry_ms: int = 3000):
+        self.client = client
+        self.retry_ms = retry_ms
+        self.closed = False
+        self._chunks: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, frame: str) -> None:
+        message = json.loads(frame)
+        await self._chunks.put(format_event(frame, message))
+        if is_terminal_event(message):
+            await self.close()
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None) -> None:
+        self.closed = True
+        try:
+            # Wake the response if it is waiting; if a chunk is still queued
+            # the response notices `closed` after sending it
+            self._chunks.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    async def events(self, manager: WebSocketManager, connection_id: str) -> AsyncIterator[str]:
+        """Response body: SSE events until the job ends or the client leaves"""
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+            while True:
+                chunk = await self._chunks.get()
+                if chunk is None:
+                    break
+                yield chunk
+                # SSE clients never send; a delivered event shows they are alive
+                manager.touch(connection_id)
+                if self.closed and self._chunks.empty():
+                    break
+        finally:
+            await manager.disconnect(connection_id)
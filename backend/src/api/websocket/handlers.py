@@ -1,9 +1,9 @@
 """WebSocket endpoint handlers"""
-import asyncio
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 from typing import Optional
 
 from .manager import websocket_manager
+from .system_stats import system_stats_broadcaster
 
 websocket_router = APIRouter()
 
@@ -14,7 +14,12 @@ def get_job_manager():
 
 @websocket_router.websocket("/jobs/{job_id}")
 async def websocket_job_updates(websocket: WebSocket, job_id: str):
-    """WebSocket endpoint for job status updates"""
+    """WebSocket endpoint for job status updates
+    
+    ?since=<sequence> resumes after a reconnect and ?encoding=msgpack switches
+    outgoing frames to binary MessagePack. Compression is negotiated by the
+    server as the permessage-deflate extension.
+    """
     
     job_manager = get_job_manager()
     job = await job_manager.get_job(job_id)
@@ -23,10 +28,17 @@ async def websocket_job_updates(websocket: WebSocket, job_id: str):
         await websocket.close(code=4004, reason="Job not found")
         return
     
+    # Resuming clients pass the last sequence number they processed
+    since = websocket.query_params.get("since")
+    since = int(since) if since and since.isdigit() else None
+    
     connection_id = None
     try:
         # Connect and register for updates
-        connection_id = await websocket_manager.connect(websocket, job_id)
+        connection_id = await websocket_manager.connect(
+            websocket, job_id, since=since,
+            encoding=websocket.query_params.get("encoding", "json")
+        )
         
         # Listen for messages
         while True:
@@ -46,28 +58,57 @@ async def websocket_job_updates(websocket: WebSocket, job_id: str):
             await websocket_manager.disconnect(connection_id)
 
 
+@websocket_router.websocket("/jobs")
+async def websocket_topic_updates(websocket: WebSocket):
+    """WebSocket endpoint following several jobs or topics at once
+    
+    Initial topics come from ?topics=jobs,job:<id>,status:<id>,...; more can
+    be added or removed with subscribe/unsubscribe messages. ?encoding=msgpack
+    switches outgoing frames to binary MessagePack.
+    """
+    topics = [topic for topic in websocket.query_params.get("topics", "").split(",") if topic]
+    
+    connection_id = None
+    try:
+        connection_id = await websocket_manager.connect(
+            websocket, None, topics=topics,
+            encoding=websocket.query_params.get("encoding", "json")
+        )
+        
+        while True:
+            try:
+                message = await websocket.receive_text()
+                await websocket_manager.handle_message(connection_id, message)
+            except WebSocketDisconnect:
+                break
+            
+    except Exception as e:
+        print(f"WebSocket error: {e}")
+        
+    finally:
+        if connection_id:
+            await websocket_manager.disconnect(connection_id)
+
+
 @websocket_router.websocket("/system")
 async def websocket_system_updates(websocket: WebSocket):
     """WebSocket endpoint for system-wide updates"""
-    await websocket.accept()
-    job_manager = get_job_manager()
-    
+    connection_id = None
     try:
-        # Send system stats periodically
+        # Stats are computed once per interval and shared by all subscribers
+        connection_id = await system_stats_broadcaster.subscribe(websocket)
+        
+        # Keep reading so pongs count as activity and disconnects are noticed
         while True:
-            stats = {
-                "type": "system_stats",
-                "data": {
-                    "active_jobs": job_manager.get_active_job_count(),
-                    "can_accept_jobs": job_manager.can_accept_new_job(),
-                    "websocket_stats": websocket_manager.get_connection_stats()
-                }
-            }
-            
-            await websocket.send_json(stats)
-            await asyncio.sleep(30)  # Update every 30 seconds
+            try:
+                message = await websocket.receive_text()
+                await websocket_manager.handle_message(connection_id, message)
+            except WebSocketDisconnect:
+                break
             
-    except WebSocketDisconnect:
-        pass
     except Exception as e:
         print(f"System WebSocket error: {e}")
+        
+    finally:
+        if connection_id:
+            await websocket_manager.disconnect(connection_id)
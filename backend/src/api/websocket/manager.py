@@ -2,41 +2,356 @@
 
 import asyncio
 import json
-from typing import Dict, Set, Optional, Any
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Iterable, List, Set, Optional, Any, Tuple, Union
 from datetime import datetime
 import uuid
 
 from fastapi import WebSocket
 
+from ...web.config import get_settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Encoded message: text for JSON, bytes for MessagePack
+Frame = Union[str, bytes]
+
+# Message types where only the latest queued message per job matters
+COALESCABLE_TYPES = {"progress_update", "system_stats"}
+
+OVERFLOW_POLICIES = ("drop_oldest", "disconnect")
+
+# Subscription topics:
+#   job:<id>     every event of one job
+#   status:<id>  one job's status changes, without progress updates
+#   jobs         every event of every job
+#   status       status changes of every job
+ALL_JOBS_TOPIC = "jobs"
+ALL_STATUS_TOPIC = "status"
+PROGRESS_TYPES = {"progress_update"}
+
+
+def encode_message(message: Dict[str, Any], encoding: str = "json") -> Frame:
+    """Serialize a message to a text frame, with orjson when available,
+    or to a binary MessagePack frame"""
+    if encoding == "msgpack":
+        return msgpack.packb(message, default=str, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(message, default=str).decode('utf-8')
+    return json.dumps(message, default=str)
+
+
+def negotiate_encoding(requested: Optional[str]) -> str:
+    """Encoding to use for a client's requested one, falling back to JSON"""
+    if requested == "msgpack" and msgpack is not None:
+        return "msgpack"
+    return "json"
+
+
+def job_topic(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def is_valid_topic(topic: str) -> bool:
+    if topic in (ALL_JOBS_TOPIC, ALL_STATUS_TOPIC):
+        return True
+    prefix, _, job_id = topic.partition(":")
+    return prefix in ("job", "status") and bool(job_id)
+
+
+def event_topics(job_id: str, message: Dict[str, Any]) -> List[str]:
+    """Topics whose subscribers should receive a job event"""
+    topics = [job_topic(job_id), ALL_JOBS_TOPIC]
+    if message.get("type") not in PROGRESS_TYPES:
+        topics += [f"status:{job_id}", ALL_STATUS_TOPIC]
+    return topics
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[tuple]:
+    """Key under which queued messages replace each other, or None"""
+    message_type = message.get("type")
+    if message_type in COALESCABLE_TYPES:
+        return message_type, message.get("job_id")
+    return None
+
+
+class ConnectionQueue:
+    """Bounded outbound message queue for a single connection
+    
+    Queued progress-style messages are coalesced (latest wins) so a slow
+    client sees fewer, fresher updates. When the queue is still full, the
+    overflow policy either drops the oldest message, preferring coalescable
+    ones so status transitions survive, or refuses the message so the
+    connection can be closed.
+    """
+    
+    def __init__(self, maxsize: int = 256, overflow_policy: str = "drop_oldest"):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unsupported overflow policy: {overflow_policy}")
+        
+        # (coalesce key, encoded frame) pairs
+        self.messages: Deque[Tuple[Optional[tuple], str]] = deque()
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self._ready = asyncio.Event()
+        
+        # Metrics
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+    
+    def put(self, frame: Frame, key: Optional[tuple] = None) -> bool:
+        """Enqueue an encoded frame without waiting; False means the consumer is too slow"""
+        if key is not None:
+            for index, (queued_key, _) in enumerate(self.messages):
+                if queued_key == key:
+                    del self.messages[index]
+                    self.coalesced += 1
+                    break
+        
+        if len(self.messages) >= self.maxsize:
+            if self.overflow_policy == "disconnect":
+                self.dropped += 1
+                return False
+            self._drop_one()
+        
+        self.messages.append((key, frame))
+        self.max_depth = max(self.max_depth, len(self.messages))
+        self._ready.set()
+        return True
+    
+    async def get(self) -> Frame:
+        """Wait for and remove the next frame"""
+        while not self.messages:
+            self._ready.clear()
+            await self._ready.wait()
+        return self.messages.popleft()[1]
+    
+    def depth(self) -> int:
+        return len(self.messages)
+    
+    def _drop_one(self) -> None:
+        for index, (queued_key, _) in enumerate(self.messages):
+            if queued_key is not None:
+                del self.messages[index]
+                break
+        else:
+            self.messages.popleft()
+        self.dropped += 1
+
+
+class ReplayBuffer:
+    """Recent sequenced events per job, for clients resuming after a reconnect
+    
+    Keeps the last `size` events of each job and at most `max_jobs` jobs,
+    evicting the least recently updated job first.
+    """
+    
+    def __init__(self, size: int = 100, max_jobs: int = 1000):
+        self.size = size
+        self.max_jobs = max_jobs
+        # job_id -> deque of (sequence, coalesce key, frame)
+        self.events: "OrderedDict[str, Deque[Tuple[int, Optional[tuple], str]]]" = OrderedDict()
+    
+    def append(self, job_id: str, sequence: int, key: Optional[tuple], frame: str) -> None:
+        events = self.events.get(job_id)
+        if events is None:
+            events = self.events[job_id] = deque(maxlen=self.size)
+            while len(self.events) > self.max_jobs:
+                self.events.popitem(last=False)
+        else:
+            self.events.move_to_end(job_id)
+        events.append((sequence, key, frame))
+    
+    def latest_sequence(self, job_id: str) -> int:
+        events = self.events.get(job_id)
+        return events[-1][0] if events else 0
+    
+    def since(self, job_id: str, sequence: int) -> Tuple[bool, list]:
+        """Events after `sequence`, and whether any in between were already evicted
+        
+        A client ahead of the buffer (or resuming a job the buffer has no
+        events for) saw numbering this process does not have, e.g. from
+        before a restart; that is reported as a gap too.
+        """
+        events = self.events.get(job_id)
+        if not events:
+            return sequence > 0, []
+        if sequence > events[-1][0]:
+            return True, []
+        
+        missed = [event for event in events if event[0] > sequence]
+        gap = bool(missed) and missed[0][0] > sequence + 1
+        return gap, missed
+
+
+class TimerWheel:
+    """Hashed timer wheel of per-connection deadlines
+    
+    Each deadline lands in one of `slots` buckets covering `tick` seconds.
+    Advancing only visits the buckets whose time has come, so the cost is
+    proportional to the timers due rather than to every timer scheduled.
+    Rescheduling leaves the old entry behind; it is skipped when its bucket
+    comes round.
+    """
+    
+    def __init__(self, tick: float = 1.0, slots: int = 512, now: float = 0.0):
+        self.tick = tick
+        self.slots: List[List[Tuple[float, str]]] = [[] for _ in range(slots)]
+        self.deadlines: Dict[str, float] = {}
+        self.current_tick = int(now // tick)
+    
+    def __len__(self) -> int:
+        return len(self.deadlines)
+    
+    def schedule(self, key: str, deadline: float) -> None:
+        """Set (or move) the deadline for a key"""
+        self.deadlines[key] = deadline
+        slot_tick = max(int(deadline // self.tick), self.current_tick)
+        self.slots[slot_tick % len(self.slots)].append((deadline, key))
+    
+    def cancel(self, key: str) -> None:
+        self.deadlines.pop(key, None)
+    
+    def advance(self, now: float) -> List[str]:
+        """Remove and return the keys whose deadline is at or before `now`"""
+        target_tick = int(now // self.tick)
+        # After a long pause every bucket needs visiting once, not once per tick
+        ticks = min(target_tick - self.current_tick + 1, len(self.slots))
+        
+        expired = []
+        for offset in range(ticks):
+            index = (self.current_tick + offset) % len(self.slots)
+            remaining = []
+            for deadline, key in self.slots[index]:
+                if self.deadlines.get(key) != deadline:
+                    continue  # cancelled or rescheduled
+                if deadline <= now:
+                    del self.deadlines[key]
+                    expired.append(key)
+                else:
+                    remaining.append((deadline, key))
+            self.slots[index] = remaining
+        
+        self.current_tick = max(self.current_tick, target_tick)
+        return expired
+
 
 class WebSocketManager:
     """Manages WebSocket connections and message broadcasting"""
     
-    def __init__(self):
+    def __init__(self, queue_size: int = 256, overflow_policy: str = "drop_oldest",
+                 replay_buffer_size: int = 100, heartbeat_interval: float = 30,
+                 idle_timeout: float = 90, clock: Callable[[], float] = time.monotonic):
         # connection_id -> WebSocket
         self.active_connections: Dict[str, WebSocket] = {}
         
-        # job_id -> set of connection_ids
-        self.job_subscriptions: Dict[str, Set[str]] = {}
+        # connection_id -> outbound queue and the task draining it
+        self.send_queues: Dict[str, ConnectionQueue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
+        
+        # connection_id -> negotiated frame encoding, when not JSON
+        self.encodings: Dict[str, str] = {}
+        self.queue_size = queue_size
+        self.overflow_policy = overflow_policy
+        
+        # Totals kept after connections close
+        self.total_dropped = 0
+        self.total_coalesced = 0
+        
+        # Bus delivering job events published by any process
+        self.event_bus = None
+        
+        # Recent sequenced events per job for resuming clients
+        self.replay_buffer = ReplayBuffer(replay_buffer_size)
+        
+        # Inverted index topic -> connection_ids, and each connection's topics
+        self.topic_subscriptions: Dict[str, Set[str]] = {}
+        self.connection_topics: Dict[str, Set[str]] = {}
+        
+        # connection_ids receiving system-wide stats
+        self.system_subscribers: Set[str] = set()
         
         # connection_id -> metadata
         self.connection_metadata: Dict[str, Dict] = {}
         
-        # connection health tracking
-        self.last_ping: Dict[str, datetime] = {}
-        self.heartbeat_interval = 30  # seconds
+        # Connection health: last inbound traffic and when to check each
+        # connection next (ping it, or close it once idle past its timeout)
+        self.clock = clock
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.last_seen: Dict[str, float] = {}
+        self.idle_timeouts: Dict[str, float] = {}
+        self.timers = TimerWheel(now=clock())
+        self.pings_sent = 0
+        self.reaped = 0
+        self._heartbeat_task: Optional[asyncio.Task] = None
+    
+    async def connect(self, websocket: WebSocket, job_id: Optional[str],
+                      since: Optional[int] = None,
+                      idle_timeout: Optional[float] = None,
+                      topics: Optional[Iterable[str]] = None,
+                      encoding: str = "json") -> str:
+        """Accept WebSocket connection and register for job updates
+        
+        The connection follows `job_id` plus any extra `topics`. With `since`,
+        events of `job_id` after that sequence number still in the replay
+        buffer are sent right after the confirmation. `idle_timeout` overrides
+        the manager default for this connection, and `encoding` ("json" or
+        "msgpack") selects its frame format.
+        """
+        connection_id = await self._register(websocket, job_id, idle_timeout, encoding)
+        
+        # Subscribe to job updates
+        initial_topics = list(topics or [])
+        if job_id:
+            initial_topics.insert(0, job_topic(job_id))
+        self.subscribe(connection_id, initial_topics)
+        
+        # Send connection confirmation
+        self.enqueue(connection_id, {
+            "type": "connected",
+            "connection_id": connection_id,
+            "job_id": job_id,
+            "topics": sorted(self.connection_topics[connection_id]),
+            "encoding": self.encodings.get(connection_id, "json"),
+            "sequence": self.replay_buffer.latest_sequence(job_id) if job_id else 0,
+            "message": "Connected to job updates"
+        })
+        if job_id and since is not None:
+            self._replay(connection_id, job_id, since)
+        
+        return connection_id
+    
+    async def connect_system(self, websocket: WebSocket,
+                             idle_timeout: Optional[float] = None) -> str:
+        """Accept WebSocket connection and register for system-wide updates"""
+        connection_id = await self._register(websocket, None, idle_timeout)
+        self.system_subscribers.add(connection_id)
+        return connection_id
     
-    async def connect(self, websocket: WebSocket, job_id: str) -> str:
-        """Accept WebSocket connection and register for job updates"""
+    async def _register(self, websocket: WebSocket, job_id: Optional[str],
+                        idle_timeout: Optional[float], encoding: str = "json") -> str:
         await websocket.accept()
         
         connection_id = str(uuid.uuid4())
+        encoding = negotiate_encoding(encoding)
+        if encoding != "json":
+            self.encodings[connection_id] = encoding
         self.active_connections[connection_id] = websocket
-        
-        # Subscribe to job updates
-        if job_id not in self.job_subscriptions:
-            self.job_subscriptions[job_id] = set()
-        self.job_subscriptions[job_id].add(connection_id)
+        self.connection_topics[connection_id] = set()
+        self.send_queues[connection_id] = ConnectionQueue(self.queue_size, self.overflow_policy)
+        self.writer_tasks[connection_id] = asyncio.create_task(self._writer(connection_id))
         
         # Store connection metadata
         self.connection_metadata[connection_id] = {
@@ -45,83 +360,246 @@ class WebSocketManager:
             "client_info": websocket.client
         }
         
-        self.last_ping[connection_id] = datetime.now()
-        
-        # Send connection confirmation
-        await self.send_to_connection(connection_id, {
-            "type": "connected",
-            "connection_id": connection_id,
-            "job_id": job_id,
-            "message": "Connected to job updates"
-        })
-        
+        now = self.clock()
+        self.last_seen[connection_id] = now
+        self.idle_timeouts[connection_id] = idle_timeout or self.idle_timeout
+        self.timers.schedule(connection_id, now + self._check_interval(connection_id))
         return connection_id
     
     async def disconnect(self, connection_id: str) -> None:
         """Disconnect and cleanup connection"""
         if connection_id in self.active_connections:
-            # Remove from job subscriptions
-            metadata = self.connection_metadata.get(connection_id, {})
-            job_id = metadata.get("job_id")
+            # Remove from topic subscriptions
+            self.unsubscribe(connection_id, list(self.connection_topics.get(connection_id, ())))
+            self.connection_topics.pop(connection_id, None)
+            self.system_subscribers.discard(connection_id)
             
-            if job_id and job_id in self.job_subscriptions:
-                self.job_subscriptions[job_id].discard(connection_id)
-                
-                # Clean up empty job subscriptions
-                if not self.job_subscriptions[job_id]:
-                    del self.job_subscriptions[job_id]
+            # Stop the writer; it may be the caller after a failed send
+            writer = self.writer_tasks.pop(connection_id, None)
+            if writer and writer is not asyncio.current_task():
+                writer.cancel()
+            
+            self.encodings.pop(connection_id, None)
+            queue = self.send_queues.pop(connection_id, None)
+            if queue:
+                self.total_dropped += queue.dropped
+                self.total_coalesced += queue.coalesced
             
             # Clean up connection data
             del self.active_connections[connection_id]
             self.connection_metadata.pop(connection_id, None)
-            self.last_ping.pop(connection_id, None)
+            self.last_seen.pop(connection_id, None)
+            self.idle_timeouts.pop(connection_id, None)
+            self.timers.cancel(connection_id)
     
     async def send_to_connection(self, connection_id: str, message: Dict[str, Any]) -> bool:
-        """Send message to specific connection"""
-        if connection_id not in self.active_connections:
+        """Queue message for a specific connection"""
+        return self.enqueue(connection_id, message)
+    
+    def enqueue(self, connection_id: str, message: Dict[str, Any],
+                frame: Optional[str] = None,
+                frames: Optional[Dict[str, Frame]] = None) -> bool:
+        """Queue message for a connection without waiting for the send
+        
+        Broadcasts pass `frames`, a cache of the message's frames by encoding
+        shared across subscribers, so each encoding is serialized only once.
+        A lone pre-encoded JSON frame can be passed as `frame`.
+        """
+        queue = self.send_queues.get(connection_id)
+        if queue is None:
             return False
         
-        websocket = self.active_connections[connection_id]
-        try:
-            await websocket.send_text(json.dumps(message))
-            return True
-        except Exception:
-            # Connection is dead, clean it up
-            await self.disconnect(connection_id)
+        if frames is None:
+            frames = {"json": frame} if frame is not None else {}
+        encoding = self.encodings.get(connection_id, "json")
+        frame = frames.get(encoding)
+        if frame is None:
+            frame = frames[encoding] = encode_message(message, encoding)
+        if not queue.put(frame, coalesce_key(message)):
+            # Consumer can't keep up and the policy is to cut it loose
+            print(f"WebSocket {connection_id} send queue overflowed, disconnecting")
+            asyncio.create_task(self._close_slow_connection(connection_id))
             return False
+        return True
+    
+    def subscribe(self, connection_id: str, topics: Iterable[str]) -> List[str]:
+        """Add topics to a connection's subscriptions
+        
+        Returns:
+            List[str]: Topics that were not valid and were ignored
+        """
+        subscribed = self.connection_topics.get(connection_id)
+        if subscribed is None:
+            return list(topics)
+        
+        invalid = []
+        for topic in topics:
+            if not is_valid_topic(topic):
+                invalid.append(topic)
+                continue
+            self.topic_subscriptions.setdefault(topic, set()).add(connection_id)
+            subscribed.add(topic)
+        return invalid
+    
+    def unsubscribe(self, connection_id: str, topics: Iterable[str]) -> None:
+        """Remove topics from a connection's subscriptions"""
+        subscribed = self.connection_topics.get(connection_id, set())
+        for topic in topics:
+            subscribed.discard(topic)
+            connections = self.topic_subscriptions.get(topic)
+            if connections is None:
+                continue
+            connections.discard(connection_id)
+            
+            # Clean up empty topics
+            if not connections:
+                del self.topic_subscriptions[topic]
     
-    async def broadcast_to_job(self, job_id: str, message: Dict[str, Any]) -> int:
-        """Broadcast message to all connections subscribed to a job"""
-        if job_id not in self.job_subscriptions:
+    async def broadcast_to_job(self, job_id: str, message: Dict[str, Any],
+                               frame: Optional[str] = None) -> int:
+        """Queue message for all connections subscribed to a job's event topics"""
+        matches = [self.topic_subscriptions[topic] for topic in event_topics(job_id, message)
+                   if topic in self.topic_subscriptions]
+        if not matches:
             return 0
+        # A connection on several matching topics still gets the event once
+        recipients = matches[0] if len(matches) == 1 else set().union(*matches)
         
-        connection_ids = list(self.job_subscriptions[job_id])
+        # Encode once per encoding; subscribers share the frames
+        frames = {"json": frame} if frame is not None else {}
         successful_sends = 0
+        for connection_id in list(recipients):
+            if self.enqueue(connection_id, message, frames=frames):
+                successful_sends += 1
         
-        for connection_id in connection_ids:
-            if await self.send_to_connection(connection_id, message):
+        return successful_sends
+    
+    async def broadcast_system(self, message: Dict[str, Any],
+                               frame: Optional[str] = None) -> int:
+        """Queue message for all system-wide subscribers"""
+        frames = {"json": frame} if frame is not None else {}
+        successful_sends = 0
+        for connection_id in list(self.system_subscribers):
+            if self.enqueue(connection_id, message, frames=frames):
                 successful_sends += 1
         
         return successful_sends
     
+    async def attach_event_bus(self, event_bus) -> None:
+        """Deliver job events published on the bus to this process's subscribers"""
+        if self.event_bus is event_bus:
+            return
+        
+        from ...core.event_bus import JOB_EVENTS_CHANNEL
+        self.event_bus = event_bus
+        await event_bus.subscribe(JOB_EVENTS_CHANNEL, self._on_job_event)
+    
+    async def _on_job_event(self, message: Dict[str, Any]) -> None:
+        job_id = message.get("job_id")
+        if not job_id:
+            return
+        
+        frame = encode_message(message)
+        sequence = message.get("sequence")
+        if sequence is not None:
+            self.replay_buffer.append(job_id, sequence, coalesce_key(message), frame)
+        await self.broadcast_to_job(job_id, message, frame)
+    
+    def _replay(self, connection_id: str, job_id: str, since: int) -> None:
+        """Queue buffered events the client missed; flag a gap if some are gone"""
+        gap, missed = self.replay_buffer.since(job_id, since)
+        if gap:
+            # Client must resync from the REST API once, then follow the stream
+            self.enqueue(connection_id, {
+                "type": "replay_gap",
+                "job_id": job_id,
+                "since": since,
+                "oldest_sequence": missed[0][0] if missed else None,
+                "latest_sequence": self.replay_buffer.latest_sequence(job_id),
+            })
+        
+        queue = self.send_queues.get(connection_id)
+        encoding = self.encodings.get(connection_id, "json")
+        for _, key, frame in missed:
+            if queue is None:
+                break
+            if encoding != "json":
+                # The buffer keeps JSON frames; re-encode for this client
+                frame = encode_message(json.loads(frame), encoding)
+            queue.put(frame, key)
+    
+    async def _writer(self, connection_id: str) -> None:
+        """Drain a connection's queue onto its socket"""
+        queue = self.send_queues[connection_id]
+        websocket = self.active_connections[connection_id]
+        try:
+            while True:
+                frame = await queue.get()
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
+                queue.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection is dead, clean it up
+            await self.disconnect(connection_id)
+    
+    async def _close_slow_connection(self, connection_id: str) -> None:
+        await self._close_connection(connection_id, 1013, "Client too slow")
+    
+    async def _close_connection(self, connection_id: str, code: int, reason: str) -> None:
+        websocket = self.active_connections.get(connection_id)
+        await self.disconnect(connection_id)
+        if websocket is not None:
+            try:
+                await websocket.close(code=code, reason=reason)
+            except Exception:
+                pass
+    
+    def touch(self, connection_id: str) -> None:
+        """Record activity on a connection, postponing its idle timeout"""
+        if connection_id in self.last_seen:
+            self.last_seen[connection_id] = self.clock()
+    
     async def handle_message(self, connection_id: str, message: str) -> None:
         """Handle incoming WebSocket message"""
+        # Any inbound traffic, including pongs, shows the client is alive
+        self.touch(connection_id)
+        
         try:
             data = json.loads(message)
             message_type = data.get("type")
             
             if message_type == "ping":
-                self.last_ping[connection_id] = datetime.now()
                 await self.send_to_connection(connection_id, {
                     "type": "pong",
                     "timestamp": datetime.now().isoformat()
                 })
             
             elif message_type == "subscribe":
-                # Handle job subscription changes
+                # Extra topics are added alongside the current ones
+                topics = data.get("topics")
+                if isinstance(topics, list):
+                    invalid = self.subscribe(connection_id, topics)
+                    if invalid:
+                        await self.send_to_connection(connection_id, {
+                            "type": "error",
+                            "message": f"Unknown topics: {', '.join(map(str, invalid))}"
+                        })
+                
+                # A job_id switches the connection to that job
                 new_job_id = data.get("job_id")
                 if new_job_id:
                     await self._change_job_subscription(connection_id, new_job_id)
+                    if isinstance(data.get("since"), int):
+                        self._replay(connection_id, new_job_id, data["since"])
+            
+            elif message_type == "unsubscribe":
+                topics = data.get("topics")
+                if isinstance(topics, list):
+                    self.unsubscribe(connection_id, topics)
             
         except json.JSONDecodeError:
             await self.send_to_connection(connection_id, {
@@ -135,44 +613,126 @@ class WebSocketManager:
         current_metadata = self.connection_metadata.get(connection_id, {})
         current_job_id = current_metadata.get("job_id")
         
-        if current_job_id and current_job_id in self.job_subscriptions:
-            self.job_subscriptions[current_job_id].discard(connection_id)
+        if current_job_id:
+            self.unsubscribe(connection_id, [job_topic(current_job_id)])
         
         # Add to new subscription
-        if new_job_id not in self.job_subscriptions:
-            self.job_subscriptions[new_job_id] = set()
-        self.job_subscriptions[new_job_id].add(connection_id)
+        self.subscribe(connection_id, [job_topic(new_job_id)])
         
         # Update metadata
         if connection_id in self.connection_metadata:
             self.connection_metadata[connection_id]["job_id"] = new_job_id
     
-    async def cleanup_stale_connections(self) -> int:
-        """Remove connections that haven't pinged recently"""
-        stale_timeout = 60  # seconds
-        current_time = datetime.now()
-        stale_connections = []
+    def start_heartbeat(self) -> None:
+        """Start pinging idle connections and reaping dead ones"""
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._run_heartbeat())
+    
+    async def stop_heartbeat(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+    
+    async def _run_heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.timers.tick)
+            try:
+                await self.reap_expired()
+            except Exception as e:
+                print(f"WebSocket heartbeat error: {e}")
+    
+    async def reap_expired(self) -> int:
+        """Handle connections whose check time has passed
         
-        for connection_id, last_ping_time in self.last_ping.items():
-            if (current_time - last_ping_time).seconds > stale_timeout:
-                stale_connections.append(connection_id)
+        Only connections with a due timer are visited. Each one is closed if
+        it has been silent past its idle timeout, pinged if it has been silent
+        for a heartbeat interval, or otherwise rescheduled from its last
+        activity.
         
-        for connection_id in stale_connections:
-            await self.disconnect(connection_id)
+        Returns:
+            int: Number of connections closed
+        """
+        now = self.clock()
+        ping_message = None
+        ping_frames: Dict[str, Frame] = {}
+        closed = 0
+        
+        for connection_id in self.timers.advance(now):
+            if connection_id not in self.active_connections:
+                continue
+            
+            idle = now - self.last_seen[connection_id]
+            timeout = self.idle_timeouts[connection_id]
+            if idle >= timeout:
+                await self._close_connection(connection_id, 1001, "Idle timeout")
+                closed += 1
+                continue
+            
+            if idle >= self.heartbeat_interval:
+                if ping_message is None:
+                    ping_message = {"type": "ping", "timestamp": datetime.now().isoformat()}
+                self.enqueue(connection_id, ping_message, frames=ping_frames)
+                self.pings_sent += 1
+                next_check = self.last_seen[connection_id] + timeout
+            else:
+                next_check = self.last_seen[connection_id] + self._check_interval(connection_id)
+            self.timers.schedule(connection_id, next_check)
         
-        return len(stale_connections)
+        self.reaped += closed
+        return closed
+    
+    def _check_interval(self, connection_id: str) -> float:
+        return min(self.heartbeat_interval, self.idle_timeouts[connection_id])
     
-    def get_connection_stats(self) -> Dict[str, Any]:
-        """Get connection statistics"""
-        return {
+    def get_connection_stats(self, include_topics: bool = True) -> Dict[str, Any]:
+        """Get connection statistics
+        
+        Args:
+            include_topics (bool): Include per-topic connection counts, which
+                costs a pass over every subscribed topic
+        """
+        depths = [queue.depth() for queue in self.send_queues.values()]
+        stats = {
             "total_connections": len(self.active_connections),
-            "active_jobs": len(self.job_subscriptions),
-            "connections_by_job": {
-                job_id: len(connections) 
-                for job_id, connections in self.job_subscriptions.items()
+            "active_topics": len(self.topic_subscriptions),
+            "system_subscribers": len(self.system_subscribers),
+            "send_queues": {
+                "capacity": self.queue_size,
+                "overflow_policy": self.overflow_policy,
+                "total_depth": sum(depths),
+                "max_depth": max(depths, default=0),
+                "peak_depth": max(
+                    (queue.max_depth for queue in self.send_queues.values()), default=0
+                ),
+                "dropped": self.total_dropped + sum(
+                    queue.dropped for queue in self.send_queues.values()
+                ),
+                "coalesced": self.total_coalesced + sum(
+                    queue.coalesced for queue in self.send_queues.values()
+                ),
+            },
+            "heartbeat": {
+                "interval": self.heartbeat_interval,
+                "idle_timeout": self.idle_timeout,
+                "scheduled": len(self.timers),
+                "pings_sent": self.pings_sent,
+                "reaped": self.reaped,
             }
         }
+        if include_topics:
+            stats["connections_by_topic"] = {
+                topic: len(connections)
+                for topic, connections in self.topic_subscriptions.items()
+            }
+        return stats
 
 
 # Global WebSocket manager instance
-websocket_manager = WebSocketManager()
+_settings = get_settings()
+websocket_manager = WebSocketManager(
+    queue_size=_settings.websocket_queue_size,
+    overflow_policy=_settings.websocket_overflow_policy,
+    replay_buffer_size=_settings.websocket_replay_buffer_size,
+    heartbeat_interval=_settings.websocket_heartbeat_interval,
+    idle_timeout=_settings.websocket_idle_timeout
+)
@@ -0,0 +1,141 @@
+"""Shared producer of system-wide stats for /ws/system subscribers"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import WebSocket
+
+from ...web.config import get_settings
+from .manager import WebSocketManager, encode_message, websocket_manager
+
+
+def collect_system_stats(manager: WebSocketManager) -> Dict[str, Any]:
+    """Current job capacity and WebSocket figures"""
+    # Import here to avoid circular dependency; this is the job manager
+    # that actually runs the API's jobs
+    from ..v1.jobs import job_service
+
+    stats = job_service.get_system_stats()
+    stats["websocket_stats"] = manager.get_connection_stats(include_topics=False)
+    return stats
+
+
+def diff_stats(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Values in `current` that differ from `previous`; removed keys map to None"""
+    delta = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff_stats(old, value)
+            if nested:
+                delta[key] = nested
+        elif key not in previous or old != value:
+            delta[key] = value
+    for key in previous.keys() - current.keys():
+        delta[key] = None
+    return delta
+
+
+class SystemStatsBroadcaster:
+    """Computes system stats once per interval for every /ws/system client
+
+    New subscribers get the full snapshot the last broadcast was based on
+    (type "system_stats"); after that each interval sends only the values
+    that changed (type "system_stats_delta"), and nothing when none did.
+    Deltas are never coalesced in send queues since each builds on the last,
+    so a subscriber whose queue dropped a frame is sent the full snapshot again.
+    """
+
+    def __init__(self, manager: WebSocketManager, interval: float = 30,
+                 stats_provider: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.manager = manager
+        self.interval = interval
+        self.stats_provider = stats_provider or (lambda: collect_system_stats(manager))
+        self.snapshot: Optional[Dict[str, Any]] = None
+        # connection_id -> send queue drop count when last checked
+        self.dropped_seen: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def subscribe(self, websocket: WebSocket) -> str:
+        """Register a /ws/system client and send it the current snapshot"""
+        connection_id = await self.manager.connect_system(websocket)
+        if self.snapshot is None:
+            self.snapshot = self.stats_provider()
+
+        self.manager.enqueue(connection_id, self._message("system_stats", self.snapshot))
+        self.start()
+        return connection_id
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def publish(self) -> int:
+        """Compute stats once and send what changed to every subscriber
+
+        Returns:
+            int: Number of subscribers the update was queued for
+        """
+        if not self.manager.system_subscribers:
+            # Nobody to keep in sync; the next subscriber starts from scratch
+            self.snapshot = None
+            self.dropped_seen.clear()
+            return 0
+
+        stats = self.stats_provider()
+        delta = diff_stats(self.snapshot or {}, stats)
+        self.snapshot = stats
+        sent = 0
+        if delta:
+            message = self._message("system_stats_delta", delta)
+            sent = await self.manager.broadcast_system(message, encode_message(message))
+
+        self._resync_lagging()
+        return sent
+
+    def _resync_lagging(self) -> None:
+        """Queue the full snapshot for subscribers whose send queue dropped a
+        frame since the last check; a lost delta or snapshot leaves them wrong"""
+        snapshot = None
+        frames: Dict[str, Any] = {}
+        dropped_seen = {}
+        for connection_id in list(self.manager.system_subscribers):
+            queue = self.manager.send_queues.get(connection_id)
+            if queue is None:
+                continue
+            if queue.dropped != self.dropped_seen.get(connection_id, 0):
+                if snapshot is None:
+                    snapshot = self._message("system_stats", self.snapshot)
+                # Dropping an older frame to fit this one is harmless
+                self.manager.enqueue(connection_id, snapshot, frames=frames)
+            dropped_seen[connection_id] = queue.dropped
+        self.dropped_seen = dropped_seen
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.publish()
+            except Exception as e:
+                print(f"System stats broadcast error: {e}")
+
+    @staticmethod
+    def _message(message_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": message_type,
+            "data": data,
+            "timestamp": datetime.now().isoformat()
+        }
+
+
+# Global broadcaster instance
+system_stats_broadcaster = SystemStatsBroadcaster(
+    websocket_manager,
+    interval=get_settings().system_stats_interval_seconds
+)
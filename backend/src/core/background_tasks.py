@@ -3,6 +3,7 @@
 import asyncio
 import sys
 import os
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -14,79 +15,46 @@ from ..models.enums import JobStatus, JobStep
 from ..services.video_service import VideoService
 from ..services.provider_service import ProviderService
 from .file_manager import FileManager
+from .generation_cache import GenerationCache, get_generation_cache
+from .token_budget import count_tokens, plan_prompt_budget
+from .transcript_compressor import compress_transcript
+from ..web.config import get_settings
 
-from ..core.youtube_parser import get_video_id, get_video_title
+from ..core.youtube_parser import get_video_id, get_video_info
 from ..core.transcript_handler import list_transcript_languages, fetch_transcript
 from ..core.llm_providers import LLMProviderFactory
-from ..core.blog_formatter import format_as_blog, save_blog_to_file
-from ..core.utils import validate_url, create_safe_filename
+from ..core.blog_formatter import format_as_blog
+from ..core.utils import validate_url
 
 
 class BackgroundTaskProcessor:
     """Processes jobs in the background using existing CLI modules"""
-    
+
     def __init__(self, job_manager):
         self.job_manager = job_manager
         self.video_service = VideoService()
         self.provider_service = ProviderService()
         self.file_manager = FileManager()
-        
-        # Initialize existing CLI modules
-        self.youtube_parser = YouTubeParser()
-        self.transcript_handler = TranscriptHandler()
+
+        # Existing CLI modules
         self.llm_factory = LLMProviderFactory()
-        self.blog_formatter = BlogFormatter()
-    
+        self.generation_cache = get_generation_cache()
+
     async def process_job(self, job_id: str) -> None:
         """Process a complete job workflow"""
         try:
             job = await self.job_manager.get_job(job_id)
             if not job:
                 return
-            
-            # Update started time
-            job.started_at = job.updated_at
-            
-            # Step 1: Validate URL and extract video info
-            await self._update_progress(job_id, JobStep.VALIDATE_URL, "Validating YouTube URL...")
-            video_info = await self._validate_and_extract_video_info(job.video_url)
-            
-            # Update job with video info
-            job.video_id = video_info["video_id"]
-            job.video_title = video_info.get("title")
-            job.video_duration = video_info.get("duration")
-            job.video_thumbnail = video_info.get("thumbnail")
-            
-            # Step 2: Detect available languages
-            await self._update_progress(job_id, JobStep.DETECT_LANGUAGES, "Detecting available languages...")
-            available_languages = await self._detect_languages(job.video_id)
-            
-            # Step 3: Fetch transcript
-            await self._update_progress(job_id, JobStep.FETCH_TRANSCRIPT, "Fetching video transcript...")
-            transcript = await self._fetch_transcript(job.video_id, job.language_code)
-            
-            # Save transcript
-            transcript_path = await self.file_manager.save_transcript(job_id, transcript)
-            job.transcript_file_path = transcript_path
-            
+
+            transcript = await self._prepare_job(job_id, job)
+
             # Step 4: Generate blog content
             await self._update_progress(job_id, JobStep.GENERATE_CONTENT, "Generating blog content...")
-            blog_content = await self._generate_blog_content(
-                transcript, job.llm_provider, job.llm_model, job.video_title
-            )
-            
-            # Step 5: Format and save output
-            await self._update_progress(job_id, JobStep.FORMAT_BLOG, "Formatting blog post...")
-            formatted_content = await self._format_blog_content(blog_content, job.video_title)
-            
-            # Step 6: Save final output
-            await self._update_progress(job_id, JobStep.SAVE_OUTPUT, "Saving output file...")
-            output_path = await self.file_manager.save_blog_output(job_id, formatted_content)
-            job.output_file_path = output_path
-            
-            # Job completed successfully
-            await self.job_manager.update_job_status(job_id, JobStatus.COMPLETED)
-            
+            blog_content = await self._generate_blog_content(job, transcript)
+
+            await self._finish_job(job_id, job, blog_content)
+
         except asyncio.CancelledError:
             await self.job_manager.update_job_status(job_id, JobStatus.CANCELLED)
             raise
@@ -94,57 +62,304 @@ class BackgroundTaskProcessor:
             error_message = f"Job failed: {str(e)}"
             await self.job_manager.update_job_status(job_id, JobStatus.FAILED, error_message)
             raise
-    
+
+    async def prepare_batch_request(self, job_id: str, batch_provider) -> Optional[dict]:
+        """Run a batch-mode job up to prompt construction
+
+        Returns None if the job is missing or failed during preparation.
+        Otherwise returns a dict with the job, prompt, generation params and
+        any cached content for that exact request.
+        """
+        try:
+            job = await self.job_manager.get_job(job_id)
+            if not job:
+                return None
+
+            transcript = await self._prepare_job(job_id, job)
+
+            await self._update_progress(job_id, JobStep.GENERATE_CONTENT, "Queued for batch generation...")
+            job.transcript_length = len(transcript)
+            job.tokens_used = 0
+            transcript = await self._compress_transcript(job, batch_provider, transcript)
+
+            # A batch holds one request per job, so over-long transcripts are truncated
+            title = job.video_title or ""
+            plan = plan_prompt_budget(
+                batch_provider, transcript, title, job.video_url, allow_chunking=False
+            )
+            self._record_budget_plan(job, plan)
+
+            params = batch_provider.get_generation_params()
+            if batch_provider.max_tokens is not None:
+                params["max_tokens"] = plan["max_output_tokens"]
+
+            prompt = batch_provider.create_blog_prompt(plan["transcript"], title, job.video_url)
+            cache_key = GenerationCache.make_key(prompt, params)
+
+            cached_content = None
+            if self.generation_cache:
+                loop = asyncio.get_event_loop()
+                cached_content = await loop.run_in_executor(
+                    None, self.generation_cache.get, cache_key
+                )
+            self._record_cache_result(job, cache_key, hit=cached_content is not None)
+
+            return {
+                "job": job,
+                "prompt": prompt,
+                "params": params,
+                "cached_content": cached_content,
+            }
+
+        except Exception as e:
+            await self.job_manager.update_job_status(job_id, JobStatus.FAILED, f"Job failed: {str(e)}")
+            return None
+
+    async def complete_batch_job(self, job_id: str, request: dict, content: Optional[str],
+                                 batch_provider) -> None:
+        """Fan a batch result back into the normal formatting and saving steps"""
+        job = request["job"]
+        try:
+            if not content:
+                raise RuntimeError(f"Batch request for provider '{job.llm_provider}' returned no content")
+
+            # Batches recovered after a restart have no prompt (it was not persisted)
+            prompt = request["prompt"]
+            if request["cached_content"] is None:
+                family = batch_provider.provider_family
+                job.tokens_used = (job.tokens_used or 0) + (
+                    (count_tokens(prompt, family, batch_provider.model_name) if prompt else 0)
+                    + count_tokens(content, family, batch_provider.model_name)
+                )
+                if self.generation_cache and prompt is not None:
+                    loop = asyncio.get_event_loop()
+                    cache_key = GenerationCache.make_key(request["prompt"], request["params"])
+                    await loop.run_in_executor(
+                        None, self.generation_cache.set, cache_key, content, request["params"]
+                    )
+
+            job.output_length = len(content)
+            await self._finish_job(job_id, job, content)
+
+        except Exception as e:
+            await self.job_manager.update_job_status(job_id, JobStatus.FAILED, f"Job failed: {str(e)}")
+
+    async def _prepare_job(self, job_id: str, job) -> str:
+        """Validate the video, fetch its transcript and return it"""
+        # Update started time
+        job.started_at = job.updated_at
+
+        # Step 1: Validate URL and extract video info
+        await self._update_progress(job_id, JobStep.VALIDATE_URL, "Validating YouTube URL...")
+        video_info = await self._validate_and_extract_video_info(job.video_url)
+
+        # Update job with video info
+        job.video_id = video_info["video_id"]
+        job.video_title = video_info.get("title")
+        job.video_duration = video_info.get("duration")
+        job.video_thumbnail = video_info.get("thumbnail")
+
+        # Step 2: Detect available languages
+        await self._update_progress(job_id, JobStep.DETECT_LANGUAGES, "Detecting available languages...")
+        available_languages = await self._detect_languages(job.video_id)
+
+        # Step 3: Fetch transcript
+        await self._update_progress(job_id, JobStep.FETCH_TRANSCRIPT, "Fetching video transcript...")
+        transcript = await self._fetch_transcript(job.video_id, job.language_code)
+
+        # Save transcript
+        transcript_path = await self.file_manager.save_transcript(job_id, transcript)
+        job.transcript_file_path = transcript_path
+
+        return transcript
+
+    async def _finish_job(self, job_id: str, job, blog_content: str) -> None:
+        """Format and save generated content, then mark the job completed"""
+        # Step 5: Format and save output
+        await self._update_progress(job_id, JobStep.FORMAT_BLOG, "Formatting blog post...")
+        formatted_content = await self._format_blog_content(
+            blog_content, job.video_title, job.video_url
+        )
+
+        # Step 6: Save final output
+        await self._update_progress(job_id, JobStep.SAVE_OUTPUT, "Saving output file...")
+        output_path = await self.file_manager.save_blog_output(job_id, formatted_content)
+        job.output_file_path = output_path
+
+        # A job idle in a provider batch for hours may have been dropped from
+        # the registry; file this object again so the status update saves
+        # the output fields set on it rather than a copy reloaded from the DB
+        self.job_manager.job_registry[job_id] = job
+
+        # Job completed successfully
+        await self.job_manager.update_job_status(job_id, JobStatus.COMPLETED)
+
     async def _update_progress(self, job_id: str, step: JobStep, message: str) -> None:
-        """Update job progress and notify clients"""
-        # This would update progress in database and notify via WebSocket
+        """Record the start of a step and notify clients"""
+        await self.job_manager.progress_recorder.step_started(job_id, step.value, message)
         await self.job_manager.notification_service.broadcast_progress_update(job_id, {
             "step": step.value,
             "message": message,
-            "timestamp": job.updated_at.isoformat()
+            "timestamp": datetime.now().isoformat()
         })
-    
+
     async def _validate_and_extract_video_info(self, video_url: str) -> dict:
         """Validate URL and extract video information"""
+        if not validate_url(video_url):
+            raise ValueError("Invalid YouTube URL")
+
+        video_id = get_video_id(video_url)
+        if not video_id:
+            raise ValueError(f"Could not extract video ID from URL: {video_url}")
+
         # Use existing youtube_parser module
         loop = asyncio.get_event_loop()
-        video_info = await loop.run_in_executor(
-            None, self.youtube_parser.parse_url, video_url
-        )
-        return video_info
-    
+        info = await loop.run_in_executor(None, get_video_info, video_id)
+
+        return {
+            "video_id": video_id,
+            "title": info.get("title"),
+            "duration": None,  # oEmbed doesn't provide duration
+            "thumbnail": info.get("thumbnail_url")
+        }
+
     async def _detect_languages(self, video_id: str) -> list:
         """Detect available transcript languages"""
         loop = asyncio.get_event_loop()
         languages = await loop.run_in_executor(
-            None, self.transcript_handler.get_available_languages, video_id
+            None, list_transcript_languages, video_id
         )
         return languages
-    
+
     async def _fetch_transcript(self, video_id: str, language_code: str) -> str:
         """Fetch video transcript"""
         loop = asyncio.get_event_loop()
         transcript = await loop.run_in_executor(
-            None, self.transcript_handler.get_transcript, video_id, language_code
+            None, fetch_transcript, video_id, language_code
         )
+        if not transcript:
+            raise ValueError(f"No transcript available in language: {language_code}")
         return transcript
-    
-    async def _generate_blog_content(self, transcript: str, provider: str, 
-                                   model: Optional[str], title: str) -> str:
-        """Generate blog content using LLM"""
-        # Use existing LLM provider
-        llm_provider = self.llm_factory.get_provider(provider, model)
-        
-        loop = asyncio.get_event_loop()
-        blog_content = await loop.run_in_executor(
-            None, llm_provider.generate_blog_post, transcript, title
+
+    async def _generate_blog_content(self, job, transcript: str) -> str:
+        """Generate blog content using LLM within the model's token budget"""
+        llm_provider = self.llm_factory.create_provider(job.llm_provider)
+        title = job.video_title or ""
+
+        job.transcript_length = len(transcript)
+        job.tokens_used = 0
+
+        transcript = await self._compress_transcript(job, llm_provider, transcript)
+
+        # Decide truncation/chunking locally instead of failing at the provider
+        plan = plan_prompt_budget(llm_provider, transcript, title, job.video_url)
+        if plan["strategy"] == "chunk":
+            condensed = await self._condense_transcript(job, llm_provider, plan["chunks"], title)
+            plan = plan_prompt_budget(
+                llm_provider, condensed, title, job.video_url, allow_chunking=False
+            )
+
+        if llm_provider.max_tokens is not None:
+            llm_provider.max_tokens = plan["max_output_tokens"]
+        self._record_budget_plan(job, plan)
+
+        prompt = llm_provider.create_blog_prompt(plan["transcript"], title, job.video_url)
+        blog_content, cache_key, cache_hit = await self._complete_with_cache(
+            job, llm_provider, prompt
         )
+        self._record_cache_result(job, cache_key, hit=cache_hit)
+
+        job.output_length = len(blog_content)
         return blog_content
-    
-    async def _format_blog_content(self, content: str, title: str) -> str:
+
+    async def _compress_transcript(self, job, llm_provider, transcript: str) -> str:
+        """Strip filler and redundancy from the transcript before prompting"""
+        settings = get_settings()
+        if not settings.transcript_compression_enabled:
+            return transcript
+
+        target_ratio = (job.job_metadata or {}).get(
+            "compression_ratio", settings.transcript_compression_ratio
+        )
+
+        loop = asyncio.get_event_loop()
+        result = await loop.run_in_executor(
+            None, compress_transcript, transcript, target_ratio,
+            llm_provider.provider_family, llm_provider.model_name, job.language_code
+        )
+
+        metadata = dict(job.job_metadata or {})
+        metadata["compression"] = {
+            key: value for key, value in result.items() if key != "transcript"
+        }
+        job.job_metadata = metadata
+
+        return result["transcript"]
+
+    async def _condense_transcript(self, job, llm_provider, chunks: list, title: str) -> str:
+        """Condense an over-long transcript into notes, one chunk at a time"""
+        notes = []
+        for index, chunk in enumerate(chunks, start=1):
+            prompt = llm_provider.create_chunk_notes_prompt(chunk, title, index, len(chunks))
+            chunk_notes, _, _ = await self._complete_with_cache(job, llm_provider, prompt)
+            notes.append(chunk_notes)
+        return "\n\n".join(notes)
+
+    async def _complete_with_cache(self, job, llm_provider, prompt: str) -> tuple:
+        """Run a prompt through the provider unless an identical request is cached"""
+        loop = asyncio.get_event_loop()
+
+        # Key on exactly what the provider would receive
+        params = llm_provider.get_generation_params()
+        cache_key = GenerationCache.make_key(prompt, params)
+
+        if self.generation_cache:
+            cached_content = await loop.run_in_executor(
+                None, self.generation_cache.get, cache_key
+            )
+            if cached_content is not None:
+                return cached_content, cache_key, True
+
+        content = await loop.run_in_executor(None, llm_provider.complete, prompt)
+        if not content:
+            raise RuntimeError(f"LLM provider '{job.llm_provider}' returned no content")
+
+        # Prefer provider-reported usage, fall back to the local estimate
+        tokens = llm_provider.last_usage
+        if tokens is None:
+            family = llm_provider.provider_family
+            tokens = (count_tokens(prompt, family, llm_provider.model_name)
+                      + count_tokens(content, family, llm_provider.model_name))
+        job.tokens_used = (job.tokens_used or 0) + tokens
+
+        if self.generation_cache:
+            await loop.run_in_executor(
+                None, self.generation_cache.set, cache_key, content, params
+            )
+
+        return content, cache_key, False
+
+    def _record_budget_plan(self, job, plan: dict) -> None:
+        """Surface the prompt budget decision on the job record"""
+        metadata = dict(job.job_metadata or {})
+        metadata["token_budget"] = {
+            "strategy": plan["strategy"],
+            "context_window": plan["context_window"],
+            "prompt_tokens": plan["prompt_tokens"],
+            "max_output_tokens": plan["max_output_tokens"],
+        }
+        job.job_metadata = metadata
+
+    def _record_cache_result(self, job, cache_key: str, hit: bool) -> None:
+        """Surface the generation cache outcome on the job record"""
+        metadata = dict(job.job_metadata or {})
+        metadata["generation_cache"] = {"hit": hit, "key": cache_key}
+        job.job_metadata = metadata
+
+    async def _format_blog_content(self, content: str, title: str, video_url: str) -> str:
         """Format blog content"""
         loop = asyncio.get_event_loop()
         formatted_content = await loop.run_in_executor(
-            None, self.blog_formatter.format_blog, content, title
+            None, format_as_blog, content, title, video_url
         )
-        return formatted_content
\ No newline at end of file
+        return formatted_content
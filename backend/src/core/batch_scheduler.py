@@ -0,0 +1,231 @@
+"""Batch-mode scheduling for non-urgent jobs"""
+
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from ..models.enums import JobStatus
+from ..web.config import get_settings
+from .llm_providers import BatchProvider, LLMProviderFactory
+
+
+class BatchScheduler:
+    """Accumulates batch-mode jobs and runs them through provider batch APIs
+
+    Jobs are grouped per provider. A group is submitted once it reaches
+    max_batch_size or after flush_interval seconds, whichever comes first.
+    Each submitted batch is polled until the provider finishes it, and the
+    results are passed back through the normal formatting and saving steps.
+    """
+
+    def __init__(self, job_manager, max_batch_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 poll_interval: Optional[float] = None):
+        settings = get_settings()
+        self.job_manager = job_manager
+        self.max_batch_size = max_batch_size or settings.batch_max_size
+        self.flush_interval = (flush_interval if flush_interval is not None
+                               else settings.batch_flush_interval_seconds)
+        self.poll_interval = (poll_interval if poll_interval is not None
+                              else settings.batch_poll_interval_seconds)
+
+        self.pending: Dict[str, List[str]] = {}
+        self.active_batches: Dict[str, Dict] = {}
+        self._flush_timers: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def enqueue(self, job_id: str, provider_name: str) -> None:
+        """Add a job to its provider's pending batch"""
+        if not LLMProviderFactory.supports_batch(provider_name):
+            raise ValueError(f"Provider does not support batch mode: {provider_name}")
+
+        queue = self.pending.setdefault(provider_name, [])
+        queue.append(job_id)
+
+        if len(queue) >= self.max_batch_size:
+            self._spawn(self._run_batch(provider_name, self._take_pending(provider_name)))
+        elif provider_name not in self._flush_timers:
+            self._flush_timers[provider_name] = self._spawn(self._flush_later(provider_name))
+
+    def get_pending_count(self) -> int:
+        """Get number of jobs waiting to be submitted"""
+        return sum(len(job_ids) for job_ids in self.pending.values())
+
+    async def flush(self, provider_name: str) -> Optional[str]:
+        """Submit a provider's pending jobs as one batch and wait for the results
+
+        Returns:
+            Optional[str]: Batch ID, or None if nothing needed submitting
+        """
+        return await self._run_batch(provider_name, self._take_pending(provider_name))
+
+    async def shutdown(self) -> None:
+        """Cancel pending timers and in-flight polling"""
+        for task in list(self._tasks):
+            task.cancel()
+        self._tasks.clear()
+        self._flush_timers.clear()
+
+    def _take_pending(self, provider_name: str) -> List[str]:
+        """Remove and return a provider's pending jobs, cancelling its flush timer"""
+        timer = self._flush_timers.pop(provider_name, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+            self._tasks.discard(timer)
+        return self.pending.pop(provider_name, [])
+
+    async def _run_batch(self, provider_name: str, job_ids: List[str]) -> Optional[str]:
+        if not job_ids:
+            return None
+
+        # Import here to avoid circular dependency
+        from .background_tasks import BackgroundTaskProcessor
+
+        processor = BackgroundTaskProcessor(self.job_manager)
+        batch_provider = LLMProviderFactory.create_batch_provider(provider_name)
+        loop = asyncio.get_event_loop()
+
+        try:
+            prepared = await asyncio.gather(*(
+                processor.prepare_batch_request(job_id, batch_provider) for job_id in job_ids
+            ))
+
+            requests = {}
+            for job_id, request in zip(job_ids, prepared):
+                if request is None:
+                    continue
+                if request["cached_content"] is not None:
+                    await processor.complete_batch_job(
+                        job_id, request, request["cached_content"], batch_provider
+                    )
+                    continue
+                requests[job_id] = request
+
+            if not requests:
+                return None
+
+            try:
+                batch_id = await loop.run_in_executor(
+                    None, batch_provider.submit_batch,
+                    {job_id: request["prompt"] for job_id, request in requests.items()},
+                    {job_id: request["params"]["max_tokens"] for job_id, request in requests.items()
+                     if request["params"]["max_tokens"] is not None}
+                )
+            except Exception as e:
+                await self._fail_jobs(requests, f"Batch submission failed: {str(e)}")
+                return None
+
+            for job_id, request in requests.items():
+                job = request["job"]
+                metadata = dict(job.job_metadata or {})
+                metadata["batch"] = {"id": batch_id, "provider": provider_name}
+                job.job_metadata = metadata
+                await self.job_manager.update_job_status(job_id, JobStatus.GENERATING_BLOG)
+
+            await self._collect_batch(processor, batch_provider, provider_name, batch_id, requests)
+            return batch_id
+
+        finally:
+            batch_provider.close()
+
+    async def recover(self) -> int:
+        """Pick up batch-mode jobs left unfinished by a restart
+
+        Jobs whose batch was already submitted (the batch id is in their
+        metadata) go back to polling that batch, so paid-for results are
+        not lost. Jobs that had not been submitted yet are queued again.
+
+        Returns:
+            int: Number of jobs recovered
+        """
+        submitted: Dict[tuple, List[str]] = {}
+        recovered = 0
+        for job in await self.job_manager.job_repository.get_active_jobs():
+            metadata = job.job_metadata or {}
+            batch = metadata.get("batch")
+            if batch:
+                submitted.setdefault((batch["provider"], batch["id"]), []).append(job.id)
+            elif metadata.get("mode") == "batch":
+                await self.enqueue(job.id, job.llm_provider)
+            else:
+                continue
+            recovered += 1
+
+        for (provider_name, batch_id), job_ids in submitted.items():
+            self._spawn(self._resume_batch(provider_name, batch_id, job_ids))
+        return recovered
+
+    async def _resume_batch(self, provider_name: str, batch_id: str, job_ids: List[str]) -> None:
+        """Poll a batch submitted before a restart and complete its jobs"""
+        from .background_tasks import BackgroundTaskProcessor
+
+        processor = BackgroundTaskProcessor(self.job_manager)
+        batch_provider = LLMProviderFactory.create_batch_provider(provider_name)
+        try:
+            requests = {}
+            for job_id in job_ids:
+                job = await self.job_manager.get_job(job_id)
+                if job is not None:
+                    # The prompt was not persisted: no prompt tokens or cache entry
+                    requests[job_id] = {"job": job, "prompt": None, "params": None,
+                                        "cached_content": None}
+            await self._collect_batch(processor, batch_provider, provider_name, batch_id, requests)
+        finally:
+            batch_provider.close()
+
+    async def _collect_batch(self, processor, batch_provider: BatchProvider, provider_name: str,
+                             batch_id: str, requests: Dict[str, Dict]) -> None:
+        """Wait for a submitted batch and fan its results out to the jobs"""
+        self.active_batches[batch_id] = {
+            "provider": provider_name,
+            "job_ids": list(requests),
+            "submitted_at": datetime.now(),
+        }
+        try:
+            results = await self._wait_for_results(batch_provider, batch_id)
+        except Exception as e:
+            await self._fail_jobs(requests, f"Batch {batch_id} failed: {str(e)}")
+            return
+        finally:
+            self.active_batches.pop(batch_id, None)
+
+        await asyncio.gather(*(
+            processor.complete_batch_job(job_id, request, results.get(job_id), batch_provider)
+            for job_id, request in requests.items()
+        ))
+
+    async def _flush_later(self, provider_name: str) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush(provider_name)
+
+    async def _wait_for_results(self, batch_provider: BatchProvider, batch_id: str) -> Dict:
+        """Poll a batch until it finishes and return its results"""
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                status = await loop.run_in_executor(
+                    None, batch_provider.get_batch_status, batch_id
+                )
+            except Exception as e:
+                # Transient polling errors shouldn't abandon a day-long batch
+                print(f"Batch {batch_id} status check failed: {str(e)}")
+                status = BatchProvider.IN_PROGRESS
+
+            if status == BatchProvider.COMPLETED:
+                return await loop.run_in_executor(
+                    None, batch_provider.get_batch_results, batch_id
+                )
+            if status == BatchProvider.FAILED:
+                raise RuntimeError("provider reported the batch as failed or expired")
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def _fail_jobs(self, requests: Dict[str, Dict], error_message: str) -> None:
+        for job_id in requests:
+            await self.job_manager.update_job_status(job_id, JobStatus.FAILED, error_message)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
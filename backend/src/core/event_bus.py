@@ -0,0 +1,265 @@
+"""
+Event Bus
+Pluggable pub/sub so job events published in one process reach WebSocket
+clients connected to any other process.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Channel carrying job status, progress and completion events
+JOB_EVENTS_CHANNEL = "job_events"
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class EventBus(ABC):
+    """Abstract base class for event bus backends."""
+
+    def __init__(self):
+        self.handlers: Dict[str, List[Handler]] = {}
+
+    @abstractmethod
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Publish a JSON-serializable message to every subscriber of a channel."""
+        pass
+
+    async def subscribe(self, channel: str, handler: Handler) -> None:
+        """Register a coroutine to be called with each message on a channel."""
+        self.handlers.setdefault(channel, []).append(handler)
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+    async def _dispatch(self, channel: str, message: Dict[str, Any]) -> None:
+        for handler in list(self.handlers.get(channel, [])):
+            try:
+                await handler(message)
+            except Exception as e:
+                # One failing subscriber mustn't stop delivery to the rest
+                print(f"Event bus handler error on {channel}: {str(e)}")
+
+
+class InMemoryEventBus(EventBus):
+    """Single-process bus; publishing delivers to local subscribers directly."""
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await self._dispatch(channel, message)
+
+
+class RedisEventBus(EventBus):
+    """Redis pub/sub bus shared by all workers pointing at the same server.
+
+    If the subscription connection drops, the reader logs it, waits (doubling
+    the wait up to RECONNECT_MAX_DELAY) and subscribes again. Events published
+    while it was disconnected are not delivered.
+    """
+
+    RECONNECT_MIN_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 30.0
+
+    def __init__(self, url: str, prefix: str = "blogtube:"):
+        super().__init__()
+        if aioredis is None:
+            raise ImportError("Redis package not installed. Run: pip install redis")
+
+        self.client = aioredis.from_url(url)
+        self.prefix = prefix
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        await self.client.publish(self.prefix + channel, json.dumps(message, default=str))
+
+    async def subscribe(self, channel: str, handler: Handler) -> None:
+        await super().subscribe(channel, handler)
+        if self._pubsub is None:
+            self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(self.prefix + channel)
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read())
+
+    async def close(self) -> None:
+        if self._reader:
+            self._reader.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.close()
+        await self.client.close()
+
+    async def _read(self) -> None:
+        delay = self.RECONNECT_MIN_DELAY
+        while True:
+            try:
+                async for item in self._pubsub.listen():
+                    delay = self.RECONNECT_MIN_DELAY
+                    if item.get("type") != "message":
+                        continue
+                    channel = item["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode('utf-8')
+                    try:
+                        message = json.loads(item["data"])
+                    except (TypeError, ValueError) as e:
+                        print(f"Event bus skipping malformed message on {channel}: {str(e)}")
+                        continue
+                    await self._dispatch(channel[len(self.prefix):], message)
+                print("Event bus subscription closed, reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Event bus connection error: {str(e)}; reconnecting in {delay:g}s")
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+            try:
+                await self._resubscribe()
+            except Exception as e:
+                print(f"Event bus resubscribe failed: {str(e)}")
+
+    async def _resubscribe(self) -> None:
+        """Replace the pub/sub connection and subscribe to every channel again"""
+        old, self._pubsub = self._pubsub, self.client.pubsub()
+        try:
+            await old.close()
+        except Exception:
+            pass  # already broken
+        channels = [self.prefix + channel for channel in self.handlers]
+        if channels:
+            await self._pubsub.subscribe(*channels)
+
+
+class SQLiteEventBus(EventBus):
+    """Bus backed by an SQLite table, for several processes on one host.
+
+    Publishers append rows; each subscriber process polls for rows newer
+    than the last one it saw. Old rows are pruned after retention_seconds.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str, poll_interval: float = 0.05,
+                 retention_seconds: float = 300):
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._poller: Optional[asyncio.Task] = None
+        self._published = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, channel TEXT NOT NULL, "
+                "payload TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            # Only deliver events published after this process subscribed
+            self._last_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()[0]
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        # Counted here on the event loop; executor threads would race on it
+        self._published += 1
+        prune = self._published % self.PRUNE_EVERY == 0
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None, self._insert, channel, json.dumps(message, default=str), prune
+        )
+
+    async def subscribe(self, channel: str, handler: Handler) -> None:
+        await super().subscribe(channel, handler)
+        if self._poller is None:
+            self._poller = asyncio.create_task(self._poll())
+
+    async def close(self) -> None:
+        if self._poller:
+            self._poller.cancel()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _insert(self, channel: str, payload: str, prune: bool = False) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO events (channel, payload, created_at) VALUES (?, ?, ?)",
+                (channel, payload, time.time())
+            )
+            if prune:
+                conn.execute(
+                    "DELETE FROM events WHERE created_at < ?",
+                    (time.time() - self.retention_seconds,)
+                )
+
+    def _fetch_new(self) -> list:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT id, channel, payload FROM events WHERE id > ? ORDER BY id",
+                (self._last_id,)
+            ).fetchall()
+
+    async def _poll(self) -> None:
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                rows = await loop.run_in_executor(None, self._fetch_new)
+            except sqlite3.Error as e:
+                print(f"Event bus poll error: {str(e)}")
+                rows = []
+
+            for event_id, channel, payload in rows:
+                self._last_id = event_id
+                if channel not in self.handlers:
+                    continue
+                try:
+                    message = json.loads(payload)
+                except ValueError as e:
+                    print(f"Event bus skipping malformed event {event_id}: {str(e)}")
+                    continue
+                await self._dispatch(channel, message)
+
+            await asyncio.sleep(self.poll_interval)
+
+
+def create_event_bus(url: str) -> EventBus:
+    """
+    Create an event bus from a URL.
+
+    Args:
+        url (str): memory://, redis://host:port/db or sqlite:///path/to/events.db
+
+    Returns:
+        EventBus: Configured backend
+    """
+    if url.startswith("memory://"):
+        return InMemoryEventBus()
+    if url.startswith(("redis://", "rediss://")):
+        return RedisEventBus(url)
+    if url.startswith("sqlite:///"):
+        return SQLiteEventBus(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported event bus URL: {url}")
+
+
+_event_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide event bus configured by EVENT_BUS_URL."""
+    global _event_bus
+
+    if _event_bus is None:
+        from ..web.config import get_settings
+        _event_bus = create_event_bus(get_settings().event_bus_url)
+    return _event_bus
@@ -0,0 +1,183 @@
+"""Content-addressed cache for LLM generation results"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class GenerationCache:
+    """Disk-backed generation cache with size-bounded LRU eviction
+
+    Entries are keyed by a hash of the fully rendered prompt plus the model and
+    sampling parameters, so a hit is only possible when the provider would have
+    received an identical request.
+    """
+
+    def __init__(self, cache_dir: str = "cache/generations",
+                 max_size_bytes: int = 200 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+
+        # key -> entry size in bytes, ordered from least to most recently used
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(prompt: str, params: Dict[str, Any]) -> str:
+        """Build the cache key for a rendered prompt and its generation params"""
+        payload = json.dumps(
+            {"prompt": prompt, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached content for key, or None on a miss"""
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+
+            file_path = self._entry_path(key)
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                # Persist recency so LRU order survives restarts
+                os.utime(file_path, None)
+            except (OSError, ValueError):
+                self._forget(key)
+                self.misses += 1
+                return None
+
+            self._index.move_to_end(key)
+            self.hits += 1
+            return entry.get("content")
+
+    def set(self, key: str, content: str,
+            params: Optional[Dict[str, Any]] = None) -> None:
+        """Store generated content, evicting least recently used entries if needed"""
+        entry = {
+            "key": key,
+            "content": content,
+            "params": params or {},
+            "created_at": datetime.now().isoformat(),
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+        # Never cache something that could not fit on its own
+        if len(data) > self.max_size_bytes:
+            return
+
+        with self._lock:
+            file_path = self._entry_path(key)
+            tmp_path = file_path.with_suffix(".tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, file_path)
+            except OSError:
+                return
+
+            if key in self._index:
+                self._total_size -= self._index[key]
+            self._index[key] = len(data)
+            self._index.move_to_end(key)
+            self._total_size += len(data)
+
+            self._evict()
+
+    def delete(self, key: str) -> bool:
+        """Delete a cached entry"""
+        with self._lock:
+            if key not in self._index:
+                return False
+            self._forget(key)
+            return True
+
+    def clear(self) -> int:
+        """Remove all cached entries"""
+        with self._lock:
+            count = len(self._index)
+            for key in list(self._index):
+                self._forget(key)
+            return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "entries": len(self._index),
+            "size_bytes": self._total_size,
+            "max_size_bytes": self.max_size_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Rebuild the LRU index from the files already on disk"""
+        entries = []
+        for file_path in self.cache_dir.glob("*.json"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, file_path.stem, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_size += size
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the size bound"""
+        while self._total_size > self.max_size_bytes and self._index:
+            key = next(iter(self._index))
+            self._forget(key)
+            self.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        size = self._index.pop(key, 0)
+        self._total_size -= size
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            pass
+
+
+_generation_cache: Optional[GenerationCache] = None
+
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    """Get the process-wide generation cache, or None when disabled"""
+    global _generation_cache
+
+    from ..web.config import get_settings
+    settings = get_settings()
+
+    if not settings.generation_cache_enabled:
+        return None
+
+    if _generation_cache is None:
+        _generation_cache = GenerationCache(
+            cache_dir=settings.generation_cache_directory,
+            max_size_bytes=settings.generation_cache_max_mb * 1024 * 1024,
+        )
+    return _generation_cache
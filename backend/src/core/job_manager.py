@@ -2,14 +2,18 @@
 
 import asyncio
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Optional, Set
 from enum import Enum
 
 from ..models.schemas import JobStatus, JobResponse, JobCreateRequest
 from ..models.enums import JobStep
 from ..database.repositories.job_repository import JobRepository
+from ..database.write_buffer import get_job_progress_recorder, get_job_write_buffer
+from .job_registry import TERMINAL_JOB_STATUSES, get_job_registry
 from ..services.notification_service import NotificationService
+from ..services.stats_service import StatsService
+from ..web.config import get_settings
 
 
 class JobManager:
@@ -17,15 +21,26 @@ class JobManager:
     
     def __init__(self):
         self.active_jobs: Dict[str, asyncio.Task] = {}
-        self.job_registry: Dict[str, JobResponse] = {}
+        # Shared by every JobManager so they all see the same job objects
+        self.job_registry = get_job_registry()
         self.job_repository = JobRepository()
+        self.write_buffer = get_job_write_buffer()
+        self.progress_recorder = get_job_progress_recorder()
         self.notification_service = NotificationService()
+        self.stats_service = StatsService()
         self.max_concurrent_jobs = 5
+        self._batch_scheduler = None
         
     async def create_job(self, request: JobCreateRequest) -> str:
         """Create a new job and return job ID"""
         job_id = str(uuid.uuid4())
         
+        job_metadata = {}
+        if request.compression_ratio is not None:
+            job_metadata["compression_ratio"] = request.compression_ratio
+        if request.mode != "realtime":
+            job_metadata["mode"] = request.mode
+        
         # Create job record
         job = JobResponse(
             id=job_id,
@@ -48,12 +63,14 @@ class JobManager:
             error_code=None,
             retry_count=0,
             processing_time_seconds=None,
-            output_file_path=None
+            output_file_path=None,
+            job_metadata=job_metadata or None
         )
         
         # Save to database
         await self.job_repository.create(job)
         self.job_registry[job_id] = job
+        await self.stats_service.record_job_created(job)
         
         return job_id
     
@@ -77,6 +94,23 @@ class JobManager:
         
         return True
     
+    @property
+    def batch_scheduler(self):
+        """Lazy-loaded batch scheduler"""
+        if self._batch_scheduler is None:
+            from .batch_scheduler import BatchScheduler
+            self._batch_scheduler = BatchScheduler(self)
+        return self._batch_scheduler
+    
+    async def enqueue_batch_job(self, job_id: str) -> bool:
+        """Queue a batch-mode job for the next provider batch"""
+        job = self.job_registry.get(job_id)
+        if not job:
+            return False
+        
+        await self.batch_scheduler.enqueue(job_id, job.llm_provider)
+        return True
+    
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job"""
         if job_id in self.active_jobs:
@@ -91,23 +125,35 @@ class JobManager:
     
     async def get_job(self, job_id: str) -> Optional[JobResponse]:
         """Get job by ID"""
-        if job_id in self.job_registry:
-            return self.job_registry[job_id]
+        job = self.job_registry.get(job_id)
+        if job:
+            return job
         
-        # Try to load from database
-        job = await self.job_repository.get_by_id(job_id)
+        # Try to load from database, then from the archive
+        job = (await self.job_repository.get_by_id(job_id)
+               or await self.job_repository.get_archived(job_id))
         if job:
+            job = JobResponse.model_validate(job)
             self.job_registry[job_id] = job
         
         return job
     
     async def update_job_status(self, job_id: str, status: JobStatus, 
                               error_message: Optional[str] = None) -> None:
-        """Update job status and notify clients"""
-        if job_id not in self.job_registry:
+        """Update job status and notify clients
+        
+        Raises:
+            JobWriteError: A terminal status could not be saved; clients are
+                not told about a status the database does not have
+        """
+        job = await self.get_job(job_id)
+        if not job:
             return
-            
-        job = self.job_registry[job_id]
+        
+        # A job can be told it finished twice (cancel_job, then the task's
+        # CancelledError handler); only the first time counts in the stats
+        newly_finished = (status in TERMINAL_JOB_STATUSES
+                          and job.status not in TERMINAL_JOB_STATUSES)
         job.status = status
         job.updated_at = datetime.now()
         
@@ -125,8 +171,15 @@ class JobManager:
             if job_id in self.active_jobs:
                 del self.active_jobs[job_id]
         
-        # Save to database
-        await self.job_repository.update(job)
+        # Re-file in the registry (finished jobs become evictable), then save
+        # to database; terminal states are written before clients hear of them
+        self.job_registry[job_id] = job
+        terminal = status in TERMINAL_JOB_STATUSES
+        if terminal:
+            await self.progress_recorder.finish_job(job_id, status.value, error_message)
+        await self.write_buffer.put(job, flush=terminal)
+        if newly_finished:
+            await self.stats_service.record_job_finished(job)
         
         # Notify clients via WebSocket
         await self.notification_service.broadcast_job_update(job_id, {
@@ -135,10 +188,24 @@ class JobManager:
             "updated_at": job.updated_at.isoformat()
         })
     
-    async def cleanup_completed_jobs(self) -> None:
-        """Clean up old completed jobs"""
-        # This would implement cleanup logic
-        pass
+    async def cleanup_completed_jobs(self) -> int:
+        """Archive finished jobs older than the retention period
+        
+        Returns:
+            int: Number of jobs moved to the archive
+        """
+        settings = get_settings()
+        if settings.job_retention_days <= 0:
+            return 0
+        
+        cutoff = datetime.now() - timedelta(days=settings.job_retention_days)
+        archived = await self.job_repository.archive_jobs(cutoff, settings.job_archive_batch_size)
+        
+        for job_id, job in list(self.job_registry.items()):
+            if job.status in TERMINAL_JOB_STATUSES and job.created_at < cutoff:
+                self.job_registry.discard(job_id)
+        
+        return archived
     
     def get_active_job_count(self) -> int:
         """Get number of currently active jobs"""
@@ -0,0 +1,158 @@
+"""Process-wide in-memory cache of job state"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from ..models.schemas import JobResponse, JobStatus
+
+TERMINAL_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobRegistry:
+    """Job state cache shared by every JobManager in the process
+
+    Jobs that have not finished are pinned: the objects are mutated in place
+    while they run and must stay reachable. Finished jobs are kept in LRU
+    order and the least recently used are evicted beyond max_size; they can
+    always be reloaded from the database. Storing a job again re-files it,
+    so a status change to a terminal state makes it evictable.
+
+    A pinned job that has not been stored again for active_ttl seconds, or
+    the longest idle one once more than max_active are pinned, is unpinned
+    into the LRU. That covers jobs that will never finish here, such as
+    pending jobs that never got a slot or unfinished jobs loaded back from
+    the database after a crash. Code that holds a job object across a long
+    wait (such as a provider batch) must store it again before updating its
+    status, or the update applies to a copy reloaded from the database.
+    """
+
+    def __init__(self, max_size: int = 1000, max_active: Optional[int] = None,
+                 active_ttl: float = 3600, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.max_active = max_active if max_active is not None else max_size
+        self.active_ttl = active_ttl
+        self._clock = clock
+
+        # job_id -> unfinished job, ordered from least to most recently stored
+        self._active: "OrderedDict[str, JobResponse]" = OrderedDict()
+        # job_id -> clock time each pinned job was last stored
+        self._active_since: Dict[str, float] = {}
+        # job_id -> finished or unpinned job, least to most recently used
+        self._finished: "OrderedDict[str, JobResponse]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unpinned = 0
+
+    def get(self, job_id: str, default: Optional[JobResponse] = None) -> Optional[JobResponse]:
+        """Get a cached job, marking it recently used"""
+        job = self._active.get(job_id)
+        if job is None and job_id in self._finished:
+            self._finished.move_to_end(job_id)
+            job = self._finished[job_id]
+
+        if job is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return job
+
+    def put(self, job_id: str, job: JobResponse) -> None:
+        """Cache a job, or re-file it after its status changed"""
+        if job.status in TERMINAL_JOB_STATUSES:
+            self._unpin(job_id)
+            self._store_finished(job_id, job)
+        else:
+            self._finished.pop(job_id, None)
+            self._active[job_id] = job
+            self._active.move_to_end(job_id)
+            self._active_since[job_id] = self._clock()
+        self._expire_active()
+
+    def _store_finished(self, job_id: str, job: JobResponse) -> None:
+        self._finished[job_id] = job
+        self._finished.move_to_end(job_id)
+        while len(self._finished) > self.max_size:
+            self._finished.popitem(last=False)
+            self.evictions += 1
+
+    def _unpin(self, job_id: str) -> None:
+        self._active.pop(job_id, None)
+        self._active_since.pop(job_id, None)
+
+    def _expire_active(self) -> None:
+        """Unpin jobs idle past active_ttl, and the idlest beyond max_active"""
+        cutoff = self._clock() - self.active_ttl
+        while self._active:
+            job_id = next(iter(self._active))
+            if len(self._active) <= self.max_active and self._active_since[job_id] > cutoff:
+                break
+            job = self._active[job_id]
+            self._unpin(job_id)
+            self._store_finished(job_id, job)
+            self.unpinned += 1
+
+    def discard(self, job_id: str) -> None:
+        """Forget a job, e.g. after it was archived or deleted"""
+        self._unpin(job_id)
+        self._finished.pop(job_id, None)
+
+    def clear(self) -> None:
+        self._active.clear()
+        self._active_since.clear()
+        self._finished.clear()
+
+    def items(self) -> Iterator[Tuple[str, JobResponse]]:
+        yield from self._active.items()
+        yield from self._finished.items()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "active": len(self._active),
+            "finished": len(self._finished),
+            "max_size": self.max_size,
+            "max_active": self.max_active,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "unpinned": self.unpinned,
+        }
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._active or job_id in self._finished
+
+    def __getitem__(self, job_id: str) -> JobResponse:
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def __setitem__(self, job_id: str, job: JobResponse) -> None:
+        self.put(job_id, job)
+
+    def __delitem__(self, job_id: str) -> None:
+        if job_id not in self:
+            raise KeyError(job_id)
+        self.discard(job_id)
+
+    def __len__(self) -> int:
+        return len(self._active) + len(self._finished)
+
+
+# Global registry instance, created on first use
+_job_registry: Optional[JobRegistry] = None
+
+
+def get_job_registry() -> JobRegistry:
+    """Get the process-wide job registry"""
+    global _job_registry
+
+    if _job_registry is None:
+        from ..web.config import get_settings
+        settings = get_settings()
+        _job_registry = JobRegistry(max_size=settings.job_registry_max_size,
+                                    active_ttl=settings.job_registry_active_ttl_seconds)
+    return _job_registry
@@ -3,9 +3,20 @@ LLM Provider Integrations
 Support for multiple AI providers to generate blog content.
 """
 
+import hashlib
+import itertools
+import json
+import math
 import os
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterator, Optional, Type
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 try:
     import openai
@@ -22,13 +33,25 @@ try:
 except ImportError:
     genai = None
 
-class LLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+class ProviderBase:
+    """Prompt construction and generation parameters shared by all providers."""
     
-    @abstractmethod
-    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
-        """Generate blog content from transcript."""
-        pass
+    # Tokenizer family used for local token estimates
+    provider_family: str = "generic"
+    
+    # Generation parameters; providers override these with their own defaults
+    model_name: str = ""
+    max_tokens: Optional[int] = 2000
+    temperature: Optional[float] = 0.7
+    
+    def get_generation_params(self) -> dict:
+        """Return the model and sampling parameters that shape the output."""
+        return {
+            "provider": self.__class__.__name__,
+            "model": self.model_name,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+        }
     
     def create_blog_prompt(self, transcript: str, title: str, url: str) -> str:
         """Create a standardized prompt for blog generation."""
@@ -69,9 +92,55 @@ Transcript:
 Generate a Medium-ready blog post with strategic image placement prompts:
 """
 
+    def create_chunk_notes_prompt(self, transcript_chunk: str, title: str,
+                                  part: int, total_parts: int) -> str:
+        """Create a prompt that condenses one part of a long transcript into notes."""
+        return f"""
+The following is part {part} of {total_parts} of a YouTube video transcript.
+
+Video Title: {title}
+
+Condense this part into detailed notes for a blog writer. Keep every key idea, example, number and quotable phrase in the order they appear. Use short bullet points and do not add commentary.
+
+Transcript part:
+{transcript_chunk}
+
+Notes:
+"""
+
+class LLMProvider(ProviderBase, ABC):
+    """Abstract base class for LLM providers."""
+    
+    # Total tokens reported by the provider for the most recent call, if any
+    last_usage: Optional[int] = None
+    
+    @abstractmethod
+    def complete(self, prompt: str) -> Optional[str]:
+        """Send a fully rendered prompt to the provider and return its reply."""
+        pass
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield the reply in chunks; providers without streaming yield it whole."""
+        content = self.complete(prompt)
+        if content:
+            yield content
+    
+    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
+        """Generate blog content from transcript."""
+        return self.complete(self.create_blog_prompt(transcript, title, url))
+    
+    def _record_usage(self, *token_counts) -> None:
+        """Remember provider-reported token usage when it is available."""
+        if token_counts and all(isinstance(count, int) for count in token_counts):
+            self.last_usage = sum(token_counts)
+        else:
+            self.last_usage = None
+
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider."""
     
+    provider_family = "openai"
+    
     def __init__(self):
         if not openai:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
@@ -81,22 +150,23 @@ class OpenAIProvider(LLMProvider):
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         self.client = openai.OpenAI(api_key=api_key)
+        self.model_name = "gpt-4.1"
     
-    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
+    def complete(self, prompt: str) -> Optional[str]:
         """Generate blog using OpenAI GPT."""
         try:
-            prompt = self.create_blog_prompt(transcript, title, url)
-            
             response = self.client.chat.completions.create(
-                model="gpt-4.1",
+                model=self.model_name,
                 messages=[
                     {"role": "system", "content": "You are an expert content writer who creates engaging blog posts from video transcripts."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=2000,
-                temperature=0.7
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
             )
             
+            usage = getattr(response, "usage", None)
+            self._record_usage(getattr(usage, "total_tokens", None))
             return response.choices[0].message.content
             
         except Exception as e:
@@ -106,6 +176,8 @@ class OpenAIProvider(LLMProvider):
 class AzureOpenAIProvider(LLMProvider):
     """Azure OpenAI provider."""
     
+    provider_family = "openai"
+    
     def __init__(self):
         if not openai:
             raise ImportError("OpenAI package not installed. Run: pip install openai")
@@ -127,22 +199,23 @@ class AzureOpenAIProvider(LLMProvider):
         
         # Use deployment name from environment, default to gpt-4
         self.deployment_name = os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME', 'gpt-4.1')
+        self.model_name = self.deployment_name
     
-    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
+    def complete(self, prompt: str) -> Optional[str]:
         """Generate blog using Azure OpenAI."""
         try:
-            prompt = self.create_blog_prompt(transcript, title, url)
-            
             response = self.client.chat.completions.create(
-                model=self.deployment_name,
+                model=self.model_name,
                 messages=[
                     {"role": "system", "content": "You are an expert content writer who creates engaging blog posts from video transcripts."},
                     {"role": "user", "content": prompt}
                 ],
-                max_completion_tokens=2000,
-                temperature=0.7
+                max_completion_tokens=self.max_tokens,
+                temperature=self.temperature
             )
             
+            usage = getattr(response, "usage", None)
+            self._record_usage(getattr(usage, "total_tokens", None))
             return response.choices[0].message.content
             
         except Exception as e:
@@ -152,6 +225,11 @@ class AzureOpenAIProvider(LLMProvider):
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude provider."""
     
+    provider_family = "anthropic"
+    
+    # Claude is called with the API's default temperature
+    temperature = None
+    
     def __init__(self):
         if not anthropic:
             raise ImportError("Anthropic package not installed. Run: pip install anthropic")
@@ -161,20 +239,24 @@ class ClaudeProvider(LLMProvider):
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
         
         self.client = anthropic.Anthropic(api_key=api_key)
+        self.model_name = "claude-3-sonnet-20240229"
     
-    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
+    def complete(self, prompt: str) -> Optional[str]:
         """Generate blog using Claude."""
         try:
-            prompt = self.create_blog_prompt(transcript, title, url)
-            
             response = self.client.messages.create(
-                model="claude-3-sonnet-20240229",
-                max_tokens=2000,
+                model=self.model_name,
+                max_tokens=self.max_tokens,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
             
+            usage = getattr(response, "usage", None)
+            self._record_usage(
+                getattr(usage, "input_tokens", None),
+                getattr(usage, "output_tokens", None)
+            )
             return response.content[0].text
             
         except Exception as e:
@@ -184,6 +266,12 @@ class ClaudeProvider(LLMProvider):
 class GeminiProvider(LLMProvider):
     """Google Gemini provider."""
     
+    provider_family = "google"
+    
+    # Gemini is called with the model's default generation config
+    max_tokens = None
+    temperature = None
+    
     def __init__(self):
         if not genai:
             raise ImportError("Google AI package not installed. Run: pip install google-generativeai")
@@ -193,35 +281,393 @@ class GeminiProvider(LLMProvider):
             raise ValueError("GOOGLE_API_KEY environment variable not set")
         
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        self.model_name = 'gemini-pro'
+        self.model = genai.GenerativeModel(self.model_name)
     
-    def generate_blog(self, transcript: str, title: str, url: str) -> Optional[str]:
+    def complete(self, prompt: str) -> Optional[str]:
         """Generate blog using Gemini."""
         try:
-            prompt = self.create_blog_prompt(transcript, title, url)
-            
             response = self.model.generate_content(prompt)
+            
+            usage = getattr(response, "usage_metadata", None)
+            self._record_usage(getattr(usage, "total_token_count", None))
             return response.text
             
         except Exception as e:
             print(f"Gemini API error: {str(e)}")
             return None
 
+class FakeProvider(LLMProvider):
+    """Deterministic offline provider for load testing and benchmarks.
+    
+    Output depends only on the prompt, so identical prompts always produce
+    identical posts. Latency, streaming rate and failures are drawn from a
+    seeded RNG and configured through FAKE_LLM_* environment variables or
+    constructor arguments.
+    """
+    
+    LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+    
+    # Instances created from the same seed draw distinct but repeatable sequences
+    _instance_counter = itertools.count()
+    
+    def __init__(self, latency_ms: Optional[float] = None,
+                 latency_jitter_ms: Optional[float] = None,
+                 latency_distribution: Optional[str] = None,
+                 chunk_rate: Optional[float] = None,
+                 chunk_size: Optional[int] = None,
+                 failure_rate: Optional[float] = None,
+                 seed: Optional[int] = None):
+        self.latency_ms = _env_number(latency_ms, 'FAKE_LLM_LATENCY_MS', 500.0)
+        self.latency_jitter_ms = _env_number(latency_jitter_ms, 'FAKE_LLM_LATENCY_JITTER_MS', 0.0)
+        self.latency_distribution = (
+            latency_distribution or os.getenv('FAKE_LLM_LATENCY_DISTRIBUTION', 'fixed')
+        ).lower()
+        self.chunk_rate = _env_number(chunk_rate, 'FAKE_LLM_CHUNK_RATE', 50.0)
+        self.chunk_size = int(_env_number(chunk_size, 'FAKE_LLM_CHUNK_SIZE', 64))
+        self.failure_rate = _env_number(failure_rate, 'FAKE_LLM_FAILURE_RATE', 0.0)
+        seed = seed if seed is not None else os.getenv('FAKE_LLM_SEED')
+        
+        if self.latency_distribution not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unsupported latency distribution: {self.latency_distribution}")
+        if not 0 <= self.failure_rate <= 1:
+            raise ValueError("FAKE_LLM_FAILURE_RATE must be between 0 and 1")
+        
+        instance = next(self._instance_counter)
+        self.rng = random.Random(f"{seed}:{instance}" if seed is not None else None)
+        self.model_name = os.getenv('FAKE_LLM_MODEL', 'fake-model')
+        self.calls = 0
+        self.failures = 0
+    
+    def sample_latency(self) -> float:
+        """Draw one response latency in seconds."""
+        mean, jitter = self.latency_ms, self.latency_jitter_ms
+        if self.latency_distribution == "uniform":
+            latency = self.rng.uniform(mean - jitter, mean + jitter)
+        elif self.latency_distribution == "lognormal" and mean > 0:
+            # Long right tail like real APIs; jitter is the standard deviation
+            sigma_squared = math.log(1 + (jitter / mean) ** 2)
+            mu = math.log(mean) - sigma_squared / 2
+            latency = self.rng.lognormvariate(mu, math.sqrt(sigma_squared))
+        else:
+            latency = mean
+        return max(latency, 0.0) / 1000
+    
+    def complete(self, prompt: str) -> Optional[str]:
+        """Generate a deterministic blog post after the configured latency."""
+        chunks = list(self.stream(prompt))
+        return "".join(chunks) if chunks else None
+    
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield the post in chunks at the configured rate."""
+        self.calls += 1
+        time.sleep(self.sample_latency())
+        
+        if self.rng.random() < self.failure_rate:
+            self.failures += 1
+            print("Fake LLM error: injected failure")
+            self._record_usage(None)
+            return
+        
+        content = self.render(prompt)
+        self._record_usage(len(prompt) // 4, len(content) // 4)
+        
+        delay = 1 / self.chunk_rate if self.chunk_rate > 0 else 0
+        for start in range(0, len(content), self.chunk_size):
+            if delay and start:
+                time.sleep(delay)
+            yield content[start:start + self.chunk_size]
+    
+    @staticmethod
+    def render(prompt: str) -> str:
+        """Build the post for a prompt; same prompt, same post."""
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        title = "Untitled Video"
+        for line in prompt.splitlines():
+            if line.startswith("Video Title:"):
+                title = line.split(":", 1)[1].strip() or title
+                break
+        
+        sections = []
+        for index in range(3):
+            key = digest[index * 8:(index + 1) * 8]
+            sections.append(
+                f"## Key Point {index + 1}\n\n"
+                f"Insight {key} from the video, explained with an example "
+                f"and a practical takeaway for readers.\n"
+            )
+        
+        return (
+            f"# {title}\n\n"
+            f"[IMAGE_PROMPT: Hero image for {title}]\n\n"
+            f"An engaging introduction to {title}.\n\n"
+            + "\n".join(sections)
+            + f"\n## Conclusion\n\nGenerated offline ({digest[:12]}).\n"
+        )
+
+def _env_number(value, env_name: str, default: float) -> float:
+    """Resolve a numeric setting from an argument, environment variable or default."""
+    if value is not None:
+        return float(value)
+    return float(os.getenv(env_name, default))
+
+class BatchProvider(ProviderBase, ABC):
+    """Abstract base class for provider batch interfaces.
+    
+    Batch endpoints trade latency (results within hours) for lower cost and
+    separate rate limits. Requests are keyed by a caller-chosen custom ID.
+    """
+    
+    default_base_url: str = ""
+    
+    # Normalized batch states
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    
+    def __init__(self, api_key: str, base_url: Optional[str] = None,
+                 model_name: Optional[str] = None, timeout: float = 60.0):
+        if not httpx:
+            raise ImportError("httpx package not installed. Run: pip install httpx")
+        
+        self.api_key = api_key
+        self.base_url = (base_url or self.default_base_url).rstrip('/')
+        if model_name:
+            self.model_name = model_name
+        self.client = httpx.Client(base_url=self.base_url, headers=self._headers(),
+                                   timeout=timeout)
+    
+    def _headers(self) -> Dict[str, str]:
+        return {}
+    
+    @abstractmethod
+    def submit_batch(self, prompts: Dict[str, str],
+                     max_tokens: Optional[Dict[str, int]] = None) -> str:
+        """Submit prompts keyed by custom ID and return the batch ID.
+        
+        max_tokens optionally overrides the output budget per custom ID.
+        """
+        pass
+    
+    @abstractmethod
+    def get_batch_status(self, batch_id: str) -> str:
+        """Return the normalized state of a batch."""
+        pass
+    
+    @abstractmethod
+    def get_batch_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """Return generated content keyed by custom ID (None for failed requests)."""
+        pass
+    
+    def close(self) -> None:
+        self.client.close()
+    
+    @staticmethod
+    def _parse_jsonl(text: str) -> list:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+class OpenAIBatchProvider(BatchProvider):
+    """OpenAI Batch API (/v1/batches) over chat completions."""
+    
+    provider_family = "openai"
+    default_base_url = "https://api.openai.com/v1"
+    model_name = "gpt-4.1"
+    
+    _STATUS = {
+        "validating": BatchProvider.IN_PROGRESS,
+        "in_progress": BatchProvider.IN_PROGRESS,
+        "finalizing": BatchProvider.IN_PROGRESS,
+        "cancelling": BatchProvider.IN_PROGRESS,
+        "completed": BatchProvider.COMPLETED,
+    }
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model_name: Optional[str] = None, timeout: float = 60.0):
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY environment variable not set")
+        super().__init__(api_key, base_url or os.getenv('OPENAI_BASE_URL'), model_name, timeout)
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+    
+    def submit_batch(self, prompts: Dict[str, str],
+                     max_tokens: Optional[Dict[str, int]] = None) -> str:
+        """Upload a JSONL request file and create a batch over it."""
+        max_tokens = max_tokens or {}
+        lines = []
+        for custom_id, prompt in prompts.items():
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model_name,
+                    "messages": [
+                        {"role": "system", "content": "You are an expert content writer who creates engaging blog posts from video transcripts."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": max_tokens.get(custom_id, self.max_tokens),
+                    "temperature": self.temperature,
+                },
+            }))
+        
+        upload = self.client.post(
+            "/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", "\n".join(lines).encode('utf-8'), "application/jsonl")},
+        )
+        upload.raise_for_status()
+        
+        batch = self.client.post("/batches", json={
+            "input_file_id": upload.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        })
+        batch.raise_for_status()
+        return batch.json()["id"]
+    
+    def get_batch_status(self, batch_id: str) -> str:
+        response = self.client.get(f"/batches/{batch_id}")
+        response.raise_for_status()
+        return self._STATUS.get(response.json()["status"], self.FAILED)
+    
+    def get_batch_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        batch = self.client.get(f"/batches/{batch_id}")
+        batch.raise_for_status()
+        output_file_id = batch.json().get("output_file_id")
+        if not output_file_id:
+            return {}
+        
+        content = self.client.get(f"/files/{output_file_id}/content")
+        content.raise_for_status()
+        
+        results = {}
+        for entry in self._parse_jsonl(content.text):
+            response = entry.get("response") or {}
+            if entry.get("error") or response.get("status_code") != 200:
+                print(f"OpenAI batch error for {entry.get('custom_id')}: {entry.get('error')}")
+                results[entry["custom_id"]] = None
+                continue
+            results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
+
+class AnthropicBatchProvider(BatchProvider):
+    """Anthropic Message Batches API (/v1/messages/batches)."""
+    
+    provider_family = "anthropic"
+    default_base_url = "https://api.anthropic.com/v1"
+    model_name = "claude-3-sonnet-20240229"
+    temperature = None
+    
+    API_VERSION = "2023-06-01"
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 model_name: Optional[str] = None, timeout: float = 60.0):
+        api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        super().__init__(api_key, base_url or os.getenv('ANTHROPIC_BASE_URL'), model_name, timeout)
+    
+    def _headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": self.API_VERSION}
+    
+    def submit_batch(self, prompts: Dict[str, str],
+                     max_tokens: Optional[Dict[str, int]] = None) -> str:
+        max_tokens = max_tokens or {}
+        requests = [
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model_name,
+                    "max_tokens": max_tokens.get(custom_id, self.max_tokens),
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            }
+            for custom_id, prompt in prompts.items()
+        ]
+        response = self.client.post("/messages/batches", json={"requests": requests})
+        response.raise_for_status()
+        return response.json()["id"]
+    
+    def get_batch_status(self, batch_id: str) -> str:
+        response = self.client.get(f"/messages/batches/{batch_id}")
+        response.raise_for_status()
+        if response.json()["processing_status"] == "ended":
+            return self.COMPLETED
+        return self.IN_PROGRESS
+    
+    def get_batch_results(self, batch_id: str) -> Dict[str, Optional[str]]:
+        batch = self.client.get(f"/messages/batches/{batch_id}")
+        batch.raise_for_status()
+        results_url = batch.json().get("results_url")
+        if not results_url:
+            return {}
+        
+        content = self.client.get(results_url)
+        content.raise_for_status()
+        
+        results = {}
+        for entry in self._parse_jsonl(content.text):
+            result = entry.get("result") or {}
+            if result.get("type") != "succeeded":
+                print(f"Claude batch error for {entry.get('custom_id')}: {result.get('type')}")
+                results[entry["custom_id"]] = None
+                continue
+            results[entry["custom_id"]] = result["message"]["content"][0]["text"]
+        return results
+
 class LLMProviderFactory:
     """Factory class to create LLM providers."""
     
-    @staticmethod
-    def create_provider(provider_name: str) -> LLMProvider:
+    _providers: Dict[str, Type[LLMProvider]] = {
+        'openai': OpenAIProvider,
+        'azureopenai': AzureOpenAIProvider,
+        'claude': ClaudeProvider,
+        'gemini': GeminiProvider,
+        'fake': FakeProvider,
+    }
+    
+    # API provider identifiers mapped to the provider that serves them
+    _aliases: Dict[str, str] = {
+        'anthropic': 'claude',
+        'google': 'gemini',
+    }
+    
+    _batch_providers: Dict[str, Type[BatchProvider]] = {
+        'openai': OpenAIBatchProvider,
+        'claude': AnthropicBatchProvider,
+    }
+    
+    @classmethod
+    def register_provider(cls, provider_name: str, provider_class: Type[LLMProvider]) -> None:
+        """Register an additional provider under a name."""
+        cls._providers[provider_name.lower()] = provider_class
+    
+    @classmethod
+    def create_provider(cls, provider_name: str) -> LLMProvider:
         """Create an LLM provider instance."""
         provider_name = provider_name.lower()
+        provider_name = cls._aliases.get(provider_name, provider_name)
         
-        if provider_name == 'openai':
-            return OpenAIProvider()
-        elif provider_name == 'azureopenai':
-            return AzureOpenAIProvider()
-        elif provider_name == 'claude':
-            return ClaudeProvider()
-        elif provider_name == 'gemini':
-            return GeminiProvider()
-        else:
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None:
             raise ValueError(f"Unsupported provider: {provider_name}")
+        return provider_class()
+    
+    @classmethod
+    def supports_batch(cls, provider_name: str) -> bool:
+        """Check whether a provider has a batch interface."""
+        provider_name = provider_name.lower()
+        return cls._aliases.get(provider_name, provider_name) in cls._batch_providers
+    
+    @classmethod
+    def create_batch_provider(cls, provider_name: str) -> BatchProvider:
+        """Create a batch interface for a provider."""
+        provider_name = provider_name.lower()
+        provider_name = cls._aliases.get(provider_name, provider_name)
+        
+        provider_class = cls._batch_providers.get(provider_name)
+        if provider_class is None:
+            raise ValueError(f"Provider does not support batch mode: {provider_name}")
+        return provider_class()
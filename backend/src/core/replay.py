@@ -0,0 +1,165 @@
+"""
+Record/Replay Layer
+Capture YouTube transcript and oEmbed responses to disk and serve them back
+offline, so end-to-end benchmarks run without network access.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+REPLAY_MODES = ("off", "record", "replay")
+
+
+class ReplayMissError(Exception):
+    """Raised in replay mode when no recording exists for a call."""
+
+
+class ReplayStore:
+    """Cassette directory holding one JSON file per recorded call."""
+
+    def __init__(self, cassette_dir: str = "cassettes", mode: str = "off"):
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unsupported replay mode: {mode}")
+
+        self.cassette_dir = Path(cassette_dir)
+        self.mode = mode
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(name: str, call_args: Dict[str, Any]) -> str:
+        """
+        Derive a stable key for a call.
+
+        Args:
+            name (str): Recorded operation name
+            call_args (Dict[str, Any]): Arguments that determine the response
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        payload = json.dumps({"name": name, "args": call_args}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def load(self, name: str, call_args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Load a recorded call.
+
+        Args:
+            name (str): Recorded operation name
+            call_args (Dict[str, Any]): Arguments that determine the response
+
+        Returns:
+            Dict[str, Any]: Recording with either a 'result' or an 'error'
+
+        Raises:
+            ReplayMissError: If the call was never recorded
+        """
+        path = self._entry_path(name, call_args)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise ReplayMissError(f"No recording for {name} {call_args} in {self.cassette_dir}")
+
+    def save(self, name: str, call_args: Dict[str, Any], result: Any = None,
+             error: Optional[str] = None) -> Path:
+        """
+        Record the outcome of a call.
+
+        Args:
+            name (str): Recorded operation name
+            call_args (Dict[str, Any]): Arguments that determine the response
+            result (Any): JSON-serializable return value
+            error (Optional[str]): Error message if the call raised
+
+        Returns:
+            Path: Path of the written recording
+        """
+        path = self._entry_path(name, call_args)
+        entry = {"name": name, "args": call_args}
+        if error is not None:
+            entry["error"] = error
+        else:
+            entry["result"] = result
+
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        return path
+
+    def _entry_path(self, name: str, call_args: Dict[str, Any]) -> Path:
+        return self.cassette_dir / name / f"{self.make_key(name, call_args)}.json"
+
+
+_store: Optional[ReplayStore] = None
+_store_config: Optional[Tuple[str, str]] = None
+
+
+def get_replay_store() -> ReplayStore:
+    """Get the store for the current YOUTUBE_REPLAY_MODE / YOUTUBE_REPLAY_DIR."""
+    global _store, _store_config
+
+    config = (
+        os.getenv('YOUTUBE_REPLAY_MODE', 'off').lower(),
+        os.getenv('YOUTUBE_REPLAY_DIR', 'cassettes'),
+    )
+    if _store is None or config != _store_config:
+        _store = ReplayStore(cassette_dir=config[1], mode=config[0])
+        _store_config = config
+    return _store
+
+
+def replayable(name: str, key_args: Tuple[str, ...]) -> Callable:
+    """
+    Make a network-bound function recordable and replayable.
+
+    Only the arguments named in key_args identify a recording, so
+    credentials and output options never end up in cassettes. Errors are
+    recorded too and raised again on replay.
+
+    Args:
+        name (str): Operation name used as the cassette subdirectory
+        key_args (Tuple[str, ...]): Arguments that determine the response
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = get_replay_store()
+            if store.mode == "off":
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = {arg: bound.arguments[arg] for arg in key_args}
+
+            if store.mode == "replay":
+                entry = store.load(name, call_args)
+                if "error" in entry:
+                    raise Exception(entry["error"])
+                return entry["result"]
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                store.save(name, call_args, error=str(e))
+                raise
+            store.save(name, call_args, result=result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,278 @@
+"""
+Token Estimation and Prompt Budget Planning
+Estimate prompt sizes locally and decide how a transcript fits a model's context window.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Average characters per token for English text, calibrated per tokenizer family
+CHARS_PER_TOKEN = {
+    "openai": 4.0,
+    "anthropic": 3.5,
+    "google": 4.0,
+    "generic": 3.5,
+}
+
+# (context window, maximum output tokens) by model name; matched by longest prefix
+MODEL_LIMITS = {
+    "gpt-4.1": (1047576, 32768),
+    "gpt-4o": (128000, 16384),
+    "gpt-4-turbo": (128000, 4096),
+    "gpt-4": (8192, 4096),
+    "gpt-3.5-turbo": (16385, 4096),
+    "claude-3-haiku": (200000, 4096),
+    "claude-3-sonnet": (200000, 4096),
+    "claude-3-opus": (200000, 4096),
+    "gemini-pro": (30720, 2048),
+}
+DEFAULT_MODEL_LIMITS = (8192, 2048)
+
+# Tokens held back for chat formatting, system prompt and estimation error
+SAFETY_MARGIN_TOKENS = 256
+DEFAULT_OUTPUT_TOKENS = 2000
+MIN_OUTPUT_TOKENS = 1024
+
+# Truncate rather than chunk when at most this share of the transcript is lost
+MAX_TRUNCATION_RATIO = 0.2
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+
+def get_model_limits(model: Optional[str]) -> Tuple[int, int]:
+    """
+    Get context window and output limits for a model.
+
+    Args:
+        model (Optional[str]): Model or deployment name
+
+    Returns:
+        Tuple[int, int]: (context window tokens, maximum output tokens)
+    """
+    if not model:
+        return DEFAULT_MODEL_LIMITS
+
+    model = model.lower()
+    for prefix in sorted(MODEL_LIMITS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_LIMITS[prefix]
+
+    return DEFAULT_MODEL_LIMITS
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(family: str, model: Optional[str]):
+    """Load a local tokenizer for the family, or None to fall back to heuristics"""
+    if tiktoken is None or family != "openai":
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model or "gpt-4o")
+    except Exception:
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # Encoding files unavailable offline
+            return None
+
+
+def count_tokens(text: str, family: str = "generic", model: Optional[str] = None) -> int:
+    """
+    Count or estimate the number of tokens in text.
+
+    Uses the provider's tokenizer when it is installed locally, otherwise a
+    heuristic calibrated on English text for the provider family. Non-ASCII
+    characters are counted as one token each to stay conservative for
+    non-Latin scripts.
+
+    Args:
+        text (str): Text to measure
+        family (str): Provider family (openai, anthropic, google, generic)
+        model (Optional[str]): Model name, used to pick the exact tokenizer
+
+    Returns:
+        int: Token count (estimated when no tokenizer is available)
+    """
+    if not text:
+        return 0
+
+    encoding = _get_encoding(family, model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    chars_per_token = CHARS_PER_TOKEN.get(family, CHARS_PER_TOKEN["generic"])
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    ascii_chars = len(text) - non_ascii
+
+    return int(ascii_chars / chars_per_token + 0.999) + non_ascii
+
+
+def truncate_to_tokens(text: str, max_tokens: int, family: str = "generic",
+                       model: Optional[str] = None) -> str:
+    """
+    Truncate text so that it fits within a token budget.
+
+    Args:
+        text (str): Text to truncate
+        max_tokens (int): Token budget
+        family (str): Provider family
+        model (Optional[str]): Model name
+
+    Returns:
+        str: Text cut at a word boundary that fits the budget
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, family, model) <= max_tokens:
+        return text
+
+    encoding = _get_encoding(family, model)
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return encoding.decode(tokens[:max_tokens]).rstrip()
+
+    chars_per_token = CHARS_PER_TOKEN.get(family, CHARS_PER_TOKEN["generic"])
+    truncated = text[:int(max_tokens * chars_per_token)]
+    while truncated and count_tokens(truncated, family, model) > max_tokens:
+        truncated = truncated[:int(len(truncated) * 0.9)]
+
+    # Don't end mid-word
+    if ' ' in truncated:
+        truncated = truncated[:truncated.rfind(' ')]
+
+    return truncated.rstrip()
+
+
+def split_into_chunks(text: str, chunk_tokens: int, family: str = "generic",
+                      model: Optional[str] = None) -> List[str]:
+    """
+    Split text into chunks that each fit a token budget.
+
+    Sentences are kept whole where possible; auto-generated captions often
+    have no punctuation, so overlong sentences are split on word boundaries.
+
+    Args:
+        text (str): Text to split
+        chunk_tokens (int): Token budget per chunk
+        family (str): Provider family
+        model (Optional[str]): Model name
+
+    Returns:
+        List[str]: Chunks in original order
+    """
+    if chunk_tokens <= 0:
+        raise ValueError("chunk_tokens must be positive")
+
+    units = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        if count_tokens(sentence, family, model) <= chunk_tokens:
+            units.append(sentence)
+            continue
+
+        remaining = sentence
+        while remaining:
+            piece = truncate_to_tokens(remaining, chunk_tokens, family, model)
+            if not piece:
+                # A single word longer than the budget
+                piece = remaining.split(' ', 1)[0]
+            units.append(piece)
+            remaining = remaining[len(piece):].lstrip()
+
+    chunks = []
+    current: List[str] = []
+    current_tokens = 0
+    for unit in units:
+        # +1 for the joining space
+        unit_tokens = count_tokens(unit, family, model) + 1
+        if current and current_tokens + unit_tokens > chunk_tokens:
+            chunks.append(' '.join(current))
+            current, current_tokens = [], 0
+        current.append(unit)
+        current_tokens += unit_tokens
+
+    if current:
+        chunks.append(' '.join(current))
+
+    return chunks
+
+
+def plan_prompt_budget(provider, transcript: str, title: str, url: str,
+                       output_tokens: Optional[int] = None,
+                       allow_chunking: bool = True) -> Dict:
+    """
+    Decide how a transcript should be sent to a provider before uploading it.
+
+    Strategies:
+    - "full": the whole transcript fits (the output budget may be reduced)
+    - "truncate": the transcript overflows slightly and is cut to fit
+    - "chunk": the transcript is far too long and must be condensed in parts
+
+    Args:
+        provider: LLMProvider instance the prompt is destined for
+        transcript (str): Transcript text
+        title (str): Video title
+        url (str): Video URL
+        output_tokens (Optional[int]): Desired output budget (defaults to the provider's)
+        allow_chunking (bool): When False, overflowing transcripts are always truncated
+
+    Returns:
+        Dict: Plan with strategy, token counts, output budget and the transcript
+            text or chunks to send
+    """
+    family = getattr(provider, "provider_family", "generic")
+    model = getattr(provider, "model_name", None)
+    context_window, model_max_output = get_model_limits(model)
+
+    overhead_tokens = count_tokens(provider.create_blog_prompt("", title, url), family, model)
+    transcript_tokens = count_tokens(transcript, family, model)
+
+    desired_output = output_tokens or getattr(provider, "max_tokens", None) or DEFAULT_OUTPUT_TOKENS
+    desired_output = min(desired_output, model_max_output)
+
+    input_budget = context_window - SAFETY_MARGIN_TOKENS - overhead_tokens
+    transcript_budget = input_budget - desired_output
+    if transcript_budget <= 0:
+        raise ValueError(
+            f"Prompt template and output budget exceed the {context_window} token "
+            f"context window of {model or 'the default model'}"
+        )
+
+    plan = {
+        "strategy": "full",
+        "provider_family": family,
+        "model": model,
+        "context_window": context_window,
+        "transcript_tokens": transcript_tokens,
+        "prompt_tokens": overhead_tokens + transcript_tokens,
+        "max_output_tokens": desired_output,
+        "transcript": transcript,
+        "chunks": [],
+    }
+
+    if transcript_tokens <= transcript_budget:
+        return plan
+
+    # Give up some output budget before dropping any transcript
+    min_output = min(MIN_OUTPUT_TOKENS, desired_output)
+    if transcript_tokens + min_output <= input_budget:
+        plan["max_output_tokens"] = input_budget - transcript_tokens
+        return plan
+
+    kept_ratio = transcript_budget / transcript_tokens
+    if not allow_chunking or kept_ratio >= 1 - MAX_TRUNCATION_RATIO:
+        truncated = truncate_to_tokens(transcript, transcript_budget, family, model)
+        plan["strategy"] = "truncate"
+        plan["transcript"] = truncated
+        plan["prompt_tokens"] = overhead_tokens + count_tokens(truncated, family, model)
+        return plan
+
+    plan["strategy"] = "chunk"
+    plan["transcript"] = None
+    plan["chunks"] = split_into_chunks(transcript, transcript_budget, family, model)
+    return plan
@@ -0,0 +1,294 @@
+"""
+Transcript Compressor
+Local, CPU-only extractive compression of transcripts before prompt construction.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .token_budget import count_tokens
+from .utils import clean_text
+
+# Single-word hesitations that carry no content
+FILLER_WORDS = re.compile(
+    r"\b(?:u+m+|u+h+|uhm|erm|er|ah|hmm+|mhm|mm+(?:-hmm)?)\b[,.]?\s*",
+    re.IGNORECASE
+)
+
+# Verbal tics; only stripped when set off by commas to avoid eating real content
+FILLER_PHRASES = re.compile(
+    r",?\s*\b(?:you know|i mean|sort of|kind of|like)\b\s*,\s*",
+    re.IGNORECASE
+)
+
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each few for from further had has have having he her here hers herself him
+himself his how i if in into is it its itself just me more most my myself no nor
+not now of off on once only or other our ours ourselves out over own same she
+should so some such than that the their theirs them themselves then there these
+they this those through to too under until up very was we were what when where
+which while who whom why will with would you your yours yourself yourselves
+going gonna get got okay yeah really basically actually know mean like right
+thing things lot want one also well
+""".split())
+
+_WORD = re.compile(r"[a-z0-9']+")
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Repeated runs of words collapsed by rolling-duplicate removal. Caption
+# artifacts repeat whole phrases; shorter repeats ("no, no") are real speech
+MIN_REPEAT_WORDS = 3
+MAX_REPEAT_WORDS = 12
+
+# Unpunctuated captions are scored in windows of this many words
+PSEUDO_SENTENCE_WORDS = 20
+MAX_SENTENCE_WORDS = 60
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_ITERATIONS = 50
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def remove_duplicate_lines(text: str, max_repeat: int = MAX_REPEAT_WORDS,
+                           min_repeat: int = MIN_REPEAT_WORDS) -> str:
+    """
+    Remove repeated caption lines and rolling duplicates.
+
+    Auto-generated captions repeat the tail of the previous line at the start
+    of the next one and sometimes emit a line twice; once joined, these show
+    up as a run of words immediately repeating the words just before it.
+
+    Args:
+        text (str): Transcript text
+        max_repeat (int): Longest run of words to check for repetition
+        min_repeat (int): Shortest run collapsed; shorter repeats are kept
+
+    Returns:
+        str: Text with immediately repeated word runs collapsed
+    """
+    words = text.split()
+    normalized = [_normalize_word(word) for word in words]
+    kept: List[str] = []
+    kept_normalized: List[str] = []
+
+    i = 0
+    while i < len(words):
+        skipped = False
+        for n in range(min(max_repeat, len(kept), len(words) - i), min_repeat - 1, -1):
+            if normalized[i:i + n] == kept_normalized[-n:]:
+                i += n
+                skipped = True
+                break
+        if skipped:
+            continue
+
+        kept.append(words[i])
+        kept_normalized.append(normalized[i])
+        i += 1
+
+    return ' '.join(kept)
+
+
+def strip_fillers(text: str) -> str:
+    """
+    Remove filler words and verbal tics.
+
+    Args:
+        text (str): Transcript text
+
+    Returns:
+        str: Text without fillers
+    """
+    text = FILLER_PHRASES.sub(' ', text)
+    text = FILLER_WORDS.sub('', text)
+    return ' '.join(text.split())
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, windowing unpunctuated captions.
+
+    Args:
+        text (str): Transcript text
+
+    Returns:
+        List[str]: Sentences or fixed-size word windows
+    """
+    sentences = []
+    for sentence in _SENTENCE_BOUNDARY.split(text.strip()):
+        words = sentence.split()
+        if len(words) <= MAX_SENTENCE_WORDS:
+            if words:
+                sentences.append(sentence)
+            continue
+        for start in range(0, len(words), PSEUDO_SENTENCE_WORDS):
+            sentences.append(' '.join(words[start:start + PSEUDO_SENTENCE_WORDS]))
+    return sentences
+
+
+def _content_words(sentence: str) -> List[str]:
+    return [word for word in _WORD.findall(sentence.lower()) if word not in STOPWORDS]
+
+
+def score_sentences(sentences: List[str]):
+    """
+    Score sentences with TextRank over TF-IDF vectors.
+
+    Vectors are kept sparse and the sentence similarity matrix is never
+    built: each iteration multiplies through the vectors instead, so time
+    and memory grow with the number of words rather than sentences squared.
+
+    Args:
+        sentences (List[str]): Sentences to score
+
+    Returns:
+        numpy.ndarray: One centrality score per sentence
+    """
+    n = len(sentences)
+    tokenized = [_content_words(sentence) for sentence in sentences]
+    vocabulary = {word: index for index, word in enumerate(
+        sorted({word for tokens in tokenized for word in tokens})
+    )}
+    if n == 0 or not vocabulary:
+        return np.ones(n)
+
+    # Term frequencies as (sentence, term, count) triples
+    rows = np.repeat(np.arange(n), [len(tokens) for tokens in tokenized])
+    cols = np.fromiter(
+        (vocabulary[word] for tokens in tokenized for word in tokens), dtype=np.int64
+    )
+    pairs, counts = np.unique(rows * len(vocabulary) + cols, return_counts=True)
+    rows, cols = pairs // len(vocabulary), pairs % len(vocabulary)
+
+    df = np.bincount(cols, minlength=len(vocabulary))
+    idf = np.log((1 + n) / (1 + df)) + 1.0
+    values = counts * idf[cols]
+
+    norms = np.sqrt(np.bincount(rows, weights=values ** 2, minlength=n))
+    values = values / norms[rows]
+    self_similarity = (norms > 0).astype(float)
+
+    def similarity_times(x):
+        # (V V^T - diag) x, with V the normalized sentence-term matrix
+        per_term = np.bincount(cols, weights=values * x[rows], minlength=len(vocabulary))
+        return np.bincount(rows, weights=values * per_term[cols], minlength=n) - self_similarity * x
+
+    row_sums = similarity_times(np.ones(n))
+    row_sums[row_sums <= 1e-12] = 1.0
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(TEXTRANK_ITERATIONS):
+        # Similarity is symmetric, so transition.T @ scores = S @ (scores / row_sums)
+        updated = (1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * similarity_times(scores / row_sums)
+        if np.abs(updated - scores).sum() < 1e-6:
+            scores = updated
+            break
+        scores = updated
+
+    return scores
+
+
+def compress_transcript(transcript: str, target_ratio: float = 1.0,
+                        family: str = "generic", model: Optional[str] = None,
+                        language: str = "en") -> Dict:
+    """
+    Compress a transcript to roughly a target share of its original tokens.
+
+    Cleanup (artifacts, fillers, repeated caption phrases) always runs; the
+    filler lists are English, so fillers are only stripped from English
+    transcripts. If the result is still above the target, the highest-scoring
+    sentences are kept in their original order until the token budget is
+    spent, and the best one is kept even if it alone is over budget. Scoring
+    needs NumPy; without it only the cleanup steps are applied.
+
+    Args:
+        transcript (str): Raw transcript text
+        target_ratio (float): Desired compressed/original token ratio (0-1]
+        family (str): Provider family for token counting
+        model (Optional[str]): Model name for token counting
+        language (str): Transcript language code, e.g. "en" or "de-DE"
+
+    Returns:
+        Dict: Compressed transcript and size statistics
+    """
+    if not 0 < target_ratio <= 1:
+        raise ValueError("target_ratio must be in (0, 1]")
+
+    original_tokens = count_tokens(transcript, family, model)
+
+    cleaned = clean_text(transcript)
+    if (language or "").lower().startswith("en"):
+        cleaned = strip_fillers(cleaned)
+    cleaned = remove_duplicate_lines(cleaned)
+    cleaned_tokens = count_tokens(cleaned, family, model)
+
+    result = {
+        "transcript": cleaned,
+        "original_tokens": original_tokens,
+        "cleaned_tokens": cleaned_tokens,
+        "compressed_tokens": cleaned_tokens,
+        "target_ratio": target_ratio,
+        "sentences_total": None,
+        "sentences_kept": None,
+    }
+
+    budget = int(original_tokens * target_ratio)
+    if cleaned_tokens <= budget or np is None:
+        return result
+
+    sentences = split_sentences(cleaned)
+    scores = score_sentences(sentences)
+    sentence_tokens = [count_tokens(sentence, family, model) + 1 for sentence in sentences]
+
+    selected = []
+    used = 0
+    for index in np.argsort(-scores, kind="stable"):
+        if used + sentence_tokens[index] > budget:
+            continue
+        selected.append(index)
+        used += sentence_tokens[index]
+    if not selected and sentences:
+        # Never send the model an empty transcript
+        selected.append(int(np.argmax(scores)))
+
+    compressed = ' '.join(sentences[index] for index in sorted(selected))
+
+    result["transcript"] = compressed
+    result["compressed_tokens"] = count_tokens(compressed, family, model)
+    result["sentences_total"] = len(sentences)
+    result["sentences_kept"] = len(selected)
+    return result
+
+
+def keyword_recall(original: str, compressed: str, top_k: int = 30) -> float:
+    """
+    Share of the original's most frequent content words kept after compression.
+
+    Used as a cheap quality signal when benchmarking compression ratios.
+
+    Args:
+        original (str): Original transcript
+        compressed (str): Compressed transcript
+        top_k (int): Number of top content words to check
+
+    Returns:
+        float: Recall between 0 and 1
+    """
+    original_words = Counter(_content_words(strip_fillers(clean_text(original))))
+    keywords = [word for word, _ in original_words.most_common(top_k)]
+    if not keywords:
+        return 1.0
+
+    compressed_words = set(_content_words(compressed))
+    return sum(1 for word in keywords if word in compressed_words) / len(keywords)
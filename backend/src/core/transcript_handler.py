@@ -10,6 +10,8 @@ from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import WebshareProxyConfig
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
 
+from .replay import replayable
+
 def get_youtube_api_instance(proxy_username: Optional[str] = None, proxy_password: Optional[str] = None) -> YouTubeTranscriptApi:
     """
     Get YouTubeTranscriptApi instance with optional proxy configuration.
@@ -38,6 +40,7 @@ def get_youtube_api_instance(proxy_username: Optional[str] = None, proxy_passwor
         # Return default instance without proxy
         return YouTubeTranscriptApi()
 
+@replayable("transcript_languages", key_args=("video_id",))
 def list_transcript_languages(video_id: str, proxy_username: Optional[str] = None, proxy_password: Optional[str] = None) -> List[Dict[str, str]]:
     """
     List all available transcript languages for a video.
@@ -107,6 +110,7 @@ def save_transcript_to_file(transcript: str, video_id: str, output_dir: str = "t
     print(f"Transcript saved to: {file_path}")
     return file_path
 
+@replayable("transcript", key_args=("video_id", "language_code"))
 def fetch_transcript(video_id: str, language_code: str = 'en', proxy_username: Optional[str] = None, proxy_password: Optional[str] = None, save_to_file: bool = False, output_dir: str = "transcripts") -> Optional[str]:
     """
     Fetch transcript for a video in specified language.
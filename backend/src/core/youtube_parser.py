@@ -7,6 +7,8 @@ import requests
 from urllib.parse import urlparse, parse_qs
 from typing import Optional
 
+from .replay import replayable
+
 def get_video_id(url: str) -> Optional[str]:
     """
     Extract YouTube video ID from various URL formats.
@@ -57,6 +59,7 @@ def get_video_id(url: str) -> Optional[str]:
     
     return None
 
+@replayable("oembed_title", key_args=("video_id",))
 def get_video_title(video_id: str) -> str:
     """
     Get video title from YouTube video ID.
@@ -81,6 +84,7 @@ def get_video_title(video_id: str) -> str:
     except Exception:
         return f'YouTube Video {video_id}'
 
+@replayable("oembed_info", key_args=("video_id",))
 def get_video_info(video_id: str) -> dict:
     """
     Get comprehensive video information.
@@ -1,43 +1,97 @@
 """Database connection and session management"""
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
-from ..web.config import get_settings
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, Dict, Optional
+from ..web.config import Settings, get_settings
 
 Base = declarative_base()
 engine = None
 async_session_maker = None
 
 
-async def init_db():
-    """Initialize database connection"""
-    global engine, async_session_maker
+def sqlite_pragmas(settings: Settings) -> Dict[str, Any]:
+    """PRAGMAs applied to every new SQLite connection for the configured profile
     
-    settings = get_settings()
+    The "production" profile uses WAL so readers never block on the writer,
+    synchronous=NORMAL (durable at each WAL checkpoint rather than every
+    commit), a busy timeout instead of failing fast with "database is
+    locked", and larger mmap and page caches. "default" leaves SQLite as is.
+    """
+    if settings.sqlite_profile != "production":
+        return {}
+    
+    return {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+        "mmap_size": settings.sqlite_mmap_size_mb * 1024 * 1024,
+        # Negative cache_size is in KiB rather than pages
+        "cache_size": -settings.sqlite_cache_size_mb * 1024,
+        "temp_store": "MEMORY",
+    }
+
+
+def engine_options(database_url: str, settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments for create_async_engine() for this kind of database"""
+    options = {"echo": settings.database_echo, "pool_pre_ping": True}
+    
+    # SQLite has one writer whatever the pool size, so only server databases
+    # get explicit pool sizing
+    if not database_url.startswith("sqlite"):
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_timeout=settings.database_pool_timeout,
+            pool_recycle=settings.database_pool_recycle,
+        )
+    return options
+
+
+def create_db_engine(settings: Optional[Settings] = None) -> AsyncEngine:
+    """Create the async engine for the configured database and profile"""
+    settings = settings or get_settings()
     
     # Convert SQLite URL for async usage
     database_url = settings.database_url
     if database_url.startswith("sqlite:///"):
         database_url = database_url.replace("sqlite:///", "sqlite+aiosqlite:///")
     
-    engine = create_async_engine(
-        database_url,
-        echo=settings.database_echo,
-        pool_pre_ping=True,
-    )
+    new_engine = create_async_engine(database_url, **engine_options(database_url, settings))
+    
+    pragmas = sqlite_pragmas(settings) if database_url.startswith("sqlite") else {}
+    if pragmas:
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+    
+    return new_engine
+
+
+async def init_db():
+    """Initialize database connection"""
+    global engine, async_session_maker
+    
+    engine = create_db_engine()
     
     async_session_maker = async_sessionmaker(
         engine, class_=AsyncSession, expire_on_commit=False
     )
     
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Bring the schema up to date
+    if get_settings().database_migrate_on_startup:
+        from .migrations import upgrade_database
+        await upgrade_database(engine)
 
 
+@asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency"""
+    """Get a database session as an async context manager"""
     if async_session_maker is None:
         await init_db()
     
@@ -51,5 +105,5 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 # For compatibility with existing code
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Database dependency for FastAPI"""
-    async for session in get_db_session():
+    async with get_db_session() as session:
         yield session
\ No newline at end of file
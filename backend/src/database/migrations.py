@@ -0,0 +1,104 @@
+"""Alembic schema migrations: running them, and helpers for migration scripts"""
+
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+from alembic import command, op
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+BACKEND_DIR = Path(__file__).parent.parent.parent
+BASELINE_REVISION = "0001"
+
+T = TypeVar("T")
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Alembic config for this backend, optionally bound to an open connection"""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def migrate(connection: Connection, revision: str = "head") -> None:
+    """Upgrade the database on `connection` to `revision`
+
+    Databases created by the old create_all() start-up have tables but no
+    alembic_version. They are stamped first: at head if they already match
+    the models, otherwise at the baseline so later migrations fill them in.
+    """
+    from . import models  # noqa: F401 - registers tables on Base.metadata
+    from .connection import Base
+
+    config = alembic_config(connection)
+    tables = inspect(connection).get_table_names()
+    if "jobs" in tables and "alembic_version" not in tables:
+        diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+        command.stamp(config, "head" if not diff else BASELINE_REVISION)
+
+    command.upgrade(config, revision)
+
+
+async def upgrade_database(engine: AsyncEngine, revision: str = "head") -> None:
+    """Run pending migrations through an async engine"""
+    # A plain connection, not engine.begin(): each migration commits on its
+    # own, which online index builds on PostgreSQL need
+    async with engine.connect() as connection:
+        await connection.run_sync(migrate, revision)
+        await connection.commit()
+
+
+# Helpers for migration scripts
+
+def create_index_online(index_name: str, table_name: str, columns: List[str], **kw) -> None:
+    """op.create_index() that does not block writes where the database allows
+
+    PostgreSQL builds the index CONCURRENTLY, outside the migration's
+    transaction. SQLite cannot build indexes online; the build holds the
+    write lock, which at this application's table sizes takes seconds.
+    """
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(index_name, table_name, columns, if_not_exists=True,
+                            postgresql_concurrently=True, **kw)
+    else:
+        op.create_index(index_name, table_name, columns, if_not_exists=True, **kw)
+
+
+def drop_index_online(index_name: str, table_name: str) -> None:
+    """op.drop_index() counterpart of create_index_online()"""
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.drop_index(index_name, table_name=table_name, if_exists=True,
+                          postgresql_concurrently=True)
+    else:
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
+
+
+def run_in_batches(batches: Iterable[T], apply: Callable[[T], None]) -> int:
+    """Apply a data backfill one batch at a time
+
+    On PostgreSQL each batch commits as soon as it is applied, so locks are
+    held briefly and an interrupted backfill keeps its progress. SQLite runs
+    the batches inside the migration's transaction.
+
+    Returns:
+        int: Number of batches applied
+    """
+    autocommit = op.get_bind().dialect.name == "postgresql"
+    applied = 0
+    for batch in batches:
+        if autocommit:
+            with op.get_context().autocommit_block():
+                apply(batch)
+        else:
+            apply(batch)
+        applied += 1
+    return applied
@@ -1,15 +1,14 @@
 """SQLAlchemy database models"""
 
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, Text, JSON, ForeignKey
+from sqlalchemy import Column, String, Integer, Date, DateTime, Boolean, Text, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from .connection import Base
 
 
-class Job(Base):
-    """Job tracking table"""
-    __tablename__ = "jobs"
+class JobColumns:
+    """Columns shared by the jobs table and its archive"""
     
     id = Column(String, primary_key=True)
     video_id = Column(String, nullable=False)
@@ -42,9 +41,41 @@ class Job(Base):
     transcript_length = Column(Integer)
     output_length = Column(Integer)
     tokens_used = Column(Integer)
+
+
+class Job(JobColumns, Base):
+    """Job tracking table"""
+    __tablename__ = "jobs"
     
     # Relationships
     progress_entries = relationship("JobProgress", back_populates="job", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Status filters (queue, active jobs), by priority
+        Index("ix_jobs_status_priority_created_at", "status", "priority", "created_at"),
+        # History pages, newest first, unfiltered or by status or provider;
+        # id breaks created_at ties so keyset cursors are exact
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_jobs_llm_provider_created_at_id", "llm_provider", "created_at", "id"),
+        # Lookups of earlier jobs for the same video
+        Index("ix_jobs_video_id", "video_id"),
+    )
+
+
+class ArchivedJob(JobColumns, Base):
+    """Terminal jobs moved out of the jobs table once past the retention period"""
+    __tablename__ = "jobs_archive"
+    
+    archived_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # History pages spanning hot and archived jobs, unfiltered or by
+        # status or provider
+        Index("ix_jobs_archive_created_at_id", "created_at", "id"),
+        Index("ix_jobs_archive_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_jobs_archive_llm_provider_created_at_id", "llm_provider", "created_at", "id"),
+    )
 
 
 class JobProgress(Base):
@@ -64,6 +95,38 @@ class JobProgress(Base):
     
     # Relationships
     job = relationship("Job", back_populates="progress_entries")
+    
+    __table_args__ = (
+        # A job's timeline, in the order its steps ran
+        Index("ix_job_progress_job_id_started_at", "job_id", "started_at"),
+    )
+
+
+class JobDailyStats(Base):
+    """Per-day, per-provider job counters, kept current as jobs are created and finish"""
+    __tablename__ = "job_daily_stats"
+    
+    day = Column(Date, primary_key=True)
+    llm_provider = Column(String, primary_key=True)
+    created_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    cancelled_count = Column(Integer, nullable=False, default=0)
+    
+    # Completed jobs with a measured processing time, and their total
+    timed_count = Column(Integer, nullable=False, default=0)
+    processing_seconds_total = Column(Integer, nullable=False, default=0)
+
+
+class JobDurationHistogram(Base):
+    """Per-day, per-provider counts of completed jobs by processing time bucket"""
+    __tablename__ = "job_duration_histogram"
+    
+    day = Column(Date, primary_key=True)
+    llm_provider = Column(String, primary_key=True)
+    # Upper bound of the bucket in seconds
+    bucket_seconds = Column(Integer, primary_key=True)
+    job_count = Column(Integer, nullable=False, default=0)
 
 
 class JobStep(Base):
@@ -1,13 +1,22 @@
 """Job repository for database operations"""
 
-from typing import List, Optional
-from sqlalchemy import select, and_
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, and_, bindparam, delete, func, insert, tuple_, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
-from ..models import Job
+from ..connection import get_db_session
+from ..models import ArchivedJob, Job, JobProgress
 from ...models.schemas import JobResponse, JobStatus
 
+TERMINAL_STATUSES = [
+    JobStatus.COMPLETED.value,
+    JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value
+]
+
 
 class JobRepository(BaseRepository[Job]):
     """Repository for job-related database operations"""
@@ -15,11 +24,69 @@ class JobRepository(BaseRepository[Job]):
     def __init__(self):
         super().__init__(Job)
     
+    def _to_values(self, job) -> Dict[str, Any]:
+        """Column values of a Job row or JobResponse, keyed by column name"""
+        values = {}
+        for column in Job.__table__.columns:
+            if hasattr(job, column.name):
+                value = getattr(job, column.name)
+                values[column.name] = value.value if isinstance(value, JobStatus) else value
+        return values
+    
+    def _to_model(self, job) -> Job:
+        """Convert a JobResponse into a Job row, copying every matching column"""
+        if isinstance(job, Job):
+            return job
+        return Job(**self._to_values(job))
+    
+    async def create(self, job) -> Job:
+        """Create a job record from a Job row or JobResponse"""
+        return await super().create(self._to_model(job))
+    
+    async def update(self, job) -> Job:
+        """Update a job record from a Job row or JobResponse"""
+        return await super().update(self._to_model(job))
+    
+    async def update_many(self, jobs: Iterable) -> int:
+        """Write several existing job records in one transaction
+        
+        Args:
+            jobs: Job rows, JobResponses or column-value dicts (with "id")
+            
+        Returns:
+            int: Number of records written; ids with no row (deleted or
+            archived jobs) match nothing and are skipped
+        """
+        rows = [job if isinstance(job, dict) else self._to_values(job) for job in jobs]
+        if not rows:
+            return 0
+        
+        # Core UPDATE ... WHERE id = :job_id, one executemany per set of
+        # columns. Unlike the ORM bulk update it accepts a missing row
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            values = {name: value for name, value in row.items() if name != "id"}
+            by_columns.setdefault(tuple(sorted(values)), []).append(
+                {"job_id": row["id"], **values}
+            )
+        
+        statement = update(Job.__table__).where(Job.__table__.c.id == bindparam("job_id"))
+        written = 0
+        async with get_db_session() as session:
+            for params in by_columns.values():
+                result = await session.execute(statement, params)
+                written += max(result.rowcount, 0)
+            await session.commit()
+        return written
+    
     async def get_by_status(self, status: JobStatus, limit: int = 100) -> List[Job]:
-        """Get jobs by status"""
+        """Get jobs by status, highest priority then newest first"""
         async with get_db_session() as session:
             result = await session.execute(
-                select(Job).where(Job.status == status.value).limit(limit)
+                select(Job)
+                .where(Job.status == status.value)
+                .order_by(Job.priority.desc(), Job.created_at.desc())
+                .limit(limit)
             )
             return result.scalars().all()
     
@@ -40,14 +107,128 @@ class JobRepository(BaseRepository[Job]):
             return result.scalars().all()
     
     async def get_jobs_by_provider(self, provider: str, limit: int = 100) -> List[Job]:
-        """Get jobs by LLM provider"""
+        """Get jobs by LLM provider, newest first"""
         async with get_db_session() as session:
             result = await session.execute(
-                select(Job).where(Job.llm_provider == provider).limit(limit)
+                select(Job)
+                .where(Job.llm_provider == provider)
+                .order_by(Job.created_at.desc())
+                .limit(limit)
             )
             return result.scalars().all()
     
+    async def get_archived(self, job_id: str) -> Optional[ArchivedJob]:
+        """Get an archived job by ID"""
+        async with get_db_session() as session:
+            result = await session.execute(select(ArchivedJob).where(ArchivedJob.id == job_id))
+            return result.scalar_one_or_none()
+    
+    async def list_jobs(self, status: Optional[JobStatus] = None,
+                        provider: Optional[str] = None, limit: int = 100,
+                        after: Optional[Tuple[datetime, str]] = None,
+                        offset: int = 0, include_archived: bool = False,
+                        columns: Optional[List[str]] = None) -> List[Job]:
+        """List jobs newest first, optionally filtered by status and provider
+        
+        Args:
+            after: (created_at, id) of the last job on the previous page; only
+                older jobs are returned, found by index seek however deep
+            offset: Rows to skip, for callers that still page by offset
+            include_archived: Also list jobs moved to the archive
+            columns: Load only these columns (they must include id and
+                created_at)
+        
+        Returns:
+            List: Job rows, or plain result rows with the same attributes when
+            columns are chosen or archived jobs included
+        """
+        if not include_archived:
+            query = self._page_query(Job, status, provider, after, columns).limit(limit)
+            if offset:
+                query = query.offset(offset)
+            
+            async with get_db_session() as session:
+                result = await session.execute(query)
+                return result.all() if columns else result.scalars().all()
+        
+        # Each table yields its own first page from its keyset index and
+        # only those rows are merged
+        columns = columns or [column.name for column in Job.__table__.columns]
+        pages = [
+            self._page_query(model, status, provider, after, columns)
+            .limit(limit + offset).subquery()
+            for model in (Job, ArchivedJob)
+        ]
+        merged = union_all(*(select(*(page.c[name] for name in columns)) for page in pages)).subquery()
+        query = (
+            select(merged)
+            .order_by(merged.c.created_at.desc(), merged.c.id.desc())
+            .limit(limit)
+        )
+        if offset:
+            query = query.offset(offset)
+        
+        async with get_db_session() as session:
+            result = await session.execute(query)
+            return result.all()
+    
+    def _page_query(self, model, status: Optional[JobStatus], provider: Optional[str],
+                    after: Optional[Tuple[datetime, str]], columns: Optional[List[str]] = None):
+        """Newest-first query on jobs or jobs_archive with the list filters applied"""
+        query = select(*(getattr(model, name) for name in columns)) if columns else select(model)
+        if status:
+            query = query.where(model.status == status.value)
+        if provider:
+            query = query.where(model.llm_provider == provider)
+        if after:
+            query = query.where(tuple_(model.created_at, model.id) < tuple_(*after))
+        return query.order_by(model.created_at.desc(), model.id.desc())
+    
+    async def archive_jobs(self, before: datetime, batch_size: int = 500) -> int:
+        """Move terminal jobs created before `before` into jobs_archive
+        
+        Each batch is copied, its progress rows deleted and the jobs removed
+        in one transaction, and the lock is released between batches so live
+        job updates are not held up behind a large backlog.
+        
+        Returns:
+            int: Number of jobs archived
+        """
+        columns = [column.name for column in Job.__table__.columns]
+        archived = 0
+        
+        while True:
+            async with get_db_session() as session:
+                result = await session.execute(
+                    select(Job.id)
+                    .where(Job.status.in_(TERMINAL_STATUSES), Job.created_at < before)
+                    .limit(batch_size)
+                )
+                job_ids = result.scalars().all()
+                if not job_ids:
+                    break
+                
+                await session.execute(
+                    insert(ArchivedJob).from_select(
+                        columns,
+                        select(*(getattr(Job, name) for name in columns)).where(Job.id.in_(job_ids))
+                    )
+                )
+                await session.execute(delete(JobProgress).where(JobProgress.job_id.in_(job_ids)))
+                await session.execute(delete(Job).where(Job.id.in_(job_ids)))
+                await session.commit()
+            
+            archived += len(job_ids)
+            if len(job_ids) < batch_size:
+                break
+            await asyncio.sleep(0)
+        
+        return archived
+    
     async def count_jobs_by_status(self) -> dict:
-        """Count jobs grouped by status"""
-        # This would implement status counting
-        pass
\ No newline at end of file
+        """Count jobs grouped by status, in one GROUP BY over the status index"""
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(Job.status, func.count()).group_by(Job.status)
+            )
+            return {status: count for status, count in result.all()}
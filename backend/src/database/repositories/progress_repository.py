@@ -0,0 +1,43 @@
+"""Job progress repository for database operations"""
+
+from typing import Any, Dict, Iterable, List
+from sqlalchemy import select, insert
+
+from .base import BaseRepository
+from ..connection import get_db_session
+from ..models import JobProgress
+
+
+class JobProgressRepository(BaseRepository[JobProgress]):
+    """Repository for job_progress entries"""
+    
+    def __init__(self):
+        super().__init__(JobProgress)
+    
+    async def insert_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert several progress entries in one transaction
+        
+        Args:
+            rows: Column values per entry
+            
+        Returns:
+            int: Number of entries inserted
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        
+        async with get_db_session() as session:
+            await session.execute(insert(JobProgress), rows)
+            await session.commit()
+        return len(rows)
+    
+    async def get_timeline(self, job_id: str) -> List[JobProgress]:
+        """Get a job's recorded steps in the order they ran"""
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(JobProgress)
+                .where(JobProgress.job_id == job_id)
+                .order_by(JobProgress.started_at, JobProgress.id)
+            )
+            return result.scalars().all()
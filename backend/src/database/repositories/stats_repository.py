@@ -0,0 +1,180 @@
+"""Job statistics rollup repository"""
+
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select, delete, insert, func, case, and_, literal_column, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql import Executable
+
+from ..connection import get_db_session
+from ..models import ArchivedJob, Job, JobDailyStats, JobDurationHistogram
+from ...models.enums import JobStatus
+
+# Upper bounds (seconds) of the processing time histogram buckets; longer
+# jobs are counted in the last bucket
+DURATION_BUCKETS = [1, 2, 5, 10, 15, 30, 45, 60, 90, 120, 180, 300, 600, 900, 1800, 3600, 86400]
+
+FINISHED_COUNTERS = {
+    JobStatus.COMPLETED.value: "completed_count",
+    JobStatus.FAILED.value: "failed_count",
+    JobStatus.CANCELLED.value: "cancelled_count",
+}
+
+
+def duration_bucket(seconds: int) -> int:
+    """Histogram bucket (its upper bound) a processing time falls into"""
+    for bound in DURATION_BUCKETS:
+        if seconds <= bound:
+            return bound
+    return DURATION_BUCKETS[-1]
+
+
+def rebuild_statements(start: date, end: date) -> List[Executable]:
+    """Statements replacing the rollups for days in [start, end) from job history
+
+    History is jobs plus jobs_archive, so archived jobs still count. Each job
+    counts as created on its creation day and as finished on its completion
+    day. Migration 0007 keeps its own copy of this SQL for the backfill.
+    """
+    start_at = datetime.combine(start, datetime.min.time())
+    end_at = datetime.combine(end, datetime.min.time())
+
+    history_columns = ["llm_provider", "status", "created_at", "completed_at",
+                       "updated_at", "processing_time_seconds"]
+    jobs = union_all(*(
+        select(*(table.c[name] for name in history_columns))
+        for table in (Job.__table__, ArchivedJob.__table__)
+    )).subquery("job_history")
+
+    finished_at = func.coalesce(jobs.c.completed_at, jobs.c.updated_at)
+    timed = and_(jobs.c.status == JobStatus.COMPLETED.value,
+                 jobs.c.processing_time_seconds.is_not(None))
+    zero = literal_column("0")
+
+    created = (
+        select(func.date(jobs.c.created_at).label("day"), jobs.c.llm_provider,
+               literal_column("1").label("created_count"),
+               *(zero.label(counter) for counter in FINISHED_COUNTERS.values()),
+               zero.label("timed_count"), zero.label("processing_seconds_total"))
+        .where(jobs.c.created_at >= start_at, jobs.c.created_at < end_at)
+    )
+    finished = (
+        select(func.date(finished_at), jobs.c.llm_provider, zero,
+               *(case((jobs.c.status == status, 1), else_=0) for status in FINISHED_COUNTERS),
+               case((timed, 1), else_=0),
+               case((timed, jobs.c.processing_time_seconds), else_=0))
+        .where(jobs.c.status.in_(list(FINISHED_COUNTERS)),
+               finished_at >= start_at, finished_at < end_at)
+    )
+    events = union_all(created, finished).subquery("events")
+    counters = ["created_count", *FINISHED_COUNTERS.values(),
+                "timed_count", "processing_seconds_total"]
+    daily = (
+        select(events.c.day, events.c.llm_provider,
+               *(func.sum(events.c[name]) for name in counters))
+        .group_by(events.c.day, events.c.llm_provider)
+    )
+
+    bucket = case(
+        *((jobs.c.processing_time_seconds <= bound, bound) for bound in DURATION_BUCKETS),
+        else_=DURATION_BUCKETS[-1]
+    )
+    histogram = (
+        select(func.date(jobs.c.completed_at), jobs.c.llm_provider, bucket, func.count())
+        .where(timed, jobs.c.completed_at >= start_at, jobs.c.completed_at < end_at)
+        .group_by(func.date(jobs.c.completed_at), jobs.c.llm_provider, bucket)
+    )
+
+    return [
+        delete(JobDailyStats).where(JobDailyStats.day >= start, JobDailyStats.day < end),
+        delete(JobDurationHistogram).where(JobDurationHistogram.day >= start,
+                                           JobDurationHistogram.day < end),
+        insert(JobDailyStats).from_select(["day", "llm_provider", *counters], daily),
+        insert(JobDurationHistogram).from_select(
+            ["day", "llm_provider", "bucket_seconds", "job_count"], histogram
+        ),
+    ]
+
+
+class JobStatsRepository:
+    """Reads and maintains the job_daily_stats and job_duration_histogram rollups
+
+    Counters are bumped with INSERT ... ON CONFLICT DO UPDATE, so recording an
+    event is a single statement whatever the size of the jobs table, and
+    reading a dashboard touches a handful of rollup rows per day.
+    """
+
+    async def increment_daily(self, day: date, provider: str, **counters: int) -> None:
+        """Add to a day's counters for a provider, creating the row if needed"""
+        async with get_db_session() as session:
+            await session.execute(self._upsert(
+                session, JobDailyStats,
+                {"day": day, "llm_provider": provider, **counters}, counters
+            ))
+            await session.commit()
+
+    async def increment_duration(self, day: date, provider: str, seconds: int) -> None:
+        """Count one completed job in its processing time bucket"""
+        async with get_db_session() as session:
+            await session.execute(self._upsert(
+                session, JobDurationHistogram,
+                {"day": day, "llm_provider": provider,
+                 "bucket_seconds": duration_bucket(seconds), "job_count": 1},
+                {"job_count": 1}
+            ))
+            await session.commit()
+
+    async def get_daily_totals(self, since: date) -> Dict[str, Dict[str, int]]:
+        """Sum each provider's counters over the days from `since` onwards"""
+        counters = ["created_count", "completed_count", "failed_count",
+                    "cancelled_count", "timed_count", "processing_seconds_total"]
+        async with get_db_session() as session:
+            result = await session.execute(
+                select(JobDailyStats.llm_provider,
+                       *(func.sum(getattr(JobDailyStats, name)) for name in counters))
+                .where(JobDailyStats.day >= since)
+                .group_by(JobDailyStats.llm_provider)
+            )
+            return {
+                row[0]: {name: int(value or 0) for name, value in zip(counters, row[1:])}
+                for row in result.all()
+            }
+
+    async def get_duration_histogram(self, since: date,
+                                     provider: Optional[str] = None) -> List[Tuple[int, int]]:
+        """(bucket_seconds, job_count) pairs from `since` onwards, shortest first"""
+        query = (
+            select(JobDurationHistogram.bucket_seconds, func.sum(JobDurationHistogram.job_count))
+            .where(JobDurationHistogram.day >= since)
+            .group_by(JobDurationHistogram.bucket_seconds)
+            .order_by(JobDurationHistogram.bucket_seconds)
+        )
+        if provider:
+            query = query.where(JobDurationHistogram.llm_provider == provider)
+
+        async with get_db_session() as session:
+            result = await session.execute(query)
+            return [(bucket, int(count)) for bucket, count in result.all()]
+
+    async def rebuild(self, since: date) -> None:
+        """Recompute the rollups from job history for the days from `since`
+
+        For backfilling existing databases and repairing drift; normal
+        operation keeps the rollups current incrementally.
+        """
+        async with get_db_session() as session:
+            for statement in rebuild_statements(since, date.today() + timedelta(days=1)):
+                await session.execute(statement)
+            await session.commit()
+
+    @staticmethod
+    def _upsert(session, model, values: Dict[str, Any], increments: Dict[str, int]):
+        """INSERT values, or add `increments` to the existing row's columns"""
+        dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(model).values(**values)
+        primary_key = [column.name for column in model.__table__.primary_key]
+        return statement.on_conflict_do_update(
+            index_elements=primary_key,
+            set_={name: getattr(model, name) + getattr(statement.excluded, name)
+                  for name in increments}
+        )
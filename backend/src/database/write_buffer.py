@@ -0,0 +1,300 @@
+"""Write-behind buffering of job record updates and progress entries"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .repositories.job_repository import JobRepository
+from .repositories.progress_repository import JobProgressRepository
+
+
+class JobWriteError(Exception):
+    """Raised when a job update that had to be durable could not be written."""
+
+
+class JobWriteBuffer:
+    """Coalesces job record updates and writes them in batched transactions
+
+    Each put() snapshots the job's columns, replacing any snapshot still
+    pending for that job, so a job that changes ten times between flushes is
+    written once. Pending snapshots are written in a single transaction when
+    max_pending jobs are waiting or flush_interval seconds after the first
+    one arrived, whichever comes first. Callers pass flush=True for changes
+    that must be durable before they return (terminal statuses), and
+    shutdown() writes whatever is left.
+
+    Records are only updated, never inserted; updates of jobs that no longer
+    exist (deleted or archived) are skipped. If a batch fails its rows are
+    retried one by one, and a row that keeps failing is dropped after
+    max_attempts flushes so it cannot hold back the others.
+    """
+
+    def __init__(self, repository: Optional[JobRepository] = None,
+                 flush_interval: Optional[float] = None,
+                 max_pending: Optional[int] = None, max_attempts: int = 3):
+        from ..web.config import get_settings
+        settings = get_settings()
+        self.repository = repository or JobRepository()
+        self.flush_interval = (flush_interval if flush_interval is not None
+                               else settings.job_write_flush_interval_ms / 1000)
+        self.max_pending = max_pending or settings.job_write_max_pending
+        self.max_attempts = max_attempts
+
+        # job_id -> column values of the latest unwritten snapshot
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        # job_id -> failed writes of its pending snapshot so far
+        self.attempts: Dict[str, int] = {}
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.updates = 0
+        self.rows_written = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+
+    async def put(self, job, flush: bool = False) -> None:
+        """Queue the current state of a job for writing
+
+        Args:
+            job: Job row or JobResponse; its columns are copied immediately
+            flush: Write it (and everything else pending) before returning
+
+        Raises:
+            JobWriteError: flush=True and this job's update could not be written
+        """
+        self.pending[job.id] = self.repository._to_values(job)
+        self.updates += 1
+
+        if flush:
+            _, failed = await self._flush()
+            if job.id in failed:
+                raise JobWriteError(f"Update of job {job.id} was not written: {failed[job.id]}")
+        elif self.flush_interval <= 0 or len(self.pending) >= self.max_pending:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> int:
+        """Write all pending snapshots in one transaction
+
+        Returns:
+            int: Number of job records written
+        """
+        written, _ = await self._flush()
+        return written
+
+    async def _flush(self) -> Tuple[int, Dict[str, str]]:
+        """flush(), also returning the error for each job that was not written"""
+        timer = self._flush_timer
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        self._flush_timer = None
+
+        # Serialized so an older snapshot can never land after a newer one
+        async with self._flush_lock:
+            rows, self.pending = self.pending, {}
+            if not rows:
+                return 0, {}
+
+            failed = {}
+            try:
+                await self.repository.update_many(rows.values())
+            except Exception as e:
+                print(f"Error writing {len(rows)} job updates, retrying one by one: {e}")
+                self.failed_flushes += 1
+                # One bad row must not hold back the rest of the batch
+                for job_id, row in rows.items():
+                    try:
+                        await self.repository.update_many([row])
+                    except Exception as row_error:
+                        failed[job_id] = str(row_error)
+
+            for job_id, error in failed.items():
+                attempts = self.attempts.get(job_id, 0) + 1
+                if attempts >= self.max_attempts:
+                    print(f"Dropping update of job {job_id} after {attempts} failed writes: {error}")
+                    self.attempts.pop(job_id, None)
+                    self.dropped += 1
+                else:
+                    # Keep it for the next attempt unless a newer snapshot arrived
+                    self.attempts[job_id] = attempts
+                    self.pending.setdefault(job_id, rows[job_id])
+            for job_id in rows.keys() - failed.keys():
+                self.attempts.pop(job_id, None)
+
+            if self.pending and self._flush_timer is None and self.flush_interval > 0:
+                self._flush_timer = asyncio.create_task(self._flush_later())
+
+            written = len(rows) - len(failed)
+            if written:
+                self.flushes += 1
+                self.rows_written += written
+            return written, failed
+
+    async def shutdown(self) -> None:
+        """Write everything still pending"""
+        await self.flush()
+        if self.pending:
+            print(f"Dropping {len(self.pending)} unwritten job updates at shutdown")
+            self.pending.clear()
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Counters showing how well updates are being coalesced"""
+        return {
+            "pending": len(self.pending),
+            "updates": self.updates,
+            "rows_written": self.rows_written,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+        }
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+
+class JobProgressRecorder:
+    """Records per-step timings as job_progress rows, inserted in batches
+
+    step_started() closes the job's previous step and opens the new one, so
+    each step becomes a single row with its start, completion and duration,
+    written once it has finished. Finished rows are bulk inserted on the
+    same interval/size triggers as JobWriteBuffer; finish_job() closes the
+    last step and writes everything before returning. The step a job is
+    running now lives only in memory and is available from open_step().
+    """
+
+    def __init__(self, repository: Optional[JobProgressRepository] = None,
+                 flush_interval: Optional[float] = None,
+                 max_pending: Optional[int] = None):
+        from ..web.config import get_settings
+        settings = get_settings()
+        self.repository = repository or JobProgressRepository()
+        self.flush_interval = (flush_interval if flush_interval is not None
+                               else settings.job_write_flush_interval_ms / 1000)
+        self.max_pending = max_pending or settings.job_write_max_pending
+
+        # job_id -> row values of the step the job is running
+        self.open_steps: Dict[str, Dict[str, Any]] = {}
+        self.pending: List[Dict[str, Any]] = []
+        self._flush_timer: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.rows_written = 0
+        self.failed_flushes = 0
+
+    async def step_started(self, job_id: str, step: str, message: Optional[str] = None,
+                           details: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a job's previous step completed and start timing `step`"""
+        now = datetime.now()
+        self._close_step(job_id, "completed", now)
+        self.open_steps[job_id] = {
+            "job_id": job_id,
+            "step": step,
+            "status": "running",
+            "message": message,
+            "progress_percentage": 0,
+            "details": dict(details or {}),
+            "started_at": now,
+            "completed_at": None,
+            "error_details": None,
+        }
+
+        if len(self.pending) >= self.max_pending or self.flush_interval <= 0:
+            await self.flush()
+        elif self.pending and self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def finish_job(self, job_id: str, status: str,
+                         error_message: Optional[str] = None) -> None:
+        """Close a job's running step with the job's final status and write it out"""
+        self._close_step(job_id, status, datetime.now(), error_message)
+        await self.flush()
+
+    def open_step(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Row values of the step a job is running, if any"""
+        return self.open_steps.get(job_id)
+
+    async def flush(self) -> int:
+        """Insert all finished steps in one transaction
+
+        Returns:
+            int: Number of rows inserted
+        """
+        timer = self._flush_timer
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        self._flush_timer = None
+
+        async with self._flush_lock:
+            rows, self.pending = self.pending, []
+            if not rows:
+                return 0
+
+            try:
+                written = await self.repository.insert_many(rows)
+            except Exception as e:
+                print(f"Error writing {len(rows)} job progress entries: {e}")
+                self.failed_flushes += 1
+                self.pending[:0] = rows
+                if self._flush_timer is None and self.flush_interval > 0:
+                    self._flush_timer = asyncio.create_task(self._flush_later())
+                return 0
+
+            self.rows_written += written
+            return written
+
+    async def shutdown(self) -> None:
+        """Write every finished step; steps still running are not recorded"""
+        await self.flush()
+        if self.pending:
+            print(f"Dropping {len(self.pending)} unwritten job progress entries at shutdown")
+            self.pending.clear()
+        if self._flush_timer:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _close_step(self, job_id: str, status: str, now: datetime,
+                    error_details: Optional[str] = None) -> None:
+        row = self.open_steps.pop(job_id, None)
+        if row is None:
+            return
+
+        row["status"] = status
+        row["completed_at"] = now
+        row["error_details"] = error_details
+        row["progress_percentage"] = 100 if status == "completed" else 0
+        row["details"]["duration_ms"] = int((now - row["started_at"]).total_seconds() * 1000)
+        self.pending.append(row)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+
+# Global instances, created on first use
+_job_write_buffer: Optional[JobWriteBuffer] = None
+_job_progress_recorder: Optional[JobProgressRecorder] = None
+
+
+def get_job_write_buffer() -> JobWriteBuffer:
+    """Get the process-wide job write buffer"""
+    global _job_write_buffer
+
+    if _job_write_buffer is None:
+        _job_write_buffer = JobWriteBuffer()
+    return _job_write_buffer
+
+
+def get_job_progress_recorder() -> JobProgressRecorder:
+    """Get the process-wide job progress recorder"""
+    global _job_progress_recorder
+
+    if _job_progress_recorder is None:
+        _job_progress_recorder = JobProgressRecorder()
+    return _job_progress_recorder
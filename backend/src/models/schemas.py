@@ -37,12 +37,26 @@ class JobCreateRequest(BaseModel):
     custom_prompt: Optional[str] = Field(None, description="Custom generation prompt")
     output_format: str = Field("markdown", description="Output format")
     priority: int = Field(0, description="Job priority (0=normal, 1=high)")
+    compression_ratio: Optional[float] = Field(
+        None, gt=0, le=1,
+        description="Target transcript token ratio after compression (1.0=cleanup only)"
+    )
+    mode: str = Field(
+        "realtime",
+        description="Processing mode: realtime, or batch (cheaper, completes within 24h)"
+    )
     
     @validator('video_url')
     def validate_youtube_url(cls, v):
         if 'youtube.com' not in v and 'youtu.be' not in v:
             raise ValueError('Must be a YouTube URL')
         return v
+    
+    @validator('mode')
+    def validate_mode(cls, v):
+        if v not in ('realtime', 'batch'):
+            raise ValueError('Mode must be realtime or batch')
+        return v
 
 
 class JobResponse(BaseModel):
@@ -67,12 +81,43 @@ class JobResponse(BaseModel):
     error_code: Optional[str]
     retry_count: int
     processing_time_seconds: Optional[int]
+    transcript_file_path: Optional[str] = None
     output_file_path: Optional[str]
-    
+    transcript_length: Optional[int] = None
+    output_length: Optional[int] = None
+    tokens_used: Optional[int] = None
+    job_metadata: Optional[Dict[str, Any]] = None
+
     class Config:
         from_attributes = True
 
 
+class JobSummary(BaseModel):
+    """Slim job schema for list views
+
+    Job lists load only these columns. Columns requested with ?fields= are
+    passed through as extra keys.
+    """
+    id: str
+    video_id: str
+    video_url: str
+    video_title: Optional[str]
+    video_thumbnail: Optional[str]
+    language_code: str
+    llm_provider: str
+    llm_model: Optional[str]
+    status: JobStatus
+    priority: Optional[int]
+    created_at: datetime
+    updated_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    processing_time_seconds: Optional[int]
+
+    class Config:
+        from_attributes = True
+        extra = "allow"
+
+
 class JobProgress(BaseModel):
     """Schema for job progress tracking"""
     job_id: str
@@ -85,6 +130,9 @@ class JobProgress(BaseModel):
     completed_at: Optional[datetime]
     error_details: Optional[str]
 
+    class Config:
+        from_attributes = True
+
 
 class VideoInfo(BaseModel):
     """Video information schema"""
@@ -164,6 +212,10 @@ class SystemStats(BaseModel):
     average_processing_time: float
     provider_health: Dict[str, bool]
     cache_stats: Dict[str, Any]
+    jobs_by_status: Dict[str, int] = {}
+    # p50/p90/p99 of processing_time_seconds, as histogram bucket bounds
+    processing_time_percentiles: Dict[str, float] = {}
+    provider_throughput: Dict[str, Dict[str, Any]] = {}
 
 
 class VideoValidationResponse(BaseModel):
@@ -4,10 +4,12 @@ from .video_service import VideoService
 from .job_service import JobService
 from .provider_service import ProviderService
 from .notification_service import NotificationService
+from .stats_service import StatsService
 
 __all__ = [
     "VideoService",
     "JobService", 
     "ProviderService",
-    "NotificationService"
+    "NotificationService",
+    "StatsService"
 ]
\ No newline at end of file
@@ -1,22 +1,62 @@
 """Job management service"""
 
-from typing import List, Optional, Dict, Any
+import base64
+import json
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from ..core.job_manager import JobManager
-from ..models.schemas import JobCreateRequest, JobResponse, JobProgress
+# Module import: job_manager imports services, so it may still be loading here
+from ..core import job_manager as job_manager_module
+from ..core.llm_providers import LLMProviderFactory
+from ..models.schemas import JobCreateRequest, JobResponse, JobProgress, JobSummary
 from ..models.enums import JobStatus
+from ..database.models import Job
 from ..database.repositories.job_repository import JobRepository
+from ..database.repositories.progress_repository import JobProgressRepository
 from .video_service import VideoService
 from .provider_service import ProviderService
 
 
+def encode_cursor(job) -> str:
+    """Opaque cursor pointing just past a job in newest-first order"""
+    raw = json.dumps([job.created_at.isoformat(), job.id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor from encode_cursor(); raises ValueError if malformed"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(job_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def list_columns(fields: Optional[str] = None) -> List[str]:
+    """Columns to load for a job list page: JobSummary's plus any extra `fields`
+    
+    Args:
+        fields: Comma-separated job column names; raises ValueError for unknown ones
+    """
+    columns = list(JobSummary.model_fields)
+    for name in (fields or "").split(","):
+        name = name.strip()
+        if not name or name in columns:
+            continue
+        if name not in Job.__table__.columns:
+            raise ValueError(f"Unknown job field: {name}")
+        columns.append(name)
+    return columns
+
+
 class JobService:
     """Service for job-related operations"""
     
     def __init__(self):
-        self.job_manager = JobManager()
+        self.job_manager = job_manager_module.JobManager()
         self.job_repository = JobRepository()
+        self.progress_repository = JobProgressRepository()
         self.video_service = VideoService()
         self.provider_service = ProviderService()
     
@@ -30,6 +70,9 @@ class JobService:
         if not self.provider_service.is_provider_supported(request.llm_provider):
             raise ValueError(f"Unsupported provider: {request.llm_provider}")
         
+        if request.mode == "batch" and not LLMProviderFactory.supports_batch(request.llm_provider):
+            raise ValueError(f"Provider does not support batch mode: {request.llm_provider}")
+        
         # Create job through job manager
         job_id = await self.job_manager.create_job(request)
         
@@ -38,8 +81,10 @@ class JobService:
         if not job:
             raise RuntimeError("Failed to create job")
         
-        # Start job processing if system can accept it
-        if self.job_manager.can_accept_new_job():
+        # Batch jobs wait for the next provider batch; others start if there is capacity
+        if request.mode == "batch":
+            await self.job_manager.enqueue_batch_job(job_id)
+        elif self.job_manager.can_accept_new_job():
             await self.job_manager.start_job(job_id)
         
         return job
@@ -50,14 +95,30 @@ class JobService:
     
     async def get_jobs(self, status: Optional[JobStatus] = None, 
                       provider: Optional[str] = None,
-                      limit: int = 100, offset: int = 0) -> List[JobResponse]:
-        """Get jobs with optional filtering"""
-        if status:
-            return await self.job_repository.get_by_status(status, limit)
-        elif provider:
-            return await self.job_repository.get_jobs_by_provider(provider, limit)
-        else:
-            return await self.job_repository.get_all(limit, offset)
+                      limit: int = 100, offset: int = 0,
+                      cursor: Optional[str] = None,
+                      include_archived: bool = False,
+                      columns: Optional[List[str]] = None) -> Tuple[List[JobResponse], Optional[str]]:
+        """Get a page of jobs, newest first, with optional filtering
+        
+        Args:
+            columns: Load only these columns; jobs are then result rows
+        
+        Returns:
+            Tuple[List[JobResponse], Optional[str]]: The jobs, and the cursor
+            for the next page or None on the last page
+        """
+        after = decode_cursor(cursor) if cursor else None
+        
+        # One extra row tells whether another page follows
+        jobs = await self.job_repository.list_jobs(
+            status, provider, limit + 1, after=after, offset=0 if after else offset,
+            include_archived=include_archived, columns=columns
+        )
+        if len(jobs) <= limit:
+            return jobs, None
+        jobs = jobs[:limit]
+        return jobs, encode_cursor(jobs[-1])
     
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job"""
@@ -75,16 +136,23 @@ class JobService:
             language_code=original_job.language_code,
             llm_provider=original_job.llm_provider,
             llm_model=original_job.llm_model,
-            priority=1  # Give retry jobs higher priority
+            priority=1,  # Give retry jobs higher priority
+            mode=(original_job.job_metadata or {}).get("mode", "realtime")
         )
         
         return await self.create_job(retry_request)
     
     async def get_job_progress(self, job_id: str) -> List[JobProgress]:
-        """Get detailed progress for a job"""
-        # This would fetch from job_progress table
-        # For now, return mock data
-        return []
+        """Get a job's step timeline: finished steps, then the running one"""
+        timeline = [
+            JobProgress.model_validate(entry)
+            for entry in await self.progress_repository.get_timeline(job_id)
+        ]
+        
+        running = self.job_manager.progress_recorder.open_step(job_id)
+        if running:
+            timeline.append(JobProgress(**running))
+        return timeline
     
     async def get_job_result(self, job_id: str) -> Optional[str]:
         """Get the result content for a completed job"""
@@ -1,17 +1,59 @@
 """WebSocket notification service"""
 
+import asyncio
 import json
-from typing import Dict, Any
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 from datetime import datetime
 
 from ..api.websocket.manager import WebSocketManager
+from ..core.event_bus import JOB_EVENTS_CHANNEL, EventBus, get_event_bus
+from ..models.enums import JobStatus
+from ..web.config import get_settings
+
+TERMINAL_STATUSES = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
 
 
 class NotificationService:
-    """Service for sending WebSocket notifications"""
+    """Service for sending WebSocket notifications
+    
+    Progress updates are coalesced per job: at most one is sent per
+    coalescing window and the latest update wins. Status transitions,
+    errors and completions are never coalesced. Any pending progress for
+    the job is flushed first, so clients see events in the order they
+    happened.
+    
+    Messages are published on the event bus rather than sent directly, so
+    clients connected to any worker receive them.
+    """
     
-    def __init__(self):
+    def __init__(self, coalesce_window: Optional[float] = None,
+                 event_bus: Optional[EventBus] = None, max_sequenced_jobs: int = 1000):
         self._websocket_manager =None 
+        self._event_bus = event_bus
+        
+        if coalesce_window is None:
+            coalesce_window = get_settings().notification_coalesce_window_ms / 1000
+        self.coalesce_window = coalesce_window
+        
+        # job_id -> latest unsent progress message
+        self._pending_progress: Dict[str, Dict[str, Any]] = {}
+        # job_id -> task that sends the pending progress when the window closes
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        # job_id -> monotonic time of the last progress broadcast
+        self._last_progress_sent: Dict[str, float] = {}
+        
+        # job_id -> sequence number of the last published event, least
+        # recently published first. Kept after a job finishes (a cancelled
+        # job can still get a second terminal update) for as many jobs as
+        # the replay buffer holds, so numbering never restarts while clients
+        # may still resume from it
+        self._sequences: "OrderedDict[str, int]" = OrderedDict()
+        self.max_sequenced_jobs = max_sequenced_jobs
+        
+        self.progress_sent = 0
+        self.progress_coalesced = 0
     
     @property
     def websocket_manager(self):
@@ -21,6 +63,30 @@ class NotificationService:
             self._websocket_manager = websocket_manager
         return self._websocket_manager
     
+    @property
+    def event_bus(self) -> EventBus:
+        """Lazy-loaded event bus"""
+        if self._event_bus is None:
+            self._event_bus = get_event_bus()
+        return self._event_bus
+    
+    async def publish(self, message: Dict[str, Any]) -> None:
+        """Publish a job event to every worker's WebSocket clients
+        
+        Each event gets the job's next sequence number so clients can resume
+        from the last one they saw.
+        """
+        job_id = message["job_id"]
+        self._sequences[job_id] = self._sequences.get(job_id, 0) + 1
+        self._sequences.move_to_end(job_id)
+        while len(self._sequences) > self.max_sequenced_jobs:
+            self._sequences.popitem(last=False)
+        message["sequence"] = self._sequences[job_id]
+        
+        # Make sure this process's own clients are listening too
+        await self.websocket_manager.attach_event_bus(self.event_bus)
+        await self.event_bus.publish(JOB_EVENTS_CHANNEL, message)
+    
     async def broadcast_job_update(self, job_id: str, data: Dict[str, Any]) -> None:
         """Broadcast job status update to subscribed clients"""
         message = {
@@ -30,10 +96,12 @@ class NotificationService:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.websocket_manager.broadcast_to_job(job_id, message)
+        await self._send_ordered(job_id, message)
+        if data.get("status") in TERMINAL_STATUSES:
+            self._forget_job(job_id)
     
     async def broadcast_progress_update(self, job_id: str, progress_data: Dict[str, Any]) -> None:
-        """Broadcast job progress update"""
+        """Broadcast job progress update, coalesced per job"""
         message = {
             "type": "progress_update", 
             "job_id": job_id,
@@ -41,7 +109,59 @@ class NotificationService:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.websocket_manager.broadcast_to_job(job_id, message)
+        if self.coalesce_window <= 0:
+            await self._send_progress(job_id, message)
+            return
+        
+        elapsed = time.monotonic() - self._last_progress_sent.get(job_id, float("-inf"))
+        if job_id not in self._pending_progress and elapsed >= self.coalesce_window:
+            # Window is open: send right away
+            await self._send_progress(job_id, message)
+            return
+        
+        if job_id in self._pending_progress:
+            self.progress_coalesced += 1
+        self._pending_progress[job_id] = message
+        
+        if job_id not in self._flush_tasks:
+            delay = max(self.coalesce_window - elapsed, 0)
+            self._flush_tasks[job_id] = asyncio.create_task(self._flush_later(job_id, delay))
+    
+    async def flush_job(self, job_id: str) -> None:
+        """Send any pending progress for a job immediately"""
+        task = self._flush_tasks.pop(job_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+        
+        message = self._pending_progress.pop(job_id, None)
+        if message is not None:
+            await self._send_progress(job_id, message)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get notification statistics"""
+        return {
+            "coalesce_window_ms": int(self.coalesce_window * 1000),
+            "progress_sent": self.progress_sent,
+            "progress_coalesced": self.progress_coalesced,
+            "jobs_pending": len(self._pending_progress),
+        }
+    
+    async def _send_progress(self, job_id: str, message: Dict[str, Any]) -> None:
+        self._last_progress_sent[job_id] = time.monotonic()
+        self.progress_sent += 1
+        await self.publish(message)
+    
+    async def _send_ordered(self, job_id: str, message: Dict[str, Any]) -> None:
+        """Send a message that must not be coalesced, after any earlier progress"""
+        await self.flush_job(job_id)
+        await self.publish(message)
+    
+    async def _flush_later(self, job_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self.flush_job(job_id)
+    
+    def _forget_job(self, job_id: str) -> None:
+        self._last_progress_sent.pop(job_id, None)
     
     async def send_error_notification(self, job_id: str, error_data: Dict[str, Any]) -> None:
         """Send error notification to clients"""
@@ -52,7 +172,7 @@ class NotificationService:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.websocket_manager.broadcast_to_job(job_id, message)
+        await self._send_ordered(job_id, message)
     
     async def send_completion_notification(self, job_id: str, result_data: Dict[str, Any]) -> None:
         """Send job completion notification"""
@@ -63,4 +183,5 @@ class NotificationService:
             "timestamp": datetime.now().isoformat()
         }
         
-        await self.websocket_manager.broadcast_to_job(job_id, message)
\ No newline at end of file
+        await self._send_ordered(job_id, message)
+        self._forget_job(job_id)
\ No newline at end of file
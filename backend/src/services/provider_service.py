@@ -46,7 +46,7 @@ class ProviderService:
         
         for provider_enum, config in self.providers_config.items():
             # Check cached health status
-            health_status = await self._get_provider_health(provider_enum.value)
+            health_status = await self.get_provider_health(provider_enum.value)
             
             provider_info = ProviderInfo(
                 name=provider_enum.value,
@@ -72,7 +72,7 @@ class ProviderService:
         if not config:
             return None
         
-        health_status = await self._get_provider_health(provider_name)
+        health_status = await self.get_provider_health(provider_name)
         
         return ProviderInfo(
             name=provider_name,
@@ -119,7 +119,7 @@ class ProviderService:
         
         return health_data
     
-    async def _get_provider_health(self, provider_name: str) -> Dict:
+    async def get_provider_health(self, provider_name: str) -> Dict:
         """Get cached provider health status"""
         cache_key = f"provider_health:{provider_name}"
         cached_health = await self.cache_manager.get(cache_key, "provider_health")
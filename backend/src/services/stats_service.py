@@ -0,0 +1,127 @@
+"""Job statistics service"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+from ..core.generation_cache import get_generation_cache
+from ..database.repositories.stats_repository import FINISHED_COUNTERS, JobStatsRepository
+from ..models.enums import JobStatus, LLMProvider
+from ..models.schemas import SystemStats
+from .provider_service import ProviderService
+
+
+def histogram_percentiles(histogram: List[Tuple[int, int]],
+                          quantiles: Sequence[float] = (0.5, 0.9, 0.99)) -> Dict[str, float]:
+    """Approximate percentiles from (bucket upper bound, count) pairs
+
+    Each percentile is reported as the upper bound of the bucket it falls in.
+    """
+    total = sum(count for _, count in histogram)
+    if not total:
+        return {}
+
+    percentiles = {}
+    for quantile in quantiles:
+        rank = quantile * total
+        seen = 0
+        for bound, count in histogram:
+            seen += count
+            if seen >= rank:
+                percentiles[f"p{int(quantile * 100)}"] = float(bound)
+                break
+    return percentiles
+
+
+class StatsService:
+    """Service for job statistics
+
+    Counts and processing times are kept in daily rollup tables updated as
+    each job is created and finishes, so rendering the dashboard reads a few
+    rows per provider per day rather than scanning the jobs table.
+    """
+
+    def __init__(self):
+        self.stats_repository = JobStatsRepository()
+        self.provider_service = ProviderService()
+
+    async def record_job_created(self, job) -> None:
+        """Count a newly created job"""
+        try:
+            await self.stats_repository.increment_daily(
+                job.created_at.date(), job.llm_provider, created_count=1
+            )
+        except Exception as e:
+            print(f"Error recording job stats for {job.id}: {e}")
+
+    async def record_job_finished(self, job) -> None:
+        """Count a job that reached a terminal status, with its processing time"""
+        status = getattr(job.status, "value", job.status)
+        if status not in FINISHED_COUNTERS:
+            return
+
+        day = (job.completed_at or job.updated_at or datetime.now()).date()
+        counters = {FINISHED_COUNTERS[status]: 1}
+        seconds = job.processing_time_seconds
+        if status == JobStatus.COMPLETED.value and seconds is not None:
+            counters.update(timed_count=1, processing_seconds_total=seconds)
+
+        try:
+            await self.stats_repository.increment_daily(day, job.llm_provider, **counters)
+            if "timed_count" in counters:
+                await self.stats_repository.increment_duration(day, job.llm_provider, seconds)
+        except Exception as e:
+            print(f"Error recording job stats for {job.id}: {e}")
+
+    async def get_system_stats(self, active_jobs: int = 0, days: int = 1) -> SystemStats:
+        """Dashboard statistics for today and the previous `days - 1` days
+
+        Args:
+            active_jobs: Jobs running now, from the job manager
+            days: Length of the window in days, ending today
+        """
+        since = date.today() - timedelta(days=days - 1)
+        hours = (datetime.now() - datetime.combine(since, datetime.min.time())).total_seconds() / 3600
+
+        totals = await self.stats_repository.get_daily_totals(since)
+        histogram = await self.stats_repository.get_duration_histogram(since)
+
+        jobs_by_status = {counter.replace("_count", ""): 0 for counter in FINISHED_COUNTERS.values()}
+        provider_throughput = {}
+        timed = seconds = created = 0
+        for provider, counts in totals.items():
+            for counter in FINISHED_COUNTERS.values():
+                jobs_by_status[counter.replace("_count", "")] += counts[counter]
+            created += counts["created_count"]
+            timed += counts["timed_count"]
+            seconds += counts["processing_seconds_total"]
+
+            finished = sum(counts[counter] for counter in FINISHED_COUNTERS.values())
+            provider_throughput[provider] = {
+                "created": counts["created_count"],
+                "completed": counts["completed_count"],
+                "completed_per_hour": round(counts["completed_count"] / max(hours, 1e-9), 2),
+                "success_rate": round(counts["completed_count"] / finished, 3) if finished else None,
+            }
+        jobs_by_status["active"] = active_jobs
+
+        # Cached by the provider service, so most reads do no health checks
+        provider_health = {}
+        for provider in LLMProvider:
+            health = await self.provider_service.get_provider_health(provider.value)
+            provider_health[provider.value] = health["is_available"]
+
+        cache = get_generation_cache()
+        return SystemStats(
+            active_jobs=active_jobs,
+            total_jobs_today=created,
+            average_processing_time=round(seconds / timed, 2) if timed else 0.0,
+            provider_health=provider_health,
+            cache_stats=cache.get_stats() if cache else {},
+            jobs_by_status=jobs_by_status,
+            processing_time_percentiles=histogram_percentiles(histogram),
+            provider_throughput=provider_throughput,
+        )
+
+    async def rebuild(self, days: int) -> None:
+        """Recompute the rollups for the last `days` days from the jobs table"""
+        await self.stats_repository.rebuild(date.today() - timedelta(days=days - 1))
@@ -65,14 +65,38 @@ def create_app() -> FastAPI:
         """Initialize application on startup"""
         await init_db()
         
+        # Receive job events published by any worker
+        from ..api.websocket.manager import websocket_manager
+        from ..core.event_bus import get_event_bus
+        await websocket_manager.attach_event_bus(get_event_bus())
+        
+        # Ping idle WebSocket clients and close dead ones
+        websocket_manager.start_heartbeat()
+        
+        # Resume polling provider batches submitted before a restart
+        from ..api.v1.jobs import job_service
+        try:
+            recovered = await job_service.job_manager.batch_scheduler.recover()
+            if recovered:
+                print(f"Recovered {recovered} unfinished batch jobs")
+        except Exception as e:
+            print(f"Batch job recovery failed: {str(e)}")
+        
         # Start background cleanup tasks
         asyncio.create_task(start_background_tasks())
     
     @app.on_event("shutdown") 
     async def shutdown_event():
         """Cleanup on application shutdown"""
-        # Perform cleanup tasks
-        pass
+        from ..api.websocket.manager import websocket_manager
+        from ..core.event_bus import get_event_bus
+        from ..api.websocket.system_stats import system_stats_broadcaster
+        from ..database.write_buffer import get_job_progress_recorder, get_job_write_buffer
+        await websocket_manager.stop_heartbeat()
+        await system_stats_broadcaster.stop()
+        await get_job_progress_recorder().shutdown()
+        await get_job_write_buffer().shutdown()
+        await get_event_bus().close()
     
     # Health check endpoint
     @app.get("/health")
@@ -90,7 +114,6 @@ def create_app() -> FastAPI:
 async def start_background_tasks():
     """Start background maintenance tasks"""
     from ..core.job_manager import JobManager
-    from ..api.websocket.manager import websocket_manager
     from ..core.file_manager import FileManager
     from ..core.cache_manager import CacheManager
     
@@ -100,9 +123,6 @@ async def start_background_tasks():
     
     while True:
         try:
-            # Clean up stale WebSocket connections every 5 minutes
-            await websocket_manager.cleanup_stale_connections()
-            
             # Clean up expired cache entries every 10 minutes
             await cache_manager.cleanup_expired()
             
@@ -29,10 +29,50 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./blogtube.db"
     database_echo: bool = False
+    # Apply pending Alembic migrations when the app starts
+    database_migrate_on_startup: bool = True
+    
+    # SQLite tuning profile: "production" (WAL and pragmas below) or "default"
+    sqlite_profile: str = "production"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size_mb: int = 256
+    sqlite_cache_size_mb: int = 64
+    
+    # Connection pool for server databases such as PostgreSQL
+    database_pool_size: int = 10
+    database_max_overflow: int = 20
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 1800
+    
+    # Job record writes are coalesced per job and flushed in one transaction
+    # after this many ms or this many pending jobs (0 ms writes through)
+    job_write_flush_interval_ms: int = 200
+    job_write_max_pending: int = 50
     
     # Redis (for caching and WebSocket - optional)
     redis_url: str = "redis://localhost:6379"
     
+    # Job event pub/sub: memory:// (single process), redis://... or sqlite:///path
+    event_bus_url: str = "memory://"
+    
+    # WebSocket outbound queues (overflow policy: drop_oldest or disconnect)
+    websocket_queue_size: int = 256
+    websocket_overflow_policy: str = "drop_oldest"
+    websocket_replay_buffer_size: int = 100
+    
+    # Server pings after this many idle seconds; closes after the idle timeout
+    websocket_heartbeat_interval: int = 30
+    websocket_idle_timeout: int = 90
+    
+    # Offer permessage-deflate compression to WebSocket clients that ask for it
+    websocket_per_message_deflate: bool = True
+    
+    # How often /ws/system subscribers get a stats update
+    system_stats_interval_seconds: int = 30
+    
+    # At most one progress update per job per window (0 disables coalescing)
+    notification_coalesce_window_ms: int = 250
+    
     # Security
     secret_key: str = "dev-secret-key-change-in-production"
     access_token_expire_minutes: int = 30
@@ -41,11 +81,34 @@ class Settings(BaseSettings):
     max_concurrent_jobs: int = 5
     job_timeout_minutes: int = 30
     
+    # Finished jobs older than this move to the jobs_archive table (0 keeps them)
+    job_retention_days: int = 30
+    job_archive_batch_size: int = 500
+    
+    # Finished jobs kept in memory for fast lookups. Unfinished jobs are kept
+    # until they have had no update for the TTL, at most max_size of them too
+    job_registry_max_size: int = 1000
+    job_registry_active_ttl_seconds: int = 3600
+
+    # Batch mode (provider batch APIs for non-urgent jobs)
+    batch_max_size: int = 100
+    batch_flush_interval_seconds: int = 900
+    batch_poll_interval_seconds: int = 60
+    
     # File Storage
     output_directory: str = "output"
     transcript_directory: str = "transcripts"
     temp_directory: str = "temp"
-    
+
+    # Generation cache
+    generation_cache_enabled: bool = True
+    generation_cache_directory: str = "cache/generations"
+    generation_cache_max_mb: int = 200
+
+    # Transcript compression (1.0 = cleanup only, no sentences dropped)
+    transcript_compression_enabled: bool = True
+    transcript_compression_ratio: float = 1.0
+
     # LLM API Keys (optional)
     openai_api_key: str = ""
     anthropic_api_key: str = ""
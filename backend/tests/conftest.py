@@ -3,10 +3,15 @@ Test configuration and fixtures
 """
 
 import pytest
+import pytest_asyncio
 import tempfile
 import os
 from unittest.mock import Mock
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database import connection
+
 
 @pytest.fixture
 def sample_video_id():
@@ -92,3 +97,30 @@ def mock_transcript_languages():
             'is_translatable': False
         }
     ]
+
+
+@pytest_asyncio.fixture
+async def use_database(monkeypatch):
+    """Point the repositories at a SQLite file; returns its async engine."""
+    engines = []
+
+    def use(path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        monkeypatch.setattr(connection, "engine", engine)
+        monkeypatch.setattr(connection, "async_session_maker",
+                            async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+        engines.append(engine)
+        return engine
+
+    yield use
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def temp_database(tmp_path, use_database):
+    """Empty database with every table created, used by the repositories."""
+    engine = use_database(tmp_path / "blogtube.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(connection.Base.metadata.create_all)
+    return engine
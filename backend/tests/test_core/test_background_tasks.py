@@ -0,0 +1,164 @@
+"""
+Tests for the realtime job path of the background task processor
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import background_tasks
+from src.core import job_manager as job_manager_module
+from src.core.background_tasks import BackgroundTaskProcessor
+from src.core.generation_cache import GenerationCache
+from src.core.job_manager import JobManager
+from src.core.job_registry import JobRegistry
+from src.models.enums import JobStatus
+from src.models.schemas import JobResponse
+
+TRANSCRIPT = " ".join(
+    f"Sentence {n} explains how the cache keys prompts on their exact text." for n in range(40)
+)
+
+
+class RecordingJobManager:
+    """Job manager stand-in holding jobs in memory and recording statuses."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.job_registry = jobs
+        self.statuses = {}
+        self.progress_recorder = SimpleNamespace(step_started=self._ignore)
+        self.notification_service = SimpleNamespace(broadcast_progress_update=self._ignore)
+
+    async def _ignore(self, *args, **kwargs):
+        pass
+
+    async def get_job(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def update_job_status(self, job_id, status, error_message=None):
+        self.statuses.setdefault(job_id, []).append(status)
+
+
+def make_job(job_id):
+    now = datetime.now()
+    return SimpleNamespace(
+        id=job_id, video_url="https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        video_id="", video_title=None, video_duration=None, video_thumbnail=None,
+        language_code="en", llm_provider="fake", created_at=now, updated_at=now,
+        started_at=None, transcript_file_path=None, output_file_path=None,
+        transcript_length=None, output_length=None, tokens_used=None, job_metadata=None,
+    )
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """Processor running FakeProvider with YouTube calls replaced and files in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FAKE_LLM_LATENCY_MS", "0")
+    monkeypatch.setattr(background_tasks, "get_video_info",
+                        lambda video_id: {"title": "Caching 101", "thumbnail_url": None})
+    monkeypatch.setattr(background_tasks, "list_transcript_languages",
+                        lambda video_id: [{"code": "en"}])
+    monkeypatch.setattr(background_tasks, "fetch_transcript",
+                        lambda video_id, language_code: TRANSCRIPT)
+
+    job_manager = RecordingJobManager({"job-1": make_job("job-1"), "job-2": make_job("job-2")})
+    processor = BackgroundTaskProcessor(job_manager)
+    processor.generation_cache = GenerationCache(str(tmp_path / "generations"))
+    return processor
+
+
+class TestRealtimeJobs:
+    """process_job generation through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_identical_job_served_from_cache(self, processor, monkeypatch):
+        calls = []
+        create_provider = processor.llm_factory.create_provider
+
+        def counting_provider(name):
+            provider = create_provider(name)
+            complete = provider.complete
+
+            def counted(prompt):
+                calls.append(prompt)
+                return complete(prompt)
+
+            provider.complete = counted
+            return provider
+
+        monkeypatch.setattr(processor.llm_factory, "create_provider", counting_provider)
+
+        await processor.process_job("job-1")
+        await processor.process_job("job-2")
+
+        first, second = (processor.job_manager.jobs[job_id] for job_id in ("job-1", "job-2"))
+        assert processor.job_manager.statuses == {"job-1": [JobStatus.COMPLETED],
+                                                  "job-2": [JobStatus.COMPLETED]}
+        assert len(calls) == 1
+
+        assert first.job_metadata["generation_cache"]["hit"] is False
+        assert second.job_metadata["generation_cache"] == {
+            "hit": True, "key": first.job_metadata["generation_cache"]["key"]
+        }
+        assert "token_budget" in second.job_metadata
+
+        assert first.transcript_length == second.transcript_length == len(TRANSCRIPT)
+        assert first.tokens_used > 0
+        assert second.tokens_used == 0
+        assert first.output_length == second.output_length > 0
+        assert processor.generation_cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_finish_saves_job_dropped_from_registry(tmp_path, monkeypatch):
+    """A job evicted while waiting on a batch completes with its output fields."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(job_manager_module, "get_job_registry",
+                        lambda registry=JobRegistry(max_size=1, active_ttl=0): registry)
+    manager = JobManager()
+    now = datetime.now()
+    stored = JobResponse(
+        id="job-1", video_id="vid", video_url="https://youtu.be/vid", language_code="en",
+        llm_provider="openai", status=JobStatus.GENERATING_BLOG, priority=1,
+        created_at=now, updated_at=now, retry_count=0, **dict.fromkeys((
+            "video_title", "video_duration", "video_thumbnail", "language_name", "llm_model",
+            "started_at", "completed_at", "error_message", "error_code",
+            "processing_time_seconds", "output_file_path",
+        ))
+    )
+
+    # The processor's copy is unpinned after the TTL, then evicted
+    job = stored.model_copy()
+    manager.job_registry["job-1"] = job
+    manager.job_registry["other"] = stored.model_copy(update={"id": "other",
+                                                              "status": JobStatus.COMPLETED})
+    assert "job-1" not in manager.job_registry
+
+    saved = []
+
+    async def record_put(job, flush=False):
+        saved.append(job.model_copy())
+
+    async def ignore(*args, **kwargs):
+        pass
+
+    async def load_stale(job_id):
+        return stored
+
+    monkeypatch.setattr(manager.job_repository, "get_by_id", load_stale)
+    monkeypatch.setattr(manager.write_buffer, "put", record_put)
+    monkeypatch.setattr(manager.progress_recorder, "step_started", ignore)
+    monkeypatch.setattr(manager.progress_recorder, "finish_job", ignore)
+    monkeypatch.setattr(manager.notification_service, "broadcast_job_update", ignore)
+    monkeypatch.setattr(manager.notification_service, "broadcast_progress_update", ignore)
+    monkeypatch.setattr(manager.stats_service, "record_job_finished", ignore)
+
+    job.tokens_used = 1234
+    await BackgroundTaskProcessor(manager)._finish_job("job-1", job, "# Post")
+
+    assert saved[-1].status == JobStatus.COMPLETED
+    assert saved[-1].tokens_used == 1234
+    assert saved[-1].output_file_path
@@ -0,0 +1,262 @@
+"""
+Unit tests for provider batch interfaces and the batch scheduler
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.batch_scheduler import BatchScheduler
+from src.core.llm_providers import (
+    AnthropicBatchProvider, BatchProvider, LLMProviderFactory, OpenAIBatchProvider
+)
+from src.models.enums import JobStatus
+
+
+class StubBatchAPI(BaseHTTPRequestHandler):
+    """Minimal OpenAI/Anthropic batch endpoints that echo prompts back."""
+
+    state = {}
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body, content_type="application/json"):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers["Content-Length"]))
+
+    def do_POST(self):
+        state = self.state
+        state.setdefault("headers", []).append(dict(self.headers))
+        if self.path == "/openai/files":
+            raw = self._body().decode()
+            # Pull the JSONL payload out of the multipart body
+            lines = [line for line in raw.splitlines() if line.startswith('{"custom_id"')]
+            state["openai_requests"] = [json.loads(line) for line in lines]
+            self._send({"id": "file-in"})
+        elif self.path == "/openai/batches":
+            state["openai_batch"] = json.loads(self._body())
+            self._send({"id": "batch_1", "status": "validating"})
+        elif self.path == "/anthropic/messages/batches":
+            state["anthropic_requests"] = json.loads(self._body())["requests"]
+            self._send({"id": "msgbatch_1", "processing_status": "in_progress"})
+
+    def do_GET(self):
+        state = self.state
+        polls = state.setdefault("polls", 0)
+        if self.path == "/openai/batches/batch_1":
+            state["polls"] = polls + 1
+            done = state["polls"] > 1
+            self._send({"id": "batch_1", "status": "completed" if done else "in_progress",
+                        "output_file_id": "file-out" if done else None})
+        elif self.path == "/openai/files/file-out/content":
+            lines = []
+            for request in state["openai_requests"]:
+                prompt = request["body"]["messages"][-1]["content"]
+                if "FAIL" in prompt:
+                    lines.append({"custom_id": request["custom_id"], "response": None,
+                                  "error": {"message": "boom"}})
+                    continue
+                lines.append({"custom_id": request["custom_id"], "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": f"post for {prompt}"}}]},
+                }})
+            self._send("\n".join(json.dumps(line) for line in lines).encode(),
+                       "application/jsonl")
+        elif self.path == "/anthropic/messages/batches/msgbatch_1":
+            host = f"http://{self.headers['Host']}"
+            self._send({"id": "msgbatch_1", "processing_status": "ended",
+                        "results_url": f"{host}/anthropic/results/msgbatch_1"})
+        elif self.path == "/anthropic/results/msgbatch_1":
+            lines = [
+                {"custom_id": request["custom_id"], "result": {
+                    "type": "succeeded",
+                    "message": {"content": [{"type": "text",
+                                             "text": f"post for {request['params']['messages'][0]['content']}"}]},
+                }}
+                for request in state["anthropic_requests"]
+            ]
+            self._send("\n".join(json.dumps(line) for line in lines).encode(),
+                       "application/jsonl")
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub batch API on a local port."""
+    StubBatchAPI.state = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBatchAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", StubBatchAPI.state
+    server.shutdown()
+    server.server_close()
+
+
+class TestBatchProviders:
+    """Test batch clients against the local stub server."""
+
+    def test_openai_round_trip(self, stub_server):
+        """Prompts are uploaded as JSONL and results mapped back by custom ID."""
+        base_url, state = stub_server
+        provider = OpenAIBatchProvider(api_key="test-key", base_url=f"{base_url}/openai")
+
+        batch_id = provider.submit_batch({"job-1": "one", "job-2": "FAIL"}, {"job-1": 1500})
+
+        assert batch_id == "batch_1"
+        assert state["openai_batch"]["endpoint"] == "/v1/chat/completions"
+        assert state["openai_requests"][0]["body"]["max_tokens"] == 1500
+        assert state["openai_requests"][1]["body"]["max_tokens"] == provider.max_tokens
+        assert state["headers"][0]["Authorization"] == "Bearer test-key"
+
+        assert provider.get_batch_status(batch_id) == BatchProvider.IN_PROGRESS
+        assert provider.get_batch_status(batch_id) == BatchProvider.COMPLETED
+        assert provider.get_batch_results(batch_id) == {"job-1": "post for one", "job-2": None}
+
+    def test_anthropic_round_trip(self, stub_server):
+        """Message batches are submitted inline and results fetched from results_url."""
+        base_url, state = stub_server
+        provider = AnthropicBatchProvider(api_key="test-key", base_url=f"{base_url}/anthropic")
+
+        batch_id = provider.submit_batch({"job-1": "one"})
+
+        assert state["headers"][0]["x-api-key"] == "test-key"
+        assert provider.get_batch_status(batch_id) == BatchProvider.COMPLETED
+        assert provider.get_batch_results(batch_id) == {"job-1": "post for one"}
+
+    def test_factory_batch_support(self):
+        """Only providers with batch endpoints are batch-capable."""
+        assert LLMProviderFactory.supports_batch("anthropic")
+        assert LLMProviderFactory.supports_batch("openai")
+        assert not LLMProviderFactory.supports_batch("gemini")
+        with pytest.raises(ValueError):
+            LLMProviderFactory.create_batch_provider("gemini")
+
+
+class RecordingJobManager:
+    """Job manager stand-in that records status changes."""
+
+    def __init__(self):
+        self.statuses = {}
+
+    async def update_job_status(self, job_id, status, error_message=None):
+        self.statuses.setdefault(job_id, []).append(status)
+
+
+class StubJob:
+    llm_provider = "openai"
+    job_metadata = None
+
+
+class StubProcessor:
+    """Processor stand-in that skips YouTube and file I/O."""
+
+    completed = {}
+
+    def __init__(self, job_manager):
+        self.job_manager = job_manager
+
+    async def prepare_batch_request(self, job_id, batch_provider):
+        return {"job": StubJob(), "prompt": f"prompt {job_id}",
+                "params": {"max_tokens": None},
+                "cached_content": "cached" if job_id == "cached-job" else None}
+
+    async def complete_batch_job(self, job_id, request, content, batch_provider):
+        self.completed[job_id] = content
+        await self.job_manager.update_job_status(job_id, JobStatus.COMPLETED)
+
+
+class TestBatchScheduler:
+    """Test accumulation, submission and fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_size_triggered_flush(self, stub_server, monkeypatch):
+        """A full batch is submitted, polled and fanned back out per job."""
+        base_url, state = stub_server
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{base_url}/openai")
+        StubProcessor.completed = {}
+
+        job_manager = RecordingJobManager()
+        scheduler = BatchScheduler(job_manager, max_batch_size=3,
+                                   flush_interval=3600, poll_interval=0)
+
+        with patch("src.core.background_tasks.BackgroundTaskProcessor", StubProcessor):
+            await scheduler.enqueue("job-1", "openai")
+            await scheduler.enqueue("cached-job", "openai")
+            assert scheduler.get_pending_count() == 2
+            await scheduler.enqueue("job-2", "openai")
+            assert scheduler.get_pending_count() == 0
+
+            for task in list(scheduler._tasks):
+                await task
+
+        assert [request["custom_id"] for request in state["openai_requests"]] == ["job-1", "job-2"]
+        assert StubProcessor.completed == {
+            "cached-job": "cached",
+            "job-1": "post for prompt job-1",
+            "job-2": "post for prompt job-2",
+        }
+        assert job_manager.statuses["job-1"] == [JobStatus.GENERATING_BLOG, JobStatus.COMPLETED]
+        assert scheduler.active_batches == {}
+
+    @pytest.mark.asyncio
+    async def test_recover_after_restart(self, stub_server, monkeypatch):
+        """Submitted batches are polled again and unsubmitted batch jobs re-queued."""
+        base_url, state = stub_server
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{base_url}/openai")
+        # batch_1 was submitted by the previous process
+        state["openai_requests"] = [{"custom_id": "job-1",
+                                     "body": {"messages": [{"content": "one"}]}}]
+        StubProcessor.completed = {}
+
+        jobs = {
+            "job-1": SimpleNamespace(id="job-1", llm_provider="openai", job_metadata={
+                "mode": "batch", "batch": {"id": "batch_1", "provider": "openai"}}),
+            "job-2": SimpleNamespace(id="job-2", llm_provider="openai",
+                                     job_metadata={"mode": "batch"}),
+            "job-3": SimpleNamespace(id="job-3", llm_provider="openai", job_metadata=None),
+        }
+
+        async def get_active_jobs():
+            return list(jobs.values())
+
+        async def get_job(job_id):
+            return jobs.get(job_id)
+
+        job_manager = RecordingJobManager()
+        job_manager.job_repository = SimpleNamespace(get_active_jobs=get_active_jobs)
+        job_manager.get_job = get_job
+        scheduler = BatchScheduler(job_manager, max_batch_size=10,
+                                   flush_interval=3600, poll_interval=0)
+
+        with patch("src.core.background_tasks.BackgroundTaskProcessor", StubProcessor):
+            assert await scheduler.recover() == 2
+            assert scheduler.pending == {"openai": ["job-2"]}
+            for _ in range(200):
+                if StubProcessor.completed:
+                    break
+                await asyncio.sleep(0.01)
+            await scheduler.shutdown()
+
+        assert StubProcessor.completed == {"job-1": "post for one"}
+        assert job_manager.statuses == {"job-1": [JobStatus.COMPLETED]}
+
+    @pytest.mark.asyncio
+    async def test_unsupported_provider_rejected(self):
+        """Jobs for providers without batch endpoints are refused."""
+        scheduler = BatchScheduler(RecordingJobManager(), max_batch_size=10)
+        with pytest.raises(ValueError):
+            await scheduler.enqueue("job-1", "gemini")
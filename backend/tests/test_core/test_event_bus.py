@@ -0,0 +1,173 @@
+"""
+Unit tests for the event bus backends
+"""
+
+import asyncio
+
+import pytest
+
+from src.api.websocket.manager import WebSocketManager
+from src.core.event_bus import (
+    JOB_EVENTS_CHANNEL, EventBus, InMemoryEventBus, RedisEventBus, SQLiteEventBus,
+    create_event_bus
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+
+
+class TestInMemoryEventBus:
+    """Test the single-process default."""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_subscribers(self):
+        """Every subscriber of a channel receives each message."""
+        bus = InMemoryEventBus()
+        first, second = Recorder(), Recorder()
+        await bus.subscribe("jobs", first)
+        await bus.subscribe("jobs", second)
+        await bus.subscribe("other", Recorder())
+
+        await bus.publish("jobs", {"job_id": "job"})
+
+        assert first.messages == second.messages == [{"job_id": "job"}]
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_isolated(self):
+        """A failing subscriber doesn't block the others."""
+        bus = InMemoryEventBus()
+        recorder = Recorder()
+
+        async def broken(message):
+            raise RuntimeError("boom")
+
+        await bus.subscribe("jobs", broken)
+        await bus.subscribe("jobs", recorder)
+        await bus.publish("jobs", {"n": 1})
+
+        assert recorder.messages == [{"n": 1}]
+
+
+class TestSQLiteEventBus:
+    """Test the cross-process SQLite backend."""
+
+    @pytest.mark.asyncio
+    async def test_delivery_between_bus_instances(self, tmp_path):
+        """Events published by one process-local bus reach another, in order."""
+        path = str(tmp_path / "events.db")
+        await SQLiteEventBus(path).publish("jobs", {"n": "before subscribe"})
+
+        subscriber = SQLiteEventBus(path, poll_interval=0.01)
+        publisher = SQLiteEventBus(path)
+        recorder = Recorder()
+        await subscriber.subscribe("jobs", recorder)
+
+        for n in range(3):
+            await publisher.publish("jobs", {"n": n})
+        await publisher.publish("other", {"n": "ignored"})
+
+        for _ in range(100):
+            if len(recorder.messages) == 3:
+                break
+            await asyncio.sleep(0.01)
+        await subscriber.close()
+
+        assert recorder.messages == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+class FakePubSub:
+    """Pub/sub connection that yields scripted items, then fails or idles."""
+
+    def __init__(self, items, fail):
+        self.items = items
+        self.fail = fail
+        self.channels = []
+
+    async def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    async def listen(self):
+        for item in self.items:
+            yield item
+        if self.fail:
+            raise ConnectionError("Connection reset by peer")
+        await asyncio.Event().wait()
+
+    async def close(self):
+        pass
+
+
+class FakeRedis:
+    """Client handing out one scripted pub/sub connection per (re)connect."""
+
+    def __init__(self, *connections):
+        self.connections = list(connections)
+
+    def pubsub(self):
+        return self.connections.pop(0)
+
+
+def redis_message(data):
+    return {"type": "message", "channel": b"blogtube:jobs", "data": data}
+
+
+class TestRedisEventBus:
+    """Test the Redis reader's recovery from bad input and dropped connections."""
+
+    @pytest.mark.asyncio
+    async def test_reader_skips_bad_messages_and_resubscribes(self, monkeypatch):
+        first = FakePubSub([redis_message("{not json"), redis_message('{"n": 1}')], fail=True)
+        second = FakePubSub([redis_message('{"n": 2}')], fail=False)
+        # Skip __init__, which needs the redis package and a server
+        bus = RedisEventBus.__new__(RedisEventBus)
+        EventBus.__init__(bus)
+        bus.client, bus.prefix = FakeRedis(first, second), "blogtube:"
+        bus._pubsub = bus._reader = None
+        monkeypatch.setattr(RedisEventBus, "RECONNECT_MIN_DELAY", 0)
+        recorder = Recorder()
+
+        await bus.subscribe("jobs", recorder)
+        for _ in range(100):
+            if len(recorder.messages) == 2:
+                break
+            await asyncio.sleep(0.01)
+        bus._reader.cancel()
+
+        assert recorder.messages == [{"n": 1}, {"n": 2}]
+        assert second.channels == ["blogtube:jobs"]
+
+
+class TestWebSocketManagerBus:
+    """Test WebSocket delivery through the bus."""
+
+    @pytest.mark.asyncio
+    async def test_bus_events_broadcast_to_job(self):
+        """Job events on the bus are broadcast to the job's local subscribers."""
+        bus = InMemoryEventBus()
+        manager = WebSocketManager()
+        broadcasts = []
+
+        async def broadcast_to_job(job_id, message, frame=None):
+            broadcasts.append((job_id, message["type"]))
+            return 1
+
+        manager.broadcast_to_job = broadcast_to_job
+        await manager.attach_event_bus(bus)
+        await manager.attach_event_bus(bus)
+
+        await bus.publish(JOB_EVENTS_CHANNEL, {"type": "job_update", "job_id": "job"})
+
+        assert broadcasts == [("job", "job_update")]
+
+
+def test_create_event_bus(tmp_path):
+    """Backends are chosen from the URL scheme."""
+    assert isinstance(create_event_bus("memory://"), InMemoryEventBus)
+    assert isinstance(create_event_bus(f"sqlite:///{tmp_path}/events.db"), SQLiteEventBus)
+    with pytest.raises(ValueError):
+        create_event_bus("kafka://localhost")
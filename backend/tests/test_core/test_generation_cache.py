@@ -0,0 +1,84 @@
+"""
+Unit tests for the generation result cache
+"""
+
+import pytest
+
+from src.core.generation_cache import GenerationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Generation cache backed by a temporary directory."""
+    return GenerationCache(cache_dir=str(tmp_path / "generations"), max_size_bytes=10_000)
+
+
+class TestCacheKey:
+    """Test content-addressed key construction."""
+
+    def test_same_inputs_same_key(self):
+        """Identical prompt and params produce the same key."""
+        params = {"model": "gpt-4.1", "max_tokens": 2000, "temperature": 0.7}
+        assert GenerationCache.make_key("prompt", params) == GenerationCache.make_key("prompt", dict(params))
+
+    def test_param_change_changes_key(self):
+        """Changing any sampling parameter produces a different key."""
+        base = {"model": "gpt-4.1", "max_tokens": 2000, "temperature": 0.7}
+        changed = dict(base, temperature=0.2)
+        assert GenerationCache.make_key("prompt", base) != GenerationCache.make_key("prompt", changed)
+
+    def test_prompt_change_changes_key(self):
+        """Changing the rendered prompt produces a different key."""
+        params = {"model": "gpt-4.1"}
+        assert GenerationCache.make_key("a", params) != GenerationCache.make_key("b", params)
+
+
+class TestGenerationCache:
+    """Test cache storage, persistence and eviction."""
+
+    def test_miss_then_hit(self, cache):
+        """A stored entry is returned on subsequent lookups."""
+        assert cache.get("abc") is None
+        cache.set("abc", "Generated blog")
+        assert cache.get("abc") == "Generated blog"
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Entries survive a process restart."""
+        cache_dir = str(tmp_path / "generations")
+        GenerationCache(cache_dir=cache_dir).set("abc", "Persisted blog")
+
+        reloaded = GenerationCache(cache_dir=cache_dir)
+        assert reloaded.get("abc") == "Persisted blog"
+
+    def test_evicts_least_recently_used(self, cache):
+        """Oldest untouched entries are evicted when over the size bound."""
+        content = "x" * 3000
+        cache.set("first", content)
+        cache.set("second", content)
+        cache.get("first")  # first is now more recent than second
+        cache.set("third", content)
+        cache.set("fourth", content)
+
+        assert cache.get("second") is None
+        assert cache.get("first") == content
+        assert cache.get_stats()["size_bytes"] <= cache.max_size_bytes
+        assert cache.get_stats()["evictions"] >= 1
+
+    def test_oversized_entry_not_cached(self, cache):
+        """Entries larger than the whole cache are skipped."""
+        cache.set("huge", "x" * 20_000)
+        assert cache.get("huge") is None
+
+    def test_delete_and_clear(self, cache):
+        """Entries can be removed individually or all at once."""
+        cache.set("a", "one")
+        cache.set("b", "two")
+
+        assert cache.delete("a") is True
+        assert cache.delete("a") is False
+        assert cache.clear() == 1
+        assert cache.get_stats()["entries"] == 0
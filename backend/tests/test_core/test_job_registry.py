@@ -0,0 +1,93 @@
+"""
+Tests for the process-wide job registry
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import job_manager as job_manager_module
+from src.core.job_manager import JobManager
+from src.core.job_registry import JobRegistry
+from src.models.enums import JobStatus
+
+
+def make_job(job_id, status=JobStatus.PENDING):
+    return SimpleNamespace(id=job_id, status=status)
+
+
+class TestJobRegistry:
+    """LRU bounds for finished jobs, idle and size bounds for running ones."""
+
+    def test_finished_jobs_evicted_least_recently_used(self):
+        registry = JobRegistry(max_size=2)
+        for job_id in ("a", "b", "c"):
+            registry[job_id] = make_job(job_id, JobStatus.COMPLETED)
+
+        assert "a" not in registry
+        registry.get("b")
+        registry["d"] = make_job("d", JobStatus.FAILED)
+
+        assert "b" in registry and "c" not in registry
+        assert registry.get_stats()["evictions"] == 2
+
+    def test_running_jobs_pinned_until_finished(self):
+        registry = JobRegistry(max_size=1, max_active=10)
+        running = [make_job(f"run-{i}", JobStatus.GENERATING_BLOG) for i in range(5)]
+        for job in running:
+            registry[job.id] = job
+        registry["done"] = make_job("done", JobStatus.COMPLETED)
+        assert len(registry) == 6
+
+        # Finishing re-files the job; it pushes out the older finished one
+        running[0].status = JobStatus.COMPLETED
+        registry[running[0].id] = running[0]
+        assert "done" not in registry
+        assert registry.get_stats()["active"] == 4
+
+    def test_idle_unfinished_jobs_unpinned(self):
+        clock = SimpleNamespace(now=0.0)
+        registry = JobRegistry(max_size=10, max_active=2, active_ttl=60,
+                               clock=lambda: clock.now)
+        registry["stuck"] = make_job("stuck")
+        clock.now = 30
+        registry["queued"] = make_job("queued")
+        clock.now = 61
+        registry["running"] = make_job("running", JobStatus.GENERATING_BLOG)
+
+        # "stuck" went idle past the TTL; it stays cached but can be evicted
+        assert registry.get_stats()["active"] == 2
+        assert "stuck" in registry
+
+        registry["other"] = make_job("other")
+        assert registry.get_stats()["active"] == 2
+        assert registry.get_stats()["unpinned"] == 2
+
+    def test_misses_counted(self):
+        registry = JobRegistry()
+        assert registry.get("missing") is None
+        with pytest.raises(KeyError):
+            registry["missing"]
+        assert registry.get_stats()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_job_managers_share_registry(monkeypatch):
+    """An update through one manager is seen by every other manager."""
+    monkeypatch.setattr(job_manager_module, "get_job_registry", lambda registry=JobRegistry(): registry)
+    first, second = JobManager(), JobManager()
+    job = SimpleNamespace(id="job-1", status=JobStatus.VALIDATING, updated_at=datetime.now(),
+                          error_message=None, llm_provider="openai")
+    first.job_registry["job-1"] = job
+
+    async def record(*args, **kwargs):
+        pass
+
+    for manager in (first, second):
+        monkeypatch.setattr(manager.write_buffer, "put", record)
+        monkeypatch.setattr(manager.notification_service, "broadcast_job_update", record)
+
+    await first.update_job_status("job-1", JobStatus.FORMATTING)
+
+    assert (await second.get_job("job-1")).status == JobStatus.FORMATTING
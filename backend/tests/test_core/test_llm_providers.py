@@ -11,7 +11,7 @@ sys.modules['openai'] = MagicMock()
 sys.modules['anthropic'] = MagicMock()
 sys.modules['google.generativeai'] = MagicMock()
 
-from src.core.llm_providers import LLMProvider, OpenAIProvider, AzureOpenAIProvider, ClaudeProvider, GeminiProvider, LLMProviderFactory
+from src.core.llm_providers import LLMProvider, OpenAIProvider, AzureOpenAIProvider, ClaudeProvider, GeminiProvider, FakeProvider, LLMProviderFactory
 
 
 class TestLLMProvider:
@@ -44,6 +44,7 @@ class TestOpenAIProvider:
         provider = OpenAIProvider()
         assert provider.client is not None
     
+    @patch('src.core.llm_providers.openai', Mock())
     def test_missing_api_key(self):
         """Test error when API key is missing."""
         with patch.dict('os.environ', {}, clear=True):
@@ -96,12 +97,14 @@ class TestAzureOpenAIProvider:
         assert provider.client is not None
         assert provider.deployment_name == 'gpt-4-deployment'
     
+    @patch('src.core.llm_providers.openai', Mock())
     def test_missing_api_key(self):
         """Test error when API key is missing."""
         with patch.dict('os.environ', {}, clear=True):
             with pytest.raises(ValueError, match="AZURE_OPENAI_API_KEY"):
                 AzureOpenAIProvider()
     
+    @patch('src.core.llm_providers.openai', Mock())
     def test_missing_endpoint(self):
         """Test error when endpoint is missing."""
         with patch.dict('os.environ', {'AZURE_OPENAI_API_KEY': 'test-key'}, clear=True):
@@ -214,6 +217,56 @@ class TestGeminiProvider:
         assert result == "Gemini generated content"
 
 
+class TestFakeProvider:
+    """Test the offline fake provider."""
+    
+    def test_output_is_deterministic(self):
+        """Same prompt produces the same post across instances."""
+        prompt = FakeProvider(latency_ms=0).create_blog_prompt("transcript", "My Video", "url")
+        first = FakeProvider(latency_ms=0, seed=1).complete(prompt)
+        second = FakeProvider(latency_ms=0, seed=2).complete(prompt)
+        assert first == second
+        assert first.startswith("# My Video")
+        
+    def test_streaming_chunks(self):
+        """Streamed chunks respect the chunk size and rebuild the post."""
+        provider = FakeProvider(latency_ms=0, chunk_rate=0, chunk_size=10)
+        chunks = list(provider.stream("Video Title: Streamed"))
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 10 for chunk in chunks)
+        assert "".join(chunks) == FakeProvider.render("Video Title: Streamed")
+        
+    def test_failure_injection(self):
+        """Injected failures return None like real provider errors."""
+        provider = FakeProvider(latency_ms=0, failure_rate=1.0)
+        assert provider.complete("prompt") is None
+        assert provider.failures == 1
+        
+    def test_latency_distribution_seeded(self):
+        """Seeded latency samples are repeatable and non-negative."""
+        with patch.object(FakeProvider, '_instance_counter', iter(range(10))):
+            first = FakeProvider(latency_ms=100, latency_jitter_ms=50,
+                                 latency_distribution="lognormal", seed=7)
+        with patch.object(FakeProvider, '_instance_counter', iter(range(10))):
+            second = FakeProvider(latency_ms=100, latency_jitter_ms=50,
+                                  latency_distribution="lognormal", seed=7)
+        samples = [first.sample_latency() for _ in range(20)]
+        assert samples == [second.sample_latency() for _ in range(20)]
+        assert all(sample >= 0 for sample in samples)
+        
+    @patch.dict('os.environ', {'FAKE_LLM_FAILURE_RATE': '0.25', 'FAKE_LLM_LATENCY_MS': '5'})
+    def test_configured_from_environment(self):
+        """Settings are read from FAKE_LLM_* variables."""
+        provider = FakeProvider()
+        assert provider.failure_rate == 0.25
+        assert provider.latency_ms == 5
+        
+    def test_invalid_distribution(self):
+        """Unknown latency distributions are rejected."""
+        with pytest.raises(ValueError):
+            FakeProvider(latency_distribution="pareto")
+
+
 class TestLLMProviderFactory:
     """Test LLM provider factory."""
     
@@ -240,3 +293,15 @@ class TestLLMProviderFactory:
         """Test error for unsupported provider."""
         with pytest.raises(ValueError, match="Unsupported provider"):
             LLMProviderFactory.create_provider('unsupported')
+    
+    def test_create_fake_provider(self):
+        """Test creating the fake provider."""
+        provider = LLMProviderFactory.create_provider('fake')
+        assert isinstance(provider, FakeProvider)
+    
+    @patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
+    @patch('src.core.llm_providers.anthropic')
+    def test_provider_alias(self, mock_anthropic):
+        """Test API provider identifiers resolve to their implementation."""
+        provider = LLMProviderFactory.create_provider('anthropic')
+        assert isinstance(provider, ClaudeProvider)
@@ -0,0 +1,84 @@
+"""
+Unit tests for the record/replay layer
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.core.replay import ReplayMissError, ReplayStore, replayable
+
+
+calls = []
+
+
+@replayable("lookup", key_args=("video_id",))
+def lookup(video_id, token=None):
+    """Stand-in for a network call."""
+    calls.append(video_id)
+    if video_id == "missing":
+        raise Exception("Video is unavailable or private")
+    return {"video_id": video_id, "title": f"Title {video_id}"}
+
+
+@pytest.fixture
+def replay_env(tmp_path):
+    """Point the replay layer at a temporary cassette directory."""
+    calls.clear()
+
+    def set_mode(mode):
+        return patch.dict('os.environ', {
+            'YOUTUBE_REPLAY_MODE': mode,
+            'YOUTUBE_REPLAY_DIR': str(tmp_path),
+        })
+
+    return set_mode
+
+
+class TestReplay:
+    """Test recording and replaying calls."""
+
+    def test_off_passes_through(self, replay_env, tmp_path):
+        """With replay off, calls go straight to the function."""
+        with replay_env("off"):
+            assert lookup("abc")["title"] == "Title abc"
+        assert calls == ["abc"]
+        assert not any(tmp_path.iterdir())
+
+    def test_record_then_replay(self, replay_env):
+        """Recorded results are served without calling the function."""
+        with replay_env("record"):
+            recorded = lookup("abc", token="secret")
+        with replay_env("replay"):
+            replayed = lookup("abc", token="other")
+        assert replayed == recorded
+        assert calls == ["abc"]
+
+    def test_errors_replayed(self, replay_env):
+        """Recorded errors are raised again on replay."""
+        with replay_env("record"):
+            with pytest.raises(Exception):
+                lookup("missing")
+        with replay_env("replay"):
+            with pytest.raises(Exception, match="unavailable"):
+                lookup("missing")
+        assert calls == ["missing"]
+
+    def test_replay_miss(self, replay_env):
+        """Unrecorded calls fail loudly instead of hitting the network."""
+        with replay_env("replay"):
+            with pytest.raises(ReplayMissError):
+                lookup("never-recorded")
+        assert calls == []
+
+    def test_credentials_not_recorded(self, replay_env, tmp_path):
+        """Only key arguments are written to cassettes."""
+        with replay_env("record"):
+            lookup("abc", token="secret")
+        recordings = list(tmp_path.glob("lookup/*.json"))
+        assert len(recordings) == 1
+        assert "secret" not in recordings[0].read_text()
+
+    def test_invalid_mode(self):
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            ReplayStore(mode="rewind")
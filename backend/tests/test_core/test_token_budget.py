@@ -0,0 +1,138 @@
+"""
+Unit tests for token estimation and prompt budget planning
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.core import token_budget
+from src.core.llm_providers import LLMProvider
+from src.core.token_budget import (
+    count_tokens, get_model_limits, plan_prompt_budget,
+    split_into_chunks, truncate_to_tokens
+)
+
+
+class StubProvider(LLMProvider):
+    """Provider stub with a configurable model."""
+
+    provider_family = "anthropic"
+
+    def __init__(self, model_name="claude-3-sonnet-20240229", max_tokens=2000):
+        self.model_name = model_name
+        self.max_tokens = max_tokens
+
+    def complete(self, prompt):
+        return "content"
+
+
+@pytest.fixture(autouse=True)
+def heuristic_only():
+    """Force heuristic estimates so results don't depend on installed tokenizers."""
+    token_budget._get_encoding.cache_clear()
+    with patch.object(token_budget, "tiktoken", None):
+        yield
+    token_budget._get_encoding.cache_clear()
+
+
+def words(count):
+    """Generate a transcript of roughly `count` words."""
+    return " ".join(f"word{i % 50}." for i in range(count))
+
+
+class TestCountTokens:
+    """Test local token estimation."""
+
+    def test_empty_text(self):
+        """Empty text has no tokens."""
+        assert count_tokens("") == 0
+
+    def test_family_calibration(self):
+        """Families with denser tokenizers estimate more tokens."""
+        text = "a" * 700
+        assert count_tokens(text, "openai") == 175
+        assert count_tokens(text, "anthropic") == 200
+
+    def test_non_ascii_counted_conservatively(self):
+        """Non-Latin characters count as one token each."""
+        assert count_tokens("日本語", "openai") == 3
+
+
+class TestModelLimits:
+    """Test model limit lookup."""
+
+    def test_prefix_match_prefers_longest(self):
+        """gpt-4o is not mistaken for gpt-4."""
+        assert get_model_limits("gpt-4o-mini") == token_budget.MODEL_LIMITS["gpt-4o"]
+        assert get_model_limits("gpt-4") == token_budget.MODEL_LIMITS["gpt-4"]
+
+    def test_unknown_model(self):
+        """Unknown models fall back to conservative defaults."""
+        assert get_model_limits("mystery-model") == token_budget.DEFAULT_MODEL_LIMITS
+
+
+class TestTruncateAndSplit:
+    """Test truncation and chunking helpers."""
+
+    def test_truncate_fits_budget(self):
+        """Truncated text fits the budget and ends on a word boundary."""
+        text = words(2000)
+        truncated = truncate_to_tokens(text, 100, "openai")
+        assert count_tokens(truncated, "openai") <= 100
+        assert text.startswith(truncated)
+        assert not truncated.endswith(" ")
+
+    def test_split_covers_text(self):
+        """Chunks fit the budget and preserve all content in order."""
+        text = words(3000)
+        chunks = split_into_chunks(text, 500, "openai")
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk, "openai") <= 500 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_split_unpunctuated_captions(self):
+        """Captions without sentence punctuation are split on words."""
+        text = " ".join(["caption"] * 2000)
+        chunks = split_into_chunks(text, 200, "openai")
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk, "openai") <= 200 for chunk in chunks)
+
+
+class TestPlanPromptBudget:
+    """Test the prompt budget planner."""
+
+    def test_short_transcript_full(self):
+        """Short transcripts are sent whole with the requested output budget."""
+        plan = plan_prompt_budget(StubProvider(), words(500), "Title", "url")
+        assert plan["strategy"] == "full"
+        assert plan["max_output_tokens"] == 2000
+        assert plan["transcript_tokens"] == count_tokens(words(500), "anthropic")
+
+    def test_output_budget_shrinks_before_truncating(self):
+        """Output budget is reduced before any transcript is dropped."""
+        provider = StubProvider(model_name="gpt-4", max_tokens=4000)
+        plan = plan_prompt_budget(provider, words(2200), "Title", "url")
+        assert plan["strategy"] == "full"
+        assert token_budget.MIN_OUTPUT_TOKENS <= plan["max_output_tokens"] < 4000
+        assert plan["prompt_tokens"] + plan["max_output_tokens"] <= 8192
+
+    def test_slight_overflow_truncates(self):
+        """A slightly oversized transcript is truncated to fit."""
+        provider = StubProvider(model_name="gpt-4")
+        plan = plan_prompt_budget(provider, words(3000), "Title", "url")
+        assert plan["strategy"] == "truncate"
+        assert plan["prompt_tokens"] + plan["max_output_tokens"] <= 8192
+
+    def test_large_overflow_chunks(self):
+        """A far oversized transcript is split into chunks."""
+        provider = StubProvider(model_name="gpt-4")
+        plan = plan_prompt_budget(provider, words(20000), "Title", "url")
+        assert plan["strategy"] == "chunk"
+        assert plan["transcript"] is None
+        assert len(plan["chunks"]) > 1
+
+    def test_chunking_disabled_truncates(self):
+        """With chunking disabled, oversized transcripts are truncated."""
+        provider = StubProvider(model_name="gpt-4")
+        plan = plan_prompt_budget(provider, words(20000), "Title", "url", allow_chunking=False)
+        assert plan["strategy"] == "truncate"
@@ -0,0 +1,117 @@
+"""
+Unit tests for the transcript compressor
+"""
+
+import pytest
+
+from src.core.token_budget import count_tokens
+from src.core.transcript_compressor import (
+    compress_transcript, keyword_recall, remove_duplicate_lines,
+    score_sentences, split_sentences, strip_fillers
+)
+
+
+@pytest.fixture
+def caption_transcript():
+    """Auto-generated caption fixture, joined the way fetch_transcript joins it."""
+    with open('tests/test_core/data/auto_captions_transcript.txt', 'r', encoding='utf-8') as f:
+        return ' '.join(f.read().split())
+
+
+@pytest.fixture
+def article_transcript():
+    """Well-punctuated long-form text fixture."""
+    with open('tests/test_core/data/long_text_500word.md', 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class TestCleanup:
+    """Test lossless cleanup steps."""
+
+    def test_rolling_duplicates_collapsed(self):
+        """Caption lines that repeat the previous tail are collapsed."""
+        text = "welcome back to the back to the channel today we"
+        assert remove_duplicate_lines(text) == "welcome back to the channel today we"
+
+    def test_repeated_line_collapsed(self):
+        """A caption line emitted twice is kept once."""
+        text = "hello and welcome hello and welcome to the show"
+        assert remove_duplicate_lines(text) == "hello and welcome to the show"
+
+    def test_short_repeats_kept(self):
+        """Repeats shorter than a caption phrase are speech, not artifacts."""
+        text = "no, no, that is wrong. Stir, stir and stir again"
+        assert remove_duplicate_lines(text) == text
+
+    def test_strip_fillers(self):
+        """Hesitations and comma-delimited tics are removed."""
+        text = "Um, so the starter is, you know, really uh important."
+        assert strip_fillers(text) == "so the starter is really important."
+
+    def test_fillers_kept_inside_content(self):
+        """Words like 'kind of' are kept when they carry meaning."""
+        text = "This kind of bread needs a long proof."
+        assert strip_fillers(text) == text
+
+    def test_unpunctuated_text_windowed(self):
+        """Unpunctuated captions are split into fixed word windows."""
+        sentences = split_sentences(" ".join(["word"] * 100))
+        assert len(sentences) == 5
+
+
+class TestCompressTranscript:
+    """Test extractive compression and its quality/size trade-off."""
+
+    def test_invalid_ratio(self):
+        """Ratios outside (0, 1] are rejected."""
+        with pytest.raises(ValueError):
+            compress_transcript("text", 0)
+
+    def test_cleanup_only_keeps_content(self, caption_transcript):
+        """At ratio 1.0 captions shrink from cleanup alone without losing keywords."""
+        result = compress_transcript(caption_transcript, 1.0)
+        assert result["compressed_tokens"] < 0.7 * result["original_tokens"]
+        assert keyword_recall(caption_transcript, result["transcript"]) == 1.0
+        assert "[Music]" not in result["transcript"]
+
+    @pytest.mark.parametrize("ratio,min_recall", [(0.5, 0.9), (0.3, 0.8)])
+    def test_captions_quality_vs_size(self, caption_transcript, ratio, min_recall):
+        """Caption fixtures meet the token target while keeping most keywords."""
+        result = compress_transcript(caption_transcript, ratio)
+        assert result["compressed_tokens"] <= ratio * result["original_tokens"]
+        assert keyword_recall(caption_transcript, result["transcript"]) >= min_recall
+
+    def test_article_quality_vs_size(self, article_transcript):
+        """Punctuated text keeps whole sentences in their original order."""
+        result = compress_transcript(article_transcript, 0.5)
+        assert result["compressed_tokens"] <= 0.5 * result["original_tokens"]
+        assert keyword_recall(article_transcript, result["transcript"]) >= 0.7
+        assert 0 < result["sentences_kept"] < result["sentences_total"]
+
+        sentences = split_sentences(result["transcript"])
+        positions = [article_transcript.find(sentence) for sentence in sentences]
+        assert positions == sorted(positions)
+
+    def test_fillers_only_stripped_in_english(self):
+        """English filler words can be real words in other languages."""
+        text = "Er sagt, er kommt morgen. Ich glaube, er hat recht."
+        assert compress_transcript(text, 1.0, language="de")["transcript"] == text
+        assert "er kommt" not in compress_transcript(text, 1.0, language="en-US")["transcript"]
+
+    def test_short_transcript_keeps_best_sentence(self):
+        """A ratio too low for any whole sentence still keeps one."""
+        result = compress_transcript("tiny words here now.", 0.2)
+        assert result["transcript"] == "tiny words here now."
+        assert result["sentences_kept"] == 1
+
+    def test_scoring_scales_to_long_transcripts(self):
+        """Scoring does not build a sentence-by-sentence matrix."""
+        sentences = [f"Topic {n % 50} and detail {n} of the talk." for n in range(20000)]
+        scores = score_sentences(sentences)
+        assert scores.shape == (20000,)
+        assert abs(scores.sum() - 1.0) < 1e-3
+
+    def test_token_counts_match_family(self, caption_transcript):
+        """Reported sizes use the requested provider family's estimates."""
+        result = compress_transcript(caption_transcript, 0.5, family="openai")
+        assert result["original_tokens"] == count_tokens(caption_transcript, "openai")
@@ -0,0 +1,54 @@
+"""
+Tests for database engine profiles
+"""
+
+import pytest
+from sqlalchemy import text
+
+from src.database.connection import create_db_engine, engine_options
+from src.web.config import Settings
+
+
+async def read_pragmas(engine, *names):
+    async with engine.connect() as conn:
+        return {name: (await conn.execute(text(f"PRAGMA {name}"))).scalar() for name in names}
+
+
+class TestSqliteProfile:
+    """Connect-time PRAGMAs for SQLite."""
+
+    @pytest.mark.asyncio
+    async def test_production_profile(self, tmp_path):
+        settings = Settings(database_url=f"sqlite:///{tmp_path / 'app.db'}",
+                            sqlite_busy_timeout_ms=7000, sqlite_cache_size_mb=16)
+        engine = create_db_engine(settings)
+        try:
+            pragmas = await read_pragmas(engine, "journal_mode", "synchronous",
+                                         "busy_timeout", "cache_size")
+        finally:
+            await engine.dispose()
+
+        assert pragmas == {"journal_mode": "wal", "synchronous": 1,
+                           "busy_timeout": 7000, "cache_size": -16 * 1024}
+
+    @pytest.mark.asyncio
+    async def test_default_profile_leaves_sqlite_alone(self, tmp_path):
+        settings = Settings(database_url=f"sqlite:///{tmp_path / 'app.db'}",
+                            sqlite_profile="default")
+        engine = create_db_engine(settings)
+        try:
+            pragmas = await read_pragmas(engine, "journal_mode", "synchronous")
+        finally:
+            await engine.dispose()
+
+        assert pragmas == {"journal_mode": "delete", "synchronous": 2}
+
+
+def test_pool_sizing_only_for_server_databases():
+    settings = Settings(database_pool_size=25, database_max_overflow=5)
+
+    postgres = engine_options("postgresql+asyncpg://db/app", settings)
+    assert postgres["pool_size"] == 25
+    assert postgres["max_overflow"] == 5
+
+    assert "pool_size" not in engine_options("sqlite+aiosqlite:///app.db", settings)
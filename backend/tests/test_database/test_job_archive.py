@@ -0,0 +1,75 @@
+"""
+Tests for moving old finished jobs into the archive table
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from src.database import connection
+from src.database.models import ArchivedJob, Job, JobProgress
+from src.database.repositories.job_repository import JobRepository
+from src.models.enums import JobStatus
+from src.models.schemas import JobResponse
+
+STATUSES = ["completed", "failed", "cancelled", "generating_blog", "pending"]
+
+
+@pytest_asyncio.fixture
+async def jobs_database(temp_database):
+    """20 jobs a day apart, newest first by index, each with a progress row."""
+    now = datetime.now()
+    async with connection.async_session_maker() as session:
+        for i in range(20):
+            session.add(Job(id=f"job-{i:02d}", video_id="vid", video_url="https://youtu.be/x",
+                            language_code="en", llm_provider="openai",
+                            status=STATUSES[i % len(STATUSES)],
+                            created_at=now - timedelta(days=i)))
+            session.add(JobProgress(job_id=f"job-{i:02d}", step="validate_url", status="completed"))
+        await session.commit()
+    return now
+
+
+async def count(model):
+    async with connection.async_session_maker() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar()
+
+
+class TestJobArchive:
+    """Retention moves old finished jobs; history still sees them."""
+
+    @pytest.mark.asyncio
+    async def test_archives_old_terminal_jobs_in_batches(self, jobs_database):
+        repository = JobRepository()
+        archived = await repository.archive_jobs(jobs_database - timedelta(days=9, hours=12),
+                                                 batch_size=2)
+
+        # Days 10-19: 10 jobs, 6 of them finished
+        assert archived == 6
+        assert await count(ArchivedJob) == 6
+        assert await count(Job) == 14
+        assert await count(JobProgress) == 14
+
+        remaining = await repository.list_jobs(limit=100)
+        old = [job for job in remaining if job.created_at < jobs_database - timedelta(days=10)]
+        assert {job.status for job in old} == {"generating_blog", "pending"}
+
+        archived_job = await repository.get_archived("job-10")
+        assert archived_job.status == "completed"
+        assert archived_job.archived_at is not None
+
+    @pytest.mark.asyncio
+    async def test_history_spans_hot_and_archived(self, jobs_database):
+        repository = JobRepository()
+        before = [job.id for job in await repository.list_jobs(limit=100)]
+        await repository.archive_jobs(jobs_database - timedelta(days=5))
+
+        merged = await repository.list_jobs(limit=100, include_archived=True)
+        assert [job.id for job in merged] == before
+
+        page = await repository.list_jobs(JobStatus.COMPLETED, limit=2, include_archived=True,
+                                          after=(jobs_database - timedelta(days=1), "job-01"))
+        assert [job.id for job in page] == ["job-05", "job-10"]
+        assert JobResponse.model_validate(page[1]).status == JobStatus.COMPLETED
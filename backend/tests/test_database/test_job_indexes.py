@@ -0,0 +1,176 @@
+"""
+Query plan tests for the jobs table indexes on a 1M-row database
+"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event
+
+from src.database.repositories.job_repository import JobRepository
+from src.models.enums import JobStatus
+from src.services.job_service import JobService, decode_cursor, list_columns
+
+BACKEND_DIR = Path(__file__).parent.parent.parent
+ROWS = 1_000_000
+
+
+def alembic_config(database_url: str) -> Config:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    config.attributes["database_url"] = database_url
+    config.attributes["configure_logger"] = False
+    return config
+
+
+@pytest.fixture(scope="module")
+def jobs_db(tmp_path_factory):
+    """Migrated database holding 1M jobs, mostly completed, over three providers."""
+    path = tmp_path_factory.mktemp("indexes") / "jobs.db"
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        config = alembic_config(f"sqlite:///{path}")
+        config.attributes["connection"] = conn
+        command.upgrade(config, "head")
+    engine.dispose()
+
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"""
+            WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < {ROWS})
+            INSERT INTO jobs (id, video_id, video_url, language_code, llm_provider,
+                              status, priority, created_at)
+            SELECT printf('job-%07d', x), printf('vid-%06d', x % 200000),
+                   'https://youtu.be/x', 'en',
+                   CASE x % 3 WHEN 0 THEN 'openai' WHEN 1 THEN 'claude' ELSE 'gemini' END,
+                   CASE WHEN x % 500 = 0 THEN 'pending'
+                        WHEN x % 500 = 1 THEN 'generating_blog'
+                        WHEN x % 50 = 2 THEN 'failed'
+                        ELSE 'completed' END,
+                   x % 2,
+                   datetime('2024-01-01', '+' || x || ' seconds') || '.000000'
+            FROM n
+        """)
+    # No ANALYZE: the app never gathers statistics, so the planner works
+    # from index shape alone, as it does in production
+    return path
+
+
+@pytest_asyncio.fixture
+async def captured_queries(jobs_db, use_database):
+    """Point the repositories at the fixture database and record their SQL."""
+    engine = use_database(jobs_db)
+    queries = []
+    event.listen(engine.sync_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, context, executemany:
+                 queries.append((statement, parameters)))
+    return queries
+
+
+def query_plan(path, statement, parameters) -> str:
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+class TestJobIndexes:
+    """Hot job queries are answered from indexes, not table scans or sorts."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_status(self, jobs_db, captured_queries):
+        jobs = await JobRepository().get_by_status(JobStatus.FAILED, limit=50)
+        assert len(jobs) == 50
+
+        plan = query_plan(jobs_db, *captured_queries[-1])
+        assert "USING INDEX ix_jobs_status_priority_created_at" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_get_active_jobs(self, jobs_db, captured_queries):
+        jobs = await JobRepository().get_active_jobs()
+        assert len(jobs) == ROWS // 500 * 2
+
+        plan = query_plan(jobs_db, *captured_queries[-1])
+        assert "SEARCH jobs USING INDEX ix_jobs_status_" in plan
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_by_provider(self, jobs_db, captured_queries):
+        jobs = await JobRepository().get_jobs_by_provider("claude", limit=20)
+        assert [job.llm_provider for job in jobs] == ["claude"] * 20
+        assert jobs[0].created_at > jobs[-1].created_at
+
+        plan = query_plan(jobs_db, *captured_queries[-1])
+        assert "USING INDEX ix_jobs_llm_provider_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_video_lookup(self, jobs_db):
+        plan = query_plan(jobs_db, "SELECT id FROM jobs WHERE video_id = ?", ("vid-000042",))
+        assert "USING INDEX ix_jobs_video_id" in plan or "USING COVERING INDEX ix_jobs_video_id" in plan
+
+
+class TestKeysetPagination:
+    """Cursor pages are seeks on (created_at, id) indexes at any depth."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,provider,index", [
+        (None, None, "ix_jobs_created_at_id"),
+        (JobStatus.COMPLETED, None, "ix_jobs_status_created_at_id"),
+        (None, "gemini", "ix_jobs_llm_provider_created_at_id"),
+    ])
+    async def test_deep_page_uses_index(self, jobs_db, captured_queries, status, provider, index):
+        repository = JobRepository()
+        jobs = await repository.list_jobs(status, provider, limit=10,
+                                          after=(datetime(2024, 1, 6), "job-0500000"))
+        assert len(jobs) == 10
+        assert jobs[0].created_at <= datetime(2024, 1, 6)
+
+        plan = query_plan(jobs_db, *captured_queries[-1])
+        assert f"USING INDEX {index}" in plan
+        assert "TEMP B-TREE" not in plan
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_on_without_gaps(self, jobs_db, captured_queries):
+        """Walking pages with combined filters matches one big ordered query."""
+        service = JobService.__new__(JobService)
+        service.job_repository = JobRepository()
+
+        seen, cursor = [], None
+        for _ in range(3):
+            jobs, cursor = await service.get_jobs(JobStatus.FAILED, "claude", 25, cursor=cursor)
+            seen.extend(job.id for job in jobs)
+        expected = await service.job_repository.list_jobs(JobStatus.FAILED, "claude", limit=75)
+
+        assert seen == [job.id for job in expected]
+        assert decode_cursor(cursor)[1] == seen[-1]
+
+    def test_bad_cursor_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestJobProjection:
+    """List pages load only the summary columns plus requested fields."""
+
+    @pytest.mark.asyncio
+    async def test_summary_columns_only(self, jobs_db, captured_queries):
+        service = JobService.__new__(JobService)
+        service.job_repository = JobRepository()
+
+        jobs, cursor = await service.get_jobs(limit=50, columns=list_columns("error_message"))
+        assert len(jobs) == 50 and cursor
+        assert set(jobs[0]._fields) == set(list_columns()) | {"error_message"}
+
+        statement, parameters = captured_queries[-1]
+        assert "job_metadata" not in statement and "error_message" in statement
+
+        plan = query_plan(jobs_db, statement, parameters)
+        assert "USING INDEX ix_jobs_created_at_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError):
+            list_columns("id,password")
@@ -0,0 +1,93 @@
+"""
+Tests for running the Alembic migration chain
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database.connection import Base
+from src.database.migrations import upgrade_database
+
+HEAD = "0007"
+
+
+async def schema_state(engine):
+    """(alembic revision, differences between the database and the models)"""
+    def inspect_schema(connection):
+        version = connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+        return version, compare_metadata(MigrationContext.configure(connection), Base.metadata)
+
+    async with engine.connect() as conn:
+        return await conn.run_sync(inspect_schema)
+
+
+class TestUpgradeDatabase:
+    """upgrade_database() on new, legacy and partly migrated databases."""
+
+    @pytest.mark.asyncio
+    async def test_new_database(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        try:
+            await upgrade_database(engine)
+            assert await schema_state(engine) == (HEAD, [])
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_legacy_create_all_database_is_stamped(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            await upgrade_database(engine)
+            assert await schema_state(engine) == (HEAD, [])
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_backfill_fills_rollups_from_job_history(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+        old = datetime.now() - timedelta(days=75)
+        try:
+            await upgrade_database(engine, "0006")
+            async with engine.begin() as conn:
+                insert = ("INSERT INTO {table} (id, video_id, video_url, language_code, "
+                          "llm_provider, status, created_at, updated_at, completed_at, "
+                          "processing_time_seconds{extra}) VALUES (:id, 'vid', 'url', 'en', "
+                          ":provider, :status, :at, :at, :done, :seconds{extra_value})")
+                await conn.execute(text(insert.format(table="jobs", extra="", extra_value="")), [
+                    {"id": "job-1", "provider": "openai", "status": "completed",
+                     "at": datetime.now(), "done": datetime.now(), "seconds": 20},
+                    {"id": "job-2", "provider": "openai", "status": "failed",
+                     "at": datetime.now(), "done": None, "seconds": None},
+                ])
+                await conn.execute(text(insert.format(
+                    table="jobs_archive", extra=", archived_at", extra_value=", :at"
+                )), {"id": "job-0", "provider": "openai", "status": "completed",
+                     "at": old, "done": old, "seconds": 400})
+
+            await upgrade_database(engine)
+
+            async with engine.connect() as conn:
+                daily = (await conn.execute(text(
+                    "SELECT day, created_count, completed_count, failed_count, "
+                    "processing_seconds_total FROM job_daily_stats ORDER BY day"
+                ))).all()
+                histogram = (await conn.execute(text(
+                    "SELECT bucket_seconds, job_count FROM job_duration_histogram "
+                    "ORDER BY bucket_seconds"
+                ))).all()
+        finally:
+            await engine.dispose()
+
+        assert daily == [
+            (old.date().isoformat(), 1, 1, 0, 400),
+            (datetime.now().date().isoformat(), 2, 1, 1, 20),
+        ]
+        assert histogram == [(30, 1), (600, 1)]
@@ -0,0 +1,231 @@
+"""
+Tests for write-behind batching of job record updates and progress entries
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.database.models import Job
+from src.database.repositories.job_repository import JobRepository
+from src.database.repositories.progress_repository import JobProgressRepository
+from src.database.write_buffer import JobProgressRecorder, JobWriteBuffer, JobWriteError
+from src.models.enums import JobStatus, JobStep
+from src.services.job_service import JobService
+
+
+class RecordingRepository(JobRepository):
+    """Repository stand-in that records each batch instead of writing it."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+        self.fail = False
+        self.bad_ids = set()
+
+    async def update_many(self, jobs):
+        rows = list(jobs)
+        if self.fail or any(row["id"] in self.bad_ids for row in rows):
+            raise RuntimeError("database is locked")
+        self.batches.append(rows)
+        return len(rows)
+
+
+class RecordingProgressRepository(JobProgressRepository):
+    """Progress repository stand-in that records each batch."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    async def insert_many(self, rows):
+        self.batches.append(list(rows))
+        return len(self.batches[-1])
+
+
+def make_job(job_id, status=JobStatus.PENDING):
+    return SimpleNamespace(id=job_id, status=status, updated_at=datetime.now())
+
+
+class TestJobWriteBuffer:
+    """Coalescing and flush triggers."""
+
+    @pytest.mark.asyncio
+    async def test_updates_coalesce_per_job(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=0.01, max_pending=50)
+
+        for status in (JobStatus.VALIDATING, JobStatus.FETCHING_TRANSCRIPT,
+                       JobStatus.GENERATING_BLOG):
+            await buffer.put(make_job("job-1", status))
+        await buffer.put(make_job("job-2", JobStatus.VALIDATING))
+        assert repository.batches == []
+
+        await asyncio.sleep(0.05)
+        assert len(repository.batches) == 1
+        statuses = {row["id"]: row["status"] for row in repository.batches[0]}
+        assert statuses == {"job-1": "generating_blog", "job-2": "validating"}
+        assert buffer.get_stats()["updates"] == 4
+
+    @pytest.mark.asyncio
+    async def test_max_pending_triggers_flush(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=3)
+
+        for i in range(7):
+            await buffer.put(make_job(f"job-{i}"))
+
+        assert [len(batch) for batch in repository.batches] == [3, 3]
+        assert buffer.get_stats()["pending"] == 1
+
+        await buffer.shutdown()
+        assert [len(batch) for batch in repository.batches] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_terminal_flush_writes_before_returning(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=50)
+
+        await buffer.put(make_job("job-1", JobStatus.GENERATING_BLOG))
+        await buffer.put(make_job("job-2", JobStatus.COMPLETED), flush=True)
+
+        assert len(repository.batches) == 1
+        assert {row["id"] for row in repository.batches[0]} == {"job-1", "job-2"}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_newer_snapshot(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=50)
+
+        await buffer.put(make_job("job-1", JobStatus.VALIDATING))
+        repository.fail = True
+        assert await buffer.flush() == 0
+        await buffer.put(make_job("job-1", JobStatus.FORMATTING))
+
+        repository.fail = False
+        assert await buffer.flush() == 1
+        assert repository.batches[0][0]["status"] == "formatting"
+        assert buffer.get_stats()["failed_flushes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_block_others(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=50, max_attempts=2)
+        repository.bad_ids = {"job-bad"}
+
+        await buffer.put(make_job("job-bad"))
+        await buffer.put(make_job("job-1"))
+        assert await buffer.flush() == 1
+        assert [row["id"] for batch in repository.batches for row in batch] == ["job-1"]
+        assert set(buffer.pending) == {"job-bad"}
+
+        assert await buffer.flush() == 0
+        assert buffer.pending == {}
+        assert buffer.get_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_terminal_flush_raises(self):
+        repository = RecordingRepository()
+        buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=50)
+        repository.fail = True
+
+        with pytest.raises(JobWriteError):
+            await buffer.put(make_job("job-1", JobStatus.COMPLETED), flush=True)
+        assert "job-1" in buffer.pending
+
+
+class TestJobProgressRecorder:
+    """Step transitions become timed rows."""
+
+    @pytest.mark.asyncio
+    async def test_steps_written_when_finished(self):
+        repository = RecordingProgressRepository()
+        recorder = JobProgressRecorder(repository, flush_interval=3600, max_pending=50)
+
+        await recorder.step_started("job-1", "validate_url", "Validating...")
+        await recorder.step_started("job-1", "fetch_transcript", "Fetching...")
+        assert recorder.open_step("job-1")["step"] == "fetch_transcript"
+        assert repository.batches == []
+
+        await recorder.finish_job("job-1", "failed", "No transcript")
+
+        rows = repository.batches[0]
+        assert [(row["step"], row["status"]) for row in rows] == [
+            ("validate_url", "completed"), ("fetch_transcript", "failed")
+        ]
+        assert rows[1]["error_details"] == "No transcript"
+        assert all(row["details"]["duration_ms"] >= 0 for row in rows)
+        assert recorder.open_step("job-1") is None
+
+    @pytest.mark.asyncio
+    async def test_max_pending_triggers_flush(self):
+        repository = RecordingProgressRepository()
+        recorder = JobProgressRecorder(repository, flush_interval=3600, max_pending=2)
+
+        for step in ("validate_url", "detect_languages", "fetch_transcript"):
+            await recorder.step_started("job-1", step)
+
+        assert [len(batch) for batch in repository.batches] == [2]
+
+
+@pytest.mark.asyncio
+async def test_update_many_writes_one_transaction(temp_database):
+    """Batched rows land in the database with their latest values."""
+    repository = JobRepository()
+    for i in range(3):
+        await repository.create(Job(id=f"job-{i}", video_id="vid", video_url="https://youtu.be/x",
+                                    language_code="en", llm_provider="openai",
+                                    status=JobStatus.PENDING.value))
+
+    buffer = JobWriteBuffer(repository, flush_interval=3600, max_pending=50)
+    for i in range(3):
+        await buffer.put(make_job(f"job-{i}", JobStatus.GENERATING_BLOG))
+    await buffer.put(make_job("job-1", JobStatus.COMPLETED), flush=True)
+
+    assert buffer.get_stats()["flushes"] == 1
+    statuses = {job_id: (await repository.get_by_id(job_id)).status
+                for job_id in ("job-0", "job-1", "job-2")}
+    assert statuses == {"job-0": "generating_blog", "job-1": "completed",
+                        "job-2": "generating_blog"}
+
+
+@pytest.mark.asyncio
+async def test_update_many_skips_missing_jobs(temp_database):
+    """An archived or deleted job in the batch does not fail the others."""
+    repository = JobRepository()
+    await repository.create(Job(id="job-1", video_id="vid", video_url="https://youtu.be/x",
+                                language_code="en", llm_provider="openai",
+                                status=JobStatus.PENDING.value))
+
+    written = await repository.update_many([
+        {"id": "job-gone", "status": JobStatus.COMPLETED.value},
+        {"id": "job-1", "status": JobStatus.COMPLETED.value, "updated_at": datetime.now()},
+    ])
+
+    assert written == 1
+    assert (await repository.get_by_id("job-1")).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_progress_timeline(temp_database):
+    """A job's timeline is its recorded steps in order, then the running one."""
+    await JobRepository().create(Job(id="job-1", video_id="vid", video_url="https://youtu.be/x",
+                                     language_code="en", llm_provider="openai"))
+    recorder = JobProgressRecorder(JobProgressRepository(), flush_interval=3600, max_pending=50)
+    for step in (JobStep.VALIDATE_URL, JobStep.FETCH_TRANSCRIPT, JobStep.GENERATE_CONTENT):
+        await recorder.step_started("job-1", step.value)
+    await recorder.flush()
+
+    service = JobService.__new__(JobService)
+    service.progress_repository = JobProgressRepository()
+    service.job_manager = SimpleNamespace(progress_recorder=recorder)
+    timeline = await service.get_job_progress("job-1")
+
+    assert [(entry.step, entry.status) for entry in timeline] == [
+        (JobStep.VALIDATE_URL, "completed"),
+        (JobStep.FETCH_TRANSCRIPT, "completed"),
+        (JobStep.GENERATE_CONTENT, "running"),
+    ]
+    assert "duration_ms" in timeline[0].details
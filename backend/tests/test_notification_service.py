@@ -0,0 +1,117 @@
+"""
+Tests for notification coalescing in NotificationService
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.event_bus import JOB_EVENTS_CHANNEL, InMemoryEventBus
+from src.services.notification_service import NotificationService
+
+
+class RecordingWebSocketManager:
+    """Collects messages delivered over the event bus instead of sending them."""
+
+    def __init__(self):
+        self.messages = []
+        self.event_bus = None
+
+    async def attach_event_bus(self, event_bus):
+        if self.event_bus is not event_bus:
+            self.event_bus = event_bus
+            await event_bus.subscribe(JOB_EVENTS_CHANNEL, self.record)
+
+    async def record(self, message):
+        self.messages.append(message)
+
+
+def make_service(coalesce_window):
+    notification_service = NotificationService(coalesce_window=coalesce_window,
+                                               event_bus=InMemoryEventBus())
+    notification_service._websocket_manager = RecordingWebSocketManager()
+    return notification_service
+
+
+@pytest.fixture
+def service():
+    return make_service(0.05)
+
+
+def sent(service):
+    return service.websocket_manager.messages
+
+
+class TestProgressCoalescing:
+    """Test per-job coalescing of progress updates."""
+
+    @pytest.mark.asyncio
+    async def test_burst_bounded_latest_wins(self, service):
+        """A burst sends the first update now and only the latest one after the window."""
+        for step in range(100):
+            await service.broadcast_progress_update("job", {"step": step})
+
+        assert [message["data"]["step"] for message in sent(service)] == [0]
+
+        await asyncio.sleep(0.1)
+        assert [message["data"]["step"] for message in sent(service)] == [0, 99]
+        assert service.get_stats()["progress_coalesced"] == 98
+
+    @pytest.mark.asyncio
+    async def test_status_flushes_pending_progress_in_order(self, service):
+        """Status transitions are never coalesced and follow earlier progress."""
+        await service.broadcast_progress_update("job", {"step": "fetch_transcript"})
+        await service.broadcast_progress_update("job", {"step": "generate_content"})
+        await service.broadcast_job_update("job", {"status": "generating_blog"})
+        await service.broadcast_job_update("job", {"status": "formatting"})
+
+        assert [message["type"] for message in sent(service)] == [
+            "progress_update", "progress_update", "job_update", "job_update"
+        ]
+        assert sent(service)[1]["data"]["step"] == "generate_content"
+
+        # The pending flush was consumed, nothing more arrives later
+        await asyncio.sleep(0.1)
+        assert len(sent(service)) == 4
+
+    @pytest.mark.asyncio
+    async def test_jobs_coalesced_independently(self, service):
+        """One chatty job doesn't delay another job's first update."""
+        await service.broadcast_progress_update("job-a", {"step": 1})
+        await service.broadcast_progress_update("job-a", {"step": 2})
+        await service.broadcast_progress_update("job-b", {"step": 1})
+
+        assert [(message["job_id"], message["data"]["step"]) for message in sent(service)] == [
+            ("job-a", 1), ("job-b", 1)
+        ]
+        await asyncio.sleep(0.1)
+
+    @pytest.mark.asyncio
+    async def test_window_disabled(self):
+        """A zero window sends every update."""
+        service = make_service(0)
+        for step in range(5):
+            await service.broadcast_progress_update("job", {"step": step})
+        assert len(sent(service)) == 5
+
+
+class TestSequenceNumbers:
+    """Test per-job event sequencing."""
+
+    @pytest.mark.asyncio
+    async def test_sequences_per_job(self):
+        """Each job's events are numbered independently and keep counting after completion."""
+        service = make_service(0)
+        await service.broadcast_job_update("job-a", {"status": "validating"})
+        await service.broadcast_progress_update("job-a", {"step": 1})
+        await service.broadcast_job_update("job-b", {"status": "validating"})
+
+        assert [(message["job_id"], message["sequence"]) for message in sent(service)] == [
+            ("job-a", 1), ("job-a", 2), ("job-b", 1)
+        ]
+        assert service._sequences == {"job-a": 2, "job-b": 1}
+
+        # cancel_job and the task's CancelledError handler both report CANCELLED
+        await service.broadcast_job_update("job-a", {"status": "cancelled"})
+        await service.broadcast_job_update("job-a", {"status": "cancelled"})
+        assert [message["sequence"] for message in sent(service)[-2:]] == [3, 4]
@@ -0,0 +1,128 @@
+"""
+Tests for rollup-backed job statistics in StatsService
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import job_manager as job_manager_module
+from src.core.job_manager import JobManager
+from src.core.job_registry import JobRegistry
+from src.database.models import Job
+from src.database.repositories.job_repository import JobRepository
+from src.models.enums import JobStatus
+from src.services.stats_service import StatsService, histogram_percentiles
+
+
+def make_job(job_id, provider, status, seconds=None):
+    now = datetime.now()
+    return SimpleNamespace(
+        id=job_id, video_id="vid", video_url="https://youtu.be/x", language_code="en",
+        llm_provider=provider, status=status, created_at=now, updated_at=now,
+        completed_at=now if status == "completed" else None,
+        processing_time_seconds=seconds,
+    )
+
+
+JOBS = [
+    make_job("job-1", "openai", "completed", 4),
+    make_job("job-2", "openai", "completed", 40),
+    make_job("job-3", "openai", "failed"),
+    make_job("job-4", "anthropic", "completed", 700),
+    make_job("job-5", "anthropic", "cancelled"),
+    make_job("job-6", "anthropic", "pending"),
+]
+
+
+async def record_all(service):
+    for job in JOBS:
+        await service.record_job_created(job)
+        await service.record_job_finished(job)
+
+
+class TestStatsService:
+    """Counters, percentiles and throughput from the rollups."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_rollups(self, temp_database):
+        service = StatsService()
+        await record_all(service)
+
+        stats = await service.get_system_stats(active_jobs=1)
+
+        assert stats.total_jobs_today == 6
+        assert stats.jobs_by_status == {"completed": 3, "failed": 1, "cancelled": 1, "active": 1}
+        assert stats.average_processing_time == round((4 + 40 + 700) / 3, 2)
+        assert stats.processing_time_percentiles == {"p50": 45.0, "p90": 900.0, "p99": 900.0}
+        assert stats.provider_throughput["openai"]["completed"] == 2
+        assert stats.provider_throughput["openai"]["success_rate"] == round(2 / 3, 3)
+        assert stats.provider_throughput["anthropic"]["success_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, temp_database):
+        service = StatsService()
+        await record_all(service)
+        incremental = await service.get_system_stats()
+
+        repository = JobRepository()
+        for job in JOBS:
+            await repository.create(Job(**{
+                key: value for key, value in vars(job).items()
+                if key in Job.__table__.columns
+            }))
+        await service.rebuild(days=1)
+        rebuilt = await service.get_system_stats()
+
+        # completed_per_hour moves with the clock between the two reads
+        for stats in (incremental, rebuilt):
+            for throughput in stats.provider_throughput.values():
+                throughput.pop("completed_per_hour")
+        assert rebuilt.model_dump() == incremental.model_dump()
+
+    @pytest.mark.asyncio
+    async def test_provider_health_cached_between_reads(self, temp_database, monkeypatch):
+        service = StatsService()
+        checks = []
+        real_check = service.provider_service.check_provider_health
+
+        async def check(provider):
+            checks.append(provider)
+            return await real_check(provider)
+
+        monkeypatch.setattr(service.provider_service, "check_provider_health", check)
+        await service.get_system_stats()
+        first = len(checks)
+        await service.get_system_stats()
+
+        assert first > 0 and len(checks) == first
+
+    @pytest.mark.asyncio
+    async def test_repeated_terminal_status_counted_once(self, monkeypatch):
+        monkeypatch.setattr(job_manager_module, "get_job_registry", lambda registry=JobRegistry(): registry)
+        manager = JobManager()
+        manager.job_registry["job-1"] = make_job("job-1", "openai", JobStatus.GENERATING_BLOG)
+        finished = []
+
+        async def ignore(*args, **kwargs):
+            pass
+
+        async def record_finished(job):
+            finished.append(job.id)
+
+        monkeypatch.setattr(manager.write_buffer, "put", ignore)
+        monkeypatch.setattr(manager.progress_recorder, "finish_job", ignore)
+        monkeypatch.setattr(manager.notification_service, "broadcast_job_update", ignore)
+        monkeypatch.setattr(manager.stats_service, "record_job_finished", record_finished)
+
+        # cancel_job, then the task's CancelledError handler
+        await manager.update_job_status("job-1", JobStatus.CANCELLED)
+        await manager.update_job_status("job-1", JobStatus.CANCELLED)
+
+        assert finished == ["job-1"]
+
+    def test_histogram_percentiles(self):
+        histogram = [(5, 50), (30, 40), (300, 10)]
+        assert histogram_percentiles(histogram) == {"p50": 5.0, "p90": 30.0, "p99": 300.0}
+        assert histogram_percentiles([]) == {}
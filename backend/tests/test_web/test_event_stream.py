@@ -0,0 +1,80 @@
+"""
+Unit tests for the Server-Sent Events job stream
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api.websocket.event_stream import EventStream
+from src.api.websocket.manager import WebSocketManager
+
+
+def job_event(sequence, status="generating_blog"):
+    return {"type": "job_update", "job_id": "job", "sequence": sequence,
+            "data": {"status": status}}
+
+
+def parse(chunks):
+    """Split SSE chunks into (id, event, data) tuples, skipping the retry hint."""
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n"))
+        if "event" in fields:
+            events.append((fields.get("id"), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def collect(stream, manager, connection_id):
+    return [chunk async for chunk in stream.events(manager, connection_id)]
+
+
+class TestEventStream:
+    """Test SSE delivery through the WebSocket manager."""
+
+    @pytest.mark.asyncio
+    async def test_events_stream_until_terminal(self):
+        """Live events arrive with their sequence as id and the stream ends on completion."""
+        manager = WebSocketManager()
+        stream = EventStream()
+        connection_id = await manager.connect(stream, "job")
+        body = asyncio.create_task(collect(stream, manager, connection_id))
+
+        await manager._on_job_event(job_event(1))
+        await manager._on_job_event(job_event(2, "completed"))
+        events = parse(await asyncio.wait_for(body, 1))
+
+        assert [(event_id, event) for event_id, event, _ in events] == [
+            (None, "connected"), ("1", "job_update"), ("2", "job_update")
+        ]
+        assert manager.active_connections == {}
+
+    @pytest.mark.asyncio
+    async def test_last_event_id_resume(self):
+        """Reconnecting with a sequence replays only the missed events."""
+        manager = WebSocketManager()
+        for sequence in range(1, 4):
+            await manager._on_job_event(job_event(sequence))
+
+        stream = EventStream()
+        connection_id = await manager.connect(stream, "job", since=1)
+        body = asyncio.create_task(collect(stream, manager, connection_id))
+        await manager._on_job_event(job_event(4, "failed"))
+
+        events = parse(await asyncio.wait_for(body, 1))
+        assert [event_id for event_id, _, _ in events[1:]] == ["2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_client_leaving_disconnects(self):
+        """Cancelling the response body removes the subscription."""
+        manager = WebSocketManager()
+        stream = EventStream()
+        connection_id = await manager.connect(stream, "job")
+        body = asyncio.create_task(collect(stream, manager, connection_id))
+        await asyncio.sleep(0.01)
+
+        body.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await body
+        assert manager.topic_subscriptions == {}
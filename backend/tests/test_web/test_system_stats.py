@@ -0,0 +1,115 @@
+"""
+Unit tests for the shared /ws/system stats broadcaster
+"""
+
+import pytest
+
+from src.api.websocket.manager import WebSocketManager
+from src.api.websocket.system_stats import SystemStatsBroadcaster, diff_stats
+
+from tests.test_web.test_websocket_manager import FakeWebSocket, drain
+
+
+class CountingStats:
+    """Stats source that records how often it is computed."""
+
+    def __init__(self):
+        self.calls = 0
+        self.stats = {"active_jobs": 0, "can_accept_jobs": True,
+                      "websocket_stats": {"total_connections": 0}}
+
+    def __call__(self):
+        self.calls += 1
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in self.stats.items()}
+
+
+def test_diff_stats_nested():
+    """Only changed leaves are reported; removed keys become None."""
+    previous = {"a": 1, "b": {"x": 1, "y": 2}, "gone": 3}
+    current = {"a": 1, "b": {"x": 1, "y": 5}, "new": 4}
+    assert diff_stats(previous, current) == {"b": {"y": 5}, "new": 4, "gone": None}
+    assert diff_stats(current, current) == {}
+
+
+class TestSystemStatsBroadcaster:
+    """Test computing stats once and fanning out deltas."""
+
+    @pytest.mark.asyncio
+    async def test_one_computation_per_interval_for_all_subscribers(self):
+        """Many subscribers share one computation and one frame per update."""
+        stats = CountingStats()
+        manager = WebSocketManager()
+        broadcaster = SystemStatsBroadcaster(manager, interval=3600, stats_provider=stats)
+        sockets = [FakeWebSocket() for _ in range(20)]
+        for websocket in sockets:
+            await broadcaster.subscribe(websocket)
+        await drain()
+
+        assert stats.calls == 1
+        assert all(websocket.sent[0]["type"] == "system_stats" for websocket in sockets)
+
+        stats.stats["active_jobs"] = 2
+        assert await broadcaster.publish() == 20
+        await drain()
+
+        assert stats.calls == 2
+        assert all(websocket.sent[-1]["type"] == "system_stats_delta" for websocket in sockets)
+        assert sockets[0].sent[-1]["data"] == {"active_jobs": 2}
+        await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_stats_send_nothing(self):
+        """An interval with no changes sends no frame."""
+        stats = CountingStats()
+        manager = WebSocketManager()
+        broadcaster = SystemStatsBroadcaster(manager, interval=3600, stats_provider=stats)
+        websocket = FakeWebSocket()
+        await broadcaster.subscribe(websocket)
+
+        assert await broadcaster.publish() == 0
+        await drain()
+        assert len(websocket.sent) == 1
+        await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_without_subscribers(self):
+        """No stats are computed when nobody is listening."""
+        stats = CountingStats()
+        manager = WebSocketManager()
+        broadcaster = SystemStatsBroadcaster(manager, interval=3600, stats_provider=stats)
+        connection_id = await broadcaster.subscribe(FakeWebSocket())
+        await manager.disconnect(connection_id)
+
+        assert await broadcaster.publish() == 0
+        assert stats.calls == 1
+        assert broadcaster.snapshot is None
+        await broadcaster.stop()
+
+    @pytest.mark.asyncio
+    async def test_dropped_delta_resends_snapshot(self):
+        """A slow client that loses a delta ends up with the current stats."""
+        stats = CountingStats()
+        manager = WebSocketManager(queue_size=2)
+        broadcaster = SystemStatsBroadcaster(manager, interval=3600, stats_provider=stats)
+        websocket = FakeWebSocket(blocked=True)
+        await broadcaster.subscribe(websocket)
+        await drain()
+
+        for active_jobs in range(1, 5):
+            stats.stats["active_jobs"] = active_jobs
+            await broadcaster.publish()
+        assert manager.send_queues[next(iter(manager.system_subscribers))].dropped > 0
+
+        websocket.gate.set()
+        await drain()
+
+        client = {}
+        for message in websocket.sent:
+            if message["type"] == "system_stats":
+                client = message["data"]
+            else:
+                client.update(message["data"])
+        assert websocket.sent[-1]["type"] == "system_stats"
+        assert client == stats()
+        await broadcaster.stop()
@@ -0,0 +1,398 @@
+"""
+Unit tests for WebSocket fan-out and per-connection send queues
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api.websocket import manager as manager_module
+from src.api.websocket.manager import (
+    ConnectionQueue, ReplayBuffer, TimerWheel, WebSocketManager, coalesce_key,
+    encode_message
+)
+
+
+class FakeWebSocket:
+    """WebSocket stand-in whose sends can be held back to simulate a slow client."""
+
+    def __init__(self, blocked=False):
+        self.client = ("127.0.0.1", 0)
+        self.sent = []
+        self.closed = None
+        self.gate = asyncio.Event()
+        if not blocked:
+            self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def send_bytes(self, data):
+        await self.gate.wait()
+        self.sent.append(manager_module.msgpack.unpackb(data))
+
+    async def close(self, code=1000, reason=None):
+        self.closed = code
+
+
+async def drain():
+    """Let writer tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def progress(job_id, step):
+    return {"type": "progress_update", "job_id": job_id, "data": {"step": step}}
+
+
+def put(queue, message):
+    return queue.put(encode_message(message), coalesce_key(message))
+
+
+def queued(queue):
+    return [json.loads(frame) for _, frame in queue.messages]
+
+
+class TestConnectionQueue:
+    """Test queue coalescing and overflow policies."""
+
+    def test_progress_coalesced_latest_wins(self):
+        """Queued progress for a job is replaced by the newest update."""
+        queue = ConnectionQueue(maxsize=10)
+        put(queue, progress("job", 1))
+        put(queue, {"type": "job_update", "job_id": "job", "data": {"status": "formatting"}})
+        put(queue, progress("job", 2))
+
+        assert [message["type"] for message in queued(queue)] == ["job_update", "progress_update"]
+        assert queued(queue)[-1]["data"]["step"] == 2
+        assert queue.coalesced == 1
+
+    def test_overflow_drops_coalescable_first(self):
+        """A full queue sheds progress before status transitions."""
+        queue = ConnectionQueue(maxsize=2)
+        put(queue, {"type": "job_update", "job_id": "job", "data": {"status": "validating"}})
+        put(queue, progress("job", 1))
+        put(queue, {"type": "job_update", "job_id": "job", "data": {"status": "completed"}})
+
+        assert [message["type"] for message in queued(queue)] == ["job_update", "job_update"]
+        assert queue.dropped == 1
+
+    def test_disconnect_policy_refuses(self):
+        """With the disconnect policy a full queue rejects new messages."""
+        queue = ConnectionQueue(maxsize=1, overflow_policy="disconnect")
+        assert put(queue, {"type": "job_update"})
+        assert not put(queue, {"type": "job_update"})
+
+
+class TestWebSocketManager:
+    """Test non-blocking broadcast to subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others(self):
+        """Broadcast returns immediately and fast clients receive while a slow one is stuck."""
+        manager = WebSocketManager(queue_size=8)
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, "job")
+        await manager.connect(fast, "job")
+
+        for step in range(20):
+            sent = await asyncio.wait_for(manager.broadcast_to_job("job", progress("job", step)), 0.1)
+            assert sent == 2
+        await drain()
+
+        assert fast.sent[0]["type"] == "connected"
+        assert fast.sent[-1]["data"]["step"] == 19
+        assert slow.sent == []
+
+        stats = manager.get_connection_stats()["send_queues"]
+        assert 0 < stats["max_depth"] <= 8
+        assert stats["coalesced"] > 0
+
+        slow.gate.set()
+        await drain()
+        # The slow client skips straight to the latest progress
+        assert [message["type"] for message in slow.sent] == ["connected", "progress_update"]
+        assert slow.sent[-1]["data"]["step"] == 19
+
+    @pytest.mark.asyncio
+    async def test_overflowing_client_disconnected(self):
+        """Under the disconnect policy a client that falls behind is closed."""
+        manager = WebSocketManager(queue_size=2, overflow_policy="disconnect")
+        slow = FakeWebSocket(blocked=True)
+        await manager.connect(slow, "job")
+
+        for status in ["validating", "fetching_transcript", "generating_blog", "formatting"]:
+            await manager.broadcast_to_job("job", {"type": "job_update", "job_id": "job",
+                                                   "data": {"status": status}})
+        await drain()
+
+        assert slow.closed == 1013
+        assert manager.get_connection_stats()["total_connections"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        """Disconnecting cancels the writer and clears the queue."""
+        manager = WebSocketManager()
+        connection_id = await manager.connect(FakeWebSocket(), "job")
+        writer = manager.writer_tasks[connection_id]
+
+        await manager.disconnect(connection_id)
+        await drain()
+
+        assert writer.cancelled()
+        assert not await manager.send_to_connection(connection_id, {"type": "ping"})
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_once(self, monkeypatch):
+        """A broadcast serializes its message once for all subscribers."""
+        manager = WebSocketManager()
+        sockets = [FakeWebSocket() for _ in range(5)]
+        for websocket in sockets:
+            await manager.connect(websocket, "job")
+        await drain()
+
+        calls = []
+        original = manager_module.encode_message
+        monkeypatch.setattr(manager_module, "encode_message",
+                            lambda message, encoding="json": calls.append(encoding)
+                            or original(message, encoding))
+
+        assert await manager.broadcast_to_job("job", progress("job", 1)) == 5
+        await drain()
+
+        assert len(calls) == 1
+        assert all(websocket.sent[-1] == progress("job", 1) for websocket in sockets)
+
+    @pytest.mark.skipif(manager_module.msgpack is None, reason="msgpack not installed")
+    @pytest.mark.asyncio
+    async def test_msgpack_clients_share_binary_frame(self, monkeypatch):
+        """Mixed encodings are each serialized once per broadcast, replay included."""
+        manager = WebSocketManager()
+        await manager._on_job_event({"type": "job_update", "job_id": "job", "sequence": 1,
+                                     "data": {"status": "validating"}})
+        json_socket, binary_sockets = FakeWebSocket(), [FakeWebSocket() for _ in range(3)]
+        await manager.connect(json_socket, "job")
+        for websocket in binary_sockets:
+            await manager.connect(websocket, "job", since=0, encoding="msgpack")
+        await drain()
+
+        calls = []
+        original = manager_module.encode_message
+        monkeypatch.setattr(manager_module, "encode_message",
+                            lambda message, encoding="json": calls.append(encoding)
+                            or original(message, encoding))
+        await manager.broadcast_to_job("job", progress("job", 1))
+        await drain()
+
+        assert sorted(calls) == ["json", "msgpack"]
+        assert binary_sockets[0].sent[0]["encoding"] == "msgpack"
+        assert binary_sockets[0].sent[1]["data"] == {"status": "validating"}
+        assert all(websocket.sent[-1] == progress("job", 1)
+                   for websocket in [json_socket] + binary_sockets)
+
+    @pytest.mark.asyncio
+    async def test_unknown_encoding_falls_back_to_json(self):
+        """Unsupported encodings are reported back as json."""
+        manager = WebSocketManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "job", encoding="cbor")
+        await drain()
+        assert websocket.sent[0]["encoding"] == "json"
+
+
+class TestResumableStreams:
+    """Test sequence-based replay for reconnecting clients."""
+
+    async def publish(self, manager, count):
+        for sequence in range(1, count + 1):
+            await manager._on_job_event({"type": "job_update", "job_id": "job",
+                                         "sequence": sequence, "data": {"status": sequence}})
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_missed_events(self):
+        """A client reconnecting with `since` receives every event after it, in order."""
+        manager = WebSocketManager(replay_buffer_size=10)
+        await self.publish(manager, 5)
+
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "job", since=2)
+        await drain()
+
+        assert websocket.sent[0]["type"] == "connected"
+        assert websocket.sent[0]["sequence"] == 5
+        assert [message["sequence"] for message in websocket.sent[1:]] == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_evicted_events_reported_as_gap(self):
+        """Resuming from before the buffer starts signals a gap before replaying."""
+        manager = WebSocketManager(replay_buffer_size=3)
+        await self.publish(manager, 6)
+
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "job", since=1)
+        await drain()
+
+        assert websocket.sent[1]["type"] == "replay_gap"
+        assert websocket.sent[1]["oldest_sequence"] == 4
+        assert [message["sequence"] for message in websocket.sent[2:]] == [4, 5, 6]
+
+    def test_unknown_sequences_reported_as_gap(self):
+        """Resuming past what the buffer holds (e.g. after a restart) is a gap."""
+        buffer = ReplayBuffer(size=3)
+        assert buffer.since("job", 0) == (False, [])
+        assert buffer.since("job", 4) == (True, [])
+
+        buffer.append("job", 1, None, "{}")
+        assert buffer.since("job", 1) == (False, [])
+        assert buffer.since("job", 4) == (True, [])
+
+    def test_buffer_evicts_least_recent_job(self):
+        """The buffer tracks a bounded number of jobs."""
+        buffer = ReplayBuffer(size=2, max_jobs=2)
+        for job_id in ["a", "b", "a", "c"]:
+            buffer.append(job_id, buffer.latest_sequence(job_id) + 1, None, "{}")
+
+        assert list(buffer.events) == ["a", "c"]
+        assert buffer.latest_sequence("a") == 2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHeartbeat:
+    """Test timer-driven pings and idle reaping."""
+
+    def test_wheel_advance_visits_only_due_timers(self):
+        """Advancing returns exactly the expired keys and skips rescheduled ones."""
+        wheel = TimerWheel(tick=1.0, slots=64, now=0)
+        for index in range(10_000):
+            wheel.schedule(f"c{index}", 10 + index % 50)
+        wheel.schedule("c0", 100)  # moved; the old entry must not fire
+
+        expired = wheel.advance(10.5)
+        assert len(expired) == 199
+        assert "c0" not in expired
+        assert len(wheel) == 10_000 - 199
+        assert wheel.advance(10.9) == []
+
+    @pytest.mark.asyncio
+    async def test_idle_connections_pinged_then_reaped(self):
+        """Silent connections get a server ping, then close after their idle timeout."""
+        clock = FakeClock()
+        manager = WebSocketManager(heartbeat_interval=30, idle_timeout=90, clock=clock)
+        quiet, chatty = FakeWebSocket(), FakeWebSocket()
+        quiet_id = await manager.connect(quiet, "job")
+        chatty_id = await manager.connect(chatty, "job")
+
+        clock.now += 31
+        await manager.handle_message(chatty_id, json.dumps({"type": "pong"}))
+        assert await manager.reap_expired() == 0
+        await drain()
+        assert quiet.sent[-1]["type"] == "ping"
+        assert chatty.sent[-1]["type"] == "connected"
+
+        for _ in range(3):
+            clock.now += 30
+            await manager.handle_message(chatty_id, json.dumps({"type": "pong"}))
+            await manager.reap_expired()
+
+        assert quiet.closed == 1001
+        assert chatty.closed is None
+        assert list(manager.active_connections) == [chatty_id]
+
+    @pytest.mark.asyncio
+    async def test_reaping_10k_connections(self):
+        """With 10k connections, a sweep touches only those due and reaps the dead."""
+        clock = FakeClock()
+        manager = WebSocketManager(heartbeat_interval=30, idle_timeout=90, clock=clock)
+        ids = []
+        for index in range(10_000):
+            # Spread connects over ten seconds so deadlines are staggered
+            clock.now = 1000 + index * 0.001
+            ids.append(await manager.connect(FakeWebSocket(), f"job-{index % 100}",
+                                             idle_timeout=60 if index % 2 else None))
+
+        clock.now = 1000 + 30.5
+        assert await manager.reap_expired() == 0
+        assert 0 < manager.pings_sent < 10_000
+
+        clock.now = 1000 + 10 + 61
+        closed = await manager.reap_expired()
+        # Every connection with the 60s timeout is gone, none of the 90s ones
+        assert closed == 5_000
+        assert all(connection_id in manager.active_connections for connection_id in ids[::2])
+
+        clock.now = 1000 + 10 + 91
+        assert await manager.reap_expired() == 5_000
+        assert manager.get_connection_stats()["heartbeat"]["scheduled"] == 0
+
+
+class TestTopicSubscriptions:
+    """Test many jobs and topic filters on one connection."""
+
+    def job_update(self, job_id, status):
+        return {"type": "job_update", "job_id": job_id, "data": {"status": status}}
+
+    @pytest.mark.asyncio
+    async def test_one_connection_follows_many_jobs(self):
+        """A connection subscribed to several jobs receives each job's events."""
+        manager = WebSocketManager()
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, None, topics=[f"job:job-{index}" for index in range(30)])
+
+        for index in range(30):
+            assert await manager.broadcast_to_job(f"job-{index}", self.job_update(f"job-{index}", "formatting")) == 1
+        assert await manager.broadcast_to_job("other", self.job_update("other", "formatting")) == 0
+        await drain()
+
+        assert websocket.sent[0]["topics"][0] == "job:job-0"
+        assert len(websocket.sent) == 31
+
+    @pytest.mark.asyncio
+    async def test_status_topic_filters_progress(self):
+        """Status topics skip progress updates; overlapping topics deliver once."""
+        manager = WebSocketManager()
+        status_only, everything = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(status_only, None, topics=["status"])
+        await manager.connect(everything, "job", topics=["jobs", "status"])
+
+        await manager.broadcast_to_job("job", progress("job", 1))
+        await manager.broadcast_to_job("job", self.job_update("job", "completed"))
+        await drain()
+
+        assert [message["type"] for message in status_only.sent] == ["connected", "job_update"]
+        assert [message["type"] for message in everything.sent] == [
+            "connected", "progress_update", "job_update"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_messages_and_cleanup(self):
+        """Topics are added and removed by message and dropped on disconnect."""
+        manager = WebSocketManager()
+        websocket = FakeWebSocket()
+        connection_id = await manager.connect(websocket, "job-a")
+
+        await manager.handle_message(connection_id, json.dumps(
+            {"type": "subscribe", "topics": ["job:job-b", "bogus"]}
+        ))
+        await drain()
+        assert websocket.sent[-1]["type"] == "error"
+        assert manager.connection_topics[connection_id] == {"job:job-a", "job:job-b"}
+
+        await manager.handle_message(connection_id, json.dumps(
+            {"type": "unsubscribe", "topics": ["job:job-a"]}
+        ))
+        assert set(manager.topic_subscriptions) == {"job:job-b"}
+
+        await manager.disconnect(connection_id)
+        assert manager.topic_subscriptions == {}